@@ -20,22 +20,31 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import codecs
+import copy
+import functools
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import yaml
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.utils import json_io
+
 
 # C++ file extensions that are reviewable
-CPP_EXTENSIONS = {".cpp", ".h", ".inl", ".hpp", ".cc", ".cxx", ".hxx"}
+CPP_EXTENSIONS = frozenset({".cpp", ".h", ".inl", ".hpp", ".cc", ".cxx", ".hxx"})
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load and validate gate_config.yml.
 
+    Parsed configs are cached per file path and modification time, so
+    repeated loads skip YAML parsing.  Each call returns its own copy.
+
     Args:
         config_path: Path to the gate configuration YAML file.
 
@@ -50,11 +59,20 @@ def load_config(config_path: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
+    config = _load_config_cached(str(path.resolve()), path.stat().st_mtime_ns)
+    return copy.deepcopy(config)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse and validate a config file; keyed on mtime to notice edits."""
+    with open(resolved_path, "r", encoding="utf-8") as f:
         config = yaml.safe_load(f)
 
     if not isinstance(config, dict):
-        raise ValueError(f"Config file is empty or not a YAML mapping: {config_path}")
+        raise ValueError(
+            f"Config file is empty or not a YAML mapping: {resolved_path}"
+        )
 
     # Validate required keys
     required_keys = ["skip_patterns", "max_reviewable_files", "large_pr_labels"]
@@ -65,17 +83,31 @@ def load_config(config_path: str) -> Dict[str, Any]:
     return config
 
 
+# A quoted path made only of the escapes Git emits: C escapes and
+# three-digit octal bytes.
+_GIT_QUOTED_RE = re.compile(r'(?:[^\\]|\\(?:[0-3][0-7]{2}|[abfnrtv"\\]))*')
+
+# Any escape pair; used to keep stray backslashes literal.
+_ESCAPE_PAIR_RE = re.compile(r'\\(?:[0-3][0-7]{2}|[abfnrtv"\\])?')
+
+
+def _keep_stray_backslash(m: re.Match[str]) -> str:
+    return m.group(0) if len(m.group(0)) > 1 else "\\\\"
+
+
 def _decode_git_path(path: str) -> str:
     """Decode Git escape sequences in a path string.
 
     Git quotes paths containing non-ASCII or special characters. The regex
     already strips outer quotes, so this function always attempts to decode
-    octal escapes (``\\NNN``) and C escapes (``\\\\``, ``\\t``, ``\\n``).
+    octal escapes (``\\NNN``) and C escapes (``\\\\``, ``\\t``, ``\\n``, ...).
 
-    Octal escapes represent raw UTF-8 bytes, so consecutive sequences must
-    be collected into a bytearray and decoded together — converting each
-    byte individually via ``chr()`` would produce mojibake for multi-byte
-    characters like Korean (e.g. ``\\355\\225\\234`` → ``한``).
+    Octal escapes represent raw UTF-8 bytes, so the escaped text is
+    decoded to bytes first and then as UTF-8 — converting each byte
+    individually via ``chr()`` would produce mojibake for multi-byte
+    characters like Korean (e.g. ``\\355\\225\\234`` → ``한``).  The byte
+    decoding is done in C by ``codecs.escape_decode``.  A backslash that
+    does not start a Git escape is kept literally.
 
     Args:
         path: Path string, possibly containing escape sequences.
@@ -87,33 +119,10 @@ def _decode_git_path(path: str) -> str:
     if "\\" not in path:
         return path
 
-    # Handle standard C escapes first (use placeholder so \\\\ doesn't
-    # interfere with octal matching)
-    path = path.replace("\\\\", "\x00BACKSLASH\x00")
-    path = path.replace('\\"', '"')
-    path = path.replace("\\t", "\t").replace("\\n", "\n")
-
-    # Convert octal escapes to raw bytes, then decode as UTF-8.
-    parts: list[str] = []
-    pending_bytes = bytearray()
-    i = 0
-    while i < len(path):
-        m = re.match(r"\\([0-3][0-7]{2})", path[i:])
-        if m:
-            pending_bytes.append(int(m.group(1), 8))
-            i += len(m.group(0))
-        else:
-            if pending_bytes:
-                parts.append(pending_bytes.decode("utf-8", errors="replace"))
-                pending_bytes = bytearray()
-            parts.append(path[i])
-            i += 1
-    if pending_bytes:
-        parts.append(pending_bytes.decode("utf-8", errors="replace"))
-
-    path = "".join(parts)
-    path = path.replace("\x00BACKSLASH\x00", "\\")
-    return path
+    if not _GIT_QUOTED_RE.fullmatch(path):
+        path = _ESCAPE_PAIR_RE.sub(_keep_stray_backslash, path)
+    raw = codecs.escape_decode(path.encode("utf-8"))[0]
+    return raw.decode("utf-8", errors="replace")
 
 
 # --- Diff header parsing regexes ---
@@ -138,8 +147,69 @@ _BINARY_HEADER_RE = re.compile(r'^Binary files .+ and "?b/(.*?)"? differ$')
 # rename to <path>  (for rename-only diffs with 100% similarity, which lack +++ lines)
 _RENAME_TO_RE = re.compile(r'^rename to "?(.*?)"?$')
 
-# diff --git marker (only used to detect a new file section, not for path extraction)
-_DIFF_MARKER_RE = re.compile(r'^diff --git ')
+# First characters of the only header lines that can carry a path; every
+# other header line (index, ---, mode, similarity, ...) skips the regexes.
+_PATH_LINE_STARTS = frozenset("+Br")
+
+# diff --git marker (only used to detect a new file section, not for path
+# extraction).  Matched with its leading newline rather than ``^`` under
+# re.MULTILINE: a literal prefix lets the regex engine skip ahead with a
+# fast substring search instead of testing every position.
+_DIFF_MARKER_RE = re.compile(r'\ndiff --git ')
+_DIFF_MARKER_BYTES_RE = re.compile(rb'\ndiff --git ')
+
+
+def _header_spans(diff: Union[str, bytes]) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of each file section's header.
+
+    A header runs from its ``diff --git`` line up to the first ``@@`` hunk
+    marker (or the next section).  Sections are located with C-level
+    scans, so hunk bodies — the bulk of any diff — are never split into
+    lines.  Works on both ``str`` and ``bytes``.
+    """
+    if isinstance(diff, bytes):
+        marker_re, newline, hunk_marker = _DIFF_MARKER_BYTES_RE, b"\n", b"\n@@"
+    else:
+        marker_re, newline, hunk_marker = _DIFF_MARKER_RE, "\n", "\n@@"
+    # Prefixing a newline lets the marker match at offset 0; the match
+    # offset in the prefixed text is then exactly the offset of 'diff'.
+    starts = [m.start() for m in marker_re.finditer(newline + diff)]
+    ends = starts[1:] + [len(diff)]
+    for start, end in zip(starts, ends):
+        hunk = diff.find(hunk_marker, start, end)
+        yield start, hunk if hunk != -1 else end
+
+
+def _iter_diff_files(diff: Union[str, bytes]) -> Iterator[str]:
+    """Yield each changed file path in *diff* once, in order of appearance.
+
+    Shared by :func:`parse_diff_files`, :func:`parse_diff_files_bytes`
+    and :func:`run_gate_check`, which classifies paths as they are found
+    instead of collecting them first.  For ``bytes`` input only the header
+    slices are decoded (invalid UTF-8 is replaced).
+    """
+    seen = set()
+    for start, end in _header_spans(diff):
+        header = diff[start:end]
+        if isinstance(header, bytes):
+            header = header.decode("utf-8", errors="replace")
+
+        # Skip the 'diff --git' line itself; it is not used for paths.
+        for line in header.splitlines()[1:]:
+            if line[:1] not in _PATH_LINE_STARTS:
+                continue
+            # Primary: +++ b/path.  Fallbacks: binary files (they lack
+            # +++ lines) and rename-only diffs.
+            m = (
+                _PLUS_HEADER_RE.match(line)
+                or _BINARY_HEADER_RE.match(line)
+                or _RENAME_TO_RE.match(line)
+            )
+            if m:
+                filepath = _decode_git_path(m.group(1))
+                if filepath and filepath not in seen:
+                    seen.add(filepath)
+                    yield filepath
 
 
 def parse_diff_files(diff_text: str) -> List[str]:
@@ -161,96 +231,121 @@ def parse_diff_files(diff_text: str) -> List[str]:
     Returns:
         List of file paths (deduplicated, preserving order).
     """
-    files = []
-    seen = set()
-    in_header = False  # True between 'diff --git' and first '@@'
-
-    def _add(filepath: str) -> None:
-        filepath = _decode_git_path(filepath)
-        if filepath and filepath not in seen:
-            files.append(filepath)
-            seen.add(filepath)
-
-    for line in diff_text.splitlines():
-        # Track state: 'diff --git' starts a header, '@@' starts hunk body
-        if _DIFF_MARKER_RE.match(line):
-            in_header = True
-            continue
+    return list(_iter_diff_files(diff_text))
 
-        if line.startswith("@@"):
-            in_header = False
-            continue
 
-        # Primary: +++ b/path — only in header section
-        if in_header:
-            m = _PLUS_HEADER_RE.match(line)
-            if m:
-                _add(m.group(1))
-                continue
+def parse_diff_files_bytes(diff_bytes: bytes) -> List[str]:
+    """:func:`parse_diff_files` on a raw diff, decoding only the headers.
 
-        # Fallback for binary files (they lack +++ lines, always in header)
-        if in_header:
-            m = _BINARY_HEADER_RE.match(line)
-            if m:
-                _add(m.group(1))
-                continue
+    Hunk bodies are never decoded, which saves decoding and a full str
+    copy of large diffs.  Invalid UTF-8 in headers is replaced, as when
+    the CLI read diffs as text.
+
+    Args:
+        diff_bytes: The raw unified diff bytes.
+
+    Returns:
+        List of file paths (deduplicated, preserving order).
+    """
+    return list(_iter_diff_files(diff_bytes))
 
-        # Fallback for rename-only diffs (always in header)
-        if in_header:
-            m = _RENAME_TO_RE.match(line)
-            if m:
-                _add(m.group(1))
-                continue
 
-    return files
+def _path_suffix(filepath: str) -> str:
+    """Return the extension of a diff path, like ``PurePosixPath.suffix``.
+
+    String slicing avoids building a Path object per changed file.
+    Dotfiles (``.clang-format``) and names ending in a dot have no suffix.
+    """
+    name = filepath.rpartition("/")[2]
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_skip_patterns(
+    skip_patterns: Tuple[str, ...],
+) -> Tuple[Tuple[Tuple[str, re.Pattern], ...], Optional[re.Pattern]]:
+    """Compile skip_patterns individually and as one alternation.
+
+    Most changed files match no skip pattern, so a single search with the
+    combined regex rejects them without a Python-level loop over every
+    pattern.  Files that do match are re-checked pattern by pattern so
+    the reported reason is still the first matching pattern in config
+    order.  Memoized on the pattern tuple, so repeated gate checks with
+    the same config compile (and warn about invalid patterns) only once,
+    and every file skipped by a pattern shares one reason string.
+
+    Args:
+        skip_patterns: Regex patterns from gate_config.yml.
+
+    Returns:
+        Tuple of ((reason, compiled) pairs, combined regex).  The combined
+        regex is None when it cannot stand in for the individual patterns
+        (capture groups would renumber backreferences).
+    """
+    compiled_patterns = []
+    for pattern in skip_patterns:
+        try:
+            compiled_patterns.append((f"경로 필터: {pattern}", re.compile(pattern)))
+        except re.error as e:
+            print(f"Warning: Invalid skip pattern '{pattern}': {e}", file=sys.stderr)
+
+    compiled = tuple(compiled_patterns)
+    if not compiled or any(r.groups for _, r in compiled):
+        return compiled, None
+    try:
+        any_skip_re = re.compile(
+            "|".join(f"(?:{r.pattern})" for _, r in compiled)
+        )
+    except re.error:
+        # e.g. inline global flags, which are only valid at the start
+        return compiled, None
+    return compiled, any_skip_re
 
 
 def filter_files(
-    files: List[str],
+    files: Iterable[str],
     skip_patterns: List[str],
 ) -> Tuple[List[str], List[Dict[str, str]]]:
     """Separate files into reviewable and skipped based on skip_patterns and C++ extension.
 
     Args:
-        files: List of all changed file paths.
+        files: All changed file paths (any iterable; consumed once).
         skip_patterns: Regex patterns from gate_config.yml.
 
     Returns:
         Tuple of (reviewable_files, skipped_files).
         skipped_files contains dicts with 'file' and 'reason' keys.
     """
-    compiled_patterns = []
-    for pattern in skip_patterns:
-        try:
-            compiled_patterns.append((pattern, re.compile(pattern)))
-        except re.error as e:
-            print(f"Warning: Invalid skip pattern '{pattern}': {e}", file=sys.stderr)
+    compiled_patterns, any_skip_re = _compile_skip_patterns(tuple(skip_patterns))
+
+    non_cpp_reasons: Dict[str, str] = {}
 
     reviewable = []
     skipped = []
 
     for filepath in files:
-        # Check skip patterns first
-        skip_matched = False
-        for pattern_str, pattern_re in compiled_patterns:
-            if pattern_re.search(filepath):
-                skipped.append({
-                    "file": filepath,
-                    "reason": f"경로 필터: {pattern_str}",
-                })
-                skip_matched = True
-                break
-
-        if skip_matched:
-            continue
+        # Check skip patterns first (one combined search rules out most files)
+        if any_skip_re is None or any_skip_re.search(filepath):
+            reason = next(
+                (reason for reason, r in compiled_patterns if r.search(filepath)),
+                None,
+            )
+            if reason is not None:
+                skipped.append({"file": filepath, "reason": reason})
+                continue
 
         # Check C++ extension
-        ext = Path(filepath).suffix.lower()
+        ext = _path_suffix(filepath).lower()
         if ext not in CPP_EXTENSIONS:
-            skipped.append({
-                "file": filepath,
-                "reason": f"C++ 파일이 아님: {ext or '(확장자 없음)'}",
-            })
+            reason = non_cpp_reasons.get(ext)
+            if reason is None:
+                reason = non_cpp_reasons[ext] = (
+                    f"C++ 파일이 아님: {ext or '(확장자 없음)'}"
+                )
+            skipped.append({"file": filepath, "reason": reason})
             continue
 
         reviewable.append(filepath)
@@ -289,7 +384,7 @@ def classify_pr(
             f"임계값({max_reviewable_files})을 초과"
         )
 
-    matching_labels = set(labels) & set(large_pr_labels)
+    matching_labels = frozenset(labels).intersection(large_pr_labels)
     if matching_labels:
         is_large = True
         reasons.append(
@@ -322,14 +417,14 @@ def determine_allowed_stages(is_large: bool) -> Tuple[List[int], List[int]]:
 
 
 def run_gate_check(
-    diff_text: str,
+    diff_text: Union[str, bytes],
     config: Dict[str, Any],
     labels: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Execute the full gate check pipeline.
 
     Args:
-        diff_text: Raw unified diff text.
+        diff_text: Raw unified diff, as text or as undecoded bytes.
         config: Parsed gate configuration.
         labels: PR labels (empty list if not provided).
 
@@ -339,10 +434,10 @@ def run_gate_check(
     if labels is None:
         labels = []
 
-    # Step 1: Parse diff and filter files
-    all_files = parse_diff_files(diff_text)
+    # Step 1: Parse diff and filter files in one pass — each path is
+    # classified as soon as its header is parsed.
     reviewable_files, skipped_files = filter_files(
-        all_files, config["skip_patterns"]
+        _iter_diff_files(diff_text), config["skip_patterns"]
     )
 
     # Step 2: Classify PR size
@@ -361,7 +456,7 @@ def run_gate_check(
         "reasons": reasons,
         "allowed_stages": allowed_stages,
         "manual_allowed_stages": manual_allowed_stages,
-        "total_changed_files": len(all_files),
+        "total_changed_files": len(reviewable_files) + len(skipped_files),
         "reviewable_files": reviewable_files,
         "reviewable_count": len(reviewable_files),
         "skipped_files": skipped_files,
@@ -369,7 +464,8 @@ def run_gate_check(
     }
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point; returns the process exit code."""
     parser = argparse.ArgumentParser(
         description="Gate Checker — Large PR detection and file filtering"
     )
@@ -394,7 +490,7 @@ def main() -> None:
         help="Comma-separated PR labels",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Load config
     config = load_config(args.config)
@@ -403,9 +499,10 @@ def main() -> None:
     diff_path = Path(args.diff)
     if not diff_path.exists():
         print(f"Error: Diff file not found: {args.diff}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
-    diff_text = diff_path.read_text(encoding="utf-8", errors="replace")
+    # Only the file headers are needed, so skip decoding the hunk bodies.
+    diff_text = diff_path.read_bytes()
 
     # Parse labels
     labels = [l.strip() for l in args.labels.split(",") if l.strip()]
@@ -414,7 +511,7 @@ def main() -> None:
     result = run_gate_check(diff_text, config, labels)
 
     # Output
-    output_json = json.dumps(result, ensure_ascii=False, indent=2)
+    output_json = json_io.dumps_pretty(result)
 
     if args.output:
         output_path = Path(args.output)
@@ -424,8 +521,8 @@ def main() -> None:
         print(output_json)
 
     # Exit code: 0 for normal PR, 0 for large PR (not an error)
-    sys.exit(0)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -20,12 +20,15 @@ from __future__ import annotations
 
 import argparse
 import difflib
+import functools
 import json
 import shutil
 import subprocess
 import sys
+from itertools import compress, count
+from operator import ne
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, TextIO, Tuple
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -34,10 +37,23 @@ from scripts.utils.diff_parser import get_added_line_numbers, parse_diff
 # Maximum lines per suggestion block
 MAX_SUGGESTION_LINES = 20
 
+# Edit-distance cap for the Myers diff.  Its cost grows with the square of
+# the edit count while SequenceMatcher's stays roughly linear in the file
+# length, so Myers only wins for small edit counts; inputs estimated or
+# found to need more edits than this use difflib.SequenceMatcher.
+_MYERS_MAX_EDITS = 200
 
+# (tag, i1, i2, j1, j2) — same shape as SequenceMatcher.get_opcodes()
+Opcode = Tuple[str, int, int, int, int]
+
+
+@functools.cache
 def find_clang_format() -> Optional[str]:
     """Find clang-format executable.
 
+    The PATH lookup runs once per process; call
+    ``find_clang_format.cache_clear()`` after changing PATH.
+
     Returns:
         Path to clang-format executable, or None if not found.
     """
@@ -88,13 +104,151 @@ def run_clang_format(
         return None
 
 
+def _myers_matching_blocks(
+    a: Sequence[str],
+    b: Sequence[str],
+    max_edits: int,
+) -> Optional[List[Tuple[int, int, int]]]:
+    """Find a minimal set of matching blocks with Myers' O(ND) algorithm.
+
+    Greedy forward search that records the furthest-reaching x per
+    diagonal for each edit distance d, then backtracks through those
+    snapshots.  Near-linear when the edit distance D is small, which is
+    the usual case for clang-format output.
+
+    Args:
+        a: Original lines.
+        b: Formatted lines.
+        max_edits: Give up once the edit distance exceeds this.
+
+    Returns:
+        ``(i, j, size)`` blocks with ``a[i:i+size] == b[j:j+size]``, in
+        order, or None if the edit distance exceeds *max_edits*.
+    """
+    n, m = len(a), len(b)
+    max_d = min(n + m, max_edits)
+    off = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    # trace[d] holds v[k] for k in [-d-1, d+1] as it was before step d.
+    trace: List[List[int]] = []
+
+    for d in range(max_d + 1):
+        # Work on list indices (i = off + k) directly to keep the hot loop
+        # free of offset arithmetic.
+        lo = off - d
+        hi = off + d
+        trace.append(v[lo - 1 : hi + 2])
+        for i in range(lo, hi + 1, 2):
+            if i == lo:
+                x = v[i + 1]  # step down: insertion
+            elif i == hi:
+                x = v[i - 1] + 1  # step right: deletion
+            else:
+                x = v[i + 1]
+                right = v[i - 1] + 1
+                if right > x:
+                    x = right
+            y = x - i + off
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[i] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m)
+    return None
+
+
+def _myers_backtrack(
+    trace: List[List[int]], n: int, m: int
+) -> List[Tuple[int, int, int]]:
+    """Walk the Myers trace back from (n, m) and collect matching blocks."""
+    blocks: List[Tuple[int, int, int]] = []
+    x, y = n, m
+    for d in range(len(trace) - 1, 0, -1):
+        snap = trace[d]
+        base = d + 1  # snap index of diagonal k is k + d + 1
+        k = x - y
+        if k == -d or (k != d and snap[base + k - 1] < snap[base + k + 1]):
+            prev_k = k + 1  # reached by stepping down (insertion)
+            mid_x = snap[base + prev_k]
+        else:
+            prev_k = k - 1  # reached by stepping right (deletion)
+            mid_x = snap[base + prev_k] + 1
+        # Everything from the end of the edit up to (x, y) is a match.
+        if x > mid_x:
+            blocks.append((mid_x, mid_x - k, x - mid_x))
+        x = snap[base + prev_k]
+        y = x - prev_k
+    if x > 0:
+        # d == 0: a common prefix starting at (0, 0).
+        blocks.append((0, 0, x))
+    blocks.reverse()
+    return blocks
+
+
+def _min_edits(a: Sequence[str], b: Sequence[str]) -> int:
+    """Return a cheap lower bound on the edit distance between *a* and *b*.
+
+    Every line of *a* that appears nowhere in *b* must be deleted, and
+    every line of *b* that appears nowhere in *a* must be inserted.
+    """
+    in_a = set(a)
+    in_b = set(b)
+    return sum(line not in in_b for line in a) + sum(
+        line not in in_a for line in b
+    )
+
+
+def _diff_opcodes(a: Sequence[str], b: Sequence[str]) -> List[Opcode]:
+    """Return SequenceMatcher-style opcodes turning *a* into *b*.
+
+    Uses :func:`_myers_matching_blocks` when the edit distance is small.
+    Inputs whose :func:`_min_edits` bound already exceeds
+    ``_MYERS_MAX_EDITS`` go straight to difflib.SequenceMatcher, as do
+    those Myers gives up on once it passes the cap.
+    """
+    blocks = None
+    if _min_edits(a, b) <= _MYERS_MAX_EDITS:
+        blocks = _myers_matching_blocks(a, b, _MYERS_MAX_EDITS)
+    if blocks is None:
+        return difflib.SequenceMatcher(None, a, b).get_opcodes()
+
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for ai, bj, size in blocks + [(len(a), len(b), 0)]:
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        if size:
+            opcodes.append(("equal", ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+    return opcodes
+
+
+def _common_affixes(a: Sequence[str], b: Sequence[str]) -> Tuple[int, int]:
+    """Return the lengths of the common prefix and suffix of *a* and *b*.
+
+    The two never overlap: together they cover at most the shorter input.
+    """
+    limit = min(len(a), len(b))
+    # Index of the first mismatch, scanned with C-level iterators.
+    pre = next(compress(count(), map(ne, a, b)), limit)
+    suf = next(compress(count(), map(ne, reversed(a), reversed(b))), limit)
+    return pre, min(suf, limit - pre)
+
+
 def _compute_diff_regions(
     original_lines: List[str],
     formatted_lines: List[str],
 ) -> List[Dict[str, Any]]:
     """Compute regions where original and formatted content differ.
 
-    Uses difflib.SequenceMatcher to find contiguous blocks of changes.
+    Uses a Myers O(ND) diff (:func:`_diff_opcodes`) to find contiguous
+    blocks of changes.  Lines shared at the start and end of both files
+    are stripped first, so only the differing middle is diffed.
 
     Args:
         original_lines: Lines of the original file.
@@ -104,12 +258,23 @@ def _compute_diff_regions(
         List of dicts with 'start_line' (1-based), 'end_line' (1-based,
         inclusive), 'original' (list of lines), 'formatted' (list of lines).
     """
-    matcher = difflib.SequenceMatcher(None, original_lines, formatted_lines)
+    if original_lines == formatted_lines:
+        return []
+
     regions = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    pre, suf = _common_affixes(original_lines, formatted_lines)
+    opcodes = _diff_opcodes(
+        original_lines[pre : len(original_lines) - suf],
+        formatted_lines[pre : len(formatted_lines) - suf],
+    )
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == "equal":
             continue
+        i1 += pre
+        i2 += pre
+        j1 += pre
+        j2 += pre
 
         if tag == "insert":
             # Pure insertion (i1 == i2): no original lines to replace.
@@ -187,70 +352,45 @@ def _split_into_chunks(
     if len(orig) <= max_lines and len(fmt) <= max_lines:
         return [region]
 
-    chunks = []
-
     if len(orig) >= len(fmt):
         # Original is the longer (or equal) side — split greedily by
         # original lines and proportionally assign formatted lines.
-        start = 0
-        fmt_start = 0
-
-        while start < len(orig):
-            end = min(start + max_lines, len(orig))
-
-            # Proportionally split formatted lines
-            if len(orig) > 0:
-                fmt_end = int(len(fmt) * end / len(orig))
-            else:
-                fmt_end = len(fmt)
-
-            # Ensure we don't overshoot
-            if end == len(orig):
-                fmt_end = len(fmt)
-
-            chunks.append(
-                {
-                    "start_line": region["start_line"] + start,
-                    "end_line": region["start_line"] + end - 1,
-                    "original": orig[start:end],
-                    "formatted": fmt[fmt_start:fmt_end],
-                }
-            )
-
-            start = end
-            fmt_start = fmt_end
+        orig_bounds = list(range(0, len(orig), max_lines)) + [len(orig)]
+        fmt_bounds = [len(fmt) * end // len(orig) for end in orig_bounds[:-1]]
+        fmt_bounds.append(len(fmt))
     else:
         # Formatted is longer — split driven by formatted lines.
         # Cap the number of chunks at len(orig) so every chunk has at
         # least one original line for a valid GitHub line reference.
         n_chunks_by_fmt = (len(fmt) + max_lines - 1) // max_lines
         n_chunks = min(n_chunks_by_fmt, len(orig)) if orig else 1
+        orig_bounds = _even_bounds(len(orig), n_chunks)
+        fmt_bounds = _even_bounds(len(fmt), n_chunks)
+
+    # Both boundary lists are computed up front; each chunk is then a
+    # single slice per side.
+    start_line = region["start_line"]
+    return [
+        {
+            "start_line": start_line + o_start,
+            "end_line": start_line + o_end - 1,
+            "original": orig[o_start:o_end],
+            "formatted": fmt[f_start:f_end],
+        }
+        for o_start, o_end, f_start, f_end in zip(
+            orig_bounds, orig_bounds[1:], fmt_bounds, fmt_bounds[1:]
+        )
+    ]
 
-        orig_per = len(orig) // n_chunks
-        orig_rem = len(orig) % n_chunks
-        fmt_per = len(fmt) // n_chunks
-        fmt_rem = len(fmt) % n_chunks
-
-        orig_pos = 0
-        fmt_pos = 0
-
-        for i in range(n_chunks):
-            o_size = orig_per + (1 if i < orig_rem else 0)
-            f_size = fmt_per + (1 if i < fmt_rem else 0)
-
-            chunks.append(
-                {
-                    "start_line": region["start_line"] + orig_pos,
-                    "end_line": region["start_line"] + orig_pos + o_size - 1,
-                    "original": orig[orig_pos : orig_pos + o_size],
-                    "formatted": fmt[fmt_pos : fmt_pos + f_size],
-                }
-            )
 
-            orig_pos += o_size
-            fmt_pos += f_size
+def _even_bounds(total: int, n_chunks: int) -> List[int]:
+    """Split ``range(total)`` into *n_chunks* near-equal parts.
 
-    return chunks
+    Returns the ``n_chunks + 1`` boundary offsets; the first
+    ``total % n_chunks`` parts get one extra element.
+    """
+    per, rem = divmod(total, n_chunks)
+    return [i * per + min(i, rem) for i in range(n_chunks + 1)]
 
 
 def generate_format_suggestions(
@@ -271,30 +411,42 @@ def generate_format_suggestions(
         added_lines: Set of line numbers that are within the PR diff range.
 
     Returns:
-        List of suggestion/comment dicts.
+        List of suggestion/comment dicts.  Each carries a ``kind`` of
+        ``"insert"`` (clang-format adds lines) or ``"replace"``.
     """
     if original_content == formatted_content:
         return []
 
-    original_lines = original_content.splitlines(keepends=True)
-    formatted_lines = formatted_content.splitlines(keepends=True)
+    return _generate_format_suggestions_from_lines(
+        file_path,
+        original_content.splitlines(keepends=True),
+        formatted_content.splitlines(keepends=True),
+        added_lines,
+    )
+
 
+def _generate_format_suggestions_from_lines(
+    file_path: str,
+    original_lines: List[str],
+    formatted_lines: List[str],
+    added_lines: Set[int],
+) -> List[Dict[str, Any]]:
+    """:func:`generate_format_suggestions` on content already split into lines."""
     regions = _compute_diff_regions(original_lines, formatted_lines)
     suggestions = []
 
     for region in regions:
+        kind = "insert" if region.get("is_insert") else "replace"
         chunks = _split_into_chunks(region)
 
         for chunk in chunks:
             # Check if all lines in this chunk are within the PR diff range
-            chunk_lines = set(
-                range(chunk["start_line"], chunk["end_line"] + 1)
-            )
-            lines_in_diff = chunk_lines & added_lines
+            chunk_lines = range(chunk["start_line"], chunk["end_line"] + 1)
+            lines_in_diff = [ln for ln in chunk_lines if ln in added_lines]
 
             formatted_text = "".join(chunk["formatted"]).rstrip("\n")
 
-            if lines_in_diff == chunk_lines:
+            if len(lines_in_diff) == len(chunk_lines):
                 # All lines are in diff range → suggestion
                 suggestions.append(
                     {
@@ -302,6 +454,7 @@ def generate_format_suggestions(
                         "line": chunk["start_line"],
                         "end_line": chunk["end_line"],
                         "rule_id": "clang_format",
+                        "kind": kind,
                         "severity": "suggestion",
                         "message": "clang-format 자동 수정 제안",
                         "suggestion": formatted_text,
@@ -309,13 +462,14 @@ def generate_format_suggestions(
                 )
             elif lines_in_diff:
                 # Partial overlap → comment on the first in-diff line
-                first_in_diff = min(lines_in_diff)
+                first_in_diff = lines_in_diff[0]
                 suggestions.append(
                     {
                         "file": file_path,
                         "line": first_in_diff,
                         "end_line": first_in_diff,
                         "rule_id": "clang_format",
+                        "kind": kind,
                         "severity": "info",
                         "message": (
                             "clang-format 포맷 차이가 있지만 PR diff 범위를 "
@@ -337,6 +491,7 @@ def generate_format_suggestions(
                             "line": adj_line,
                             "end_line": adj_line,
                             "rule_id": "clang_format",
+                            "kind": kind,
                             "severity": "info",
                             "message": (
                                 "clang-format이 PR 변경 라인 근처에 "
@@ -352,7 +507,7 @@ def generate_format_suggestions(
 
 def process_file(
     file_path: str,
-    added_lines: Set[int],
+    added_lines: Optional[Set[int]],
     config_path: Optional[str] = None,
     clang_format_bin: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
@@ -360,7 +515,8 @@ def process_file(
 
     Args:
         file_path: Path to the source file.
-        added_lines: Set of added line numbers from PR diff.
+        added_lines: Set of added line numbers from PR diff, or None to
+            treat every line of the file as in range.
         config_path: Path to .clang-format config.
         clang_format_bin: Path to clang-format binary.
 
@@ -378,15 +534,31 @@ def process_file(
     original = path.read_text(encoding="utf-8", errors="replace")
     formatted = run_clang_format(file_path, config_path, clang_format_bin)
 
-    if formatted is None:
+    if formatted is None or original == formatted:
         return []
 
-    return generate_format_suggestions(
-        file_path, original, formatted, added_lines
+    original_lines = original.splitlines(keepends=True)
+    if added_lines is None:
+        added_lines = set(range(1, len(original_lines) + 1))
+
+    return _generate_format_suggestions_from_lines(
+        file_path,
+        original_lines,
+        formatted.splitlines(keepends=True),
+        added_lines,
     )
 
 
-def main() -> None:
+def run(argv: Optional[List[str]] = None) -> Tuple[int, str]:
+    """Run the format check without exiting or writing to stdout.
+
+    Args:
+        argv: Command-line arguments excluding the program name
+            (defaults to ``sys.argv[1:]``).
+
+    Returns:
+        ``(exit_code, stdout_text)``.  Warnings still go to stderr.
+    """
     parser = argparse.ArgumentParser(
         description="Stage 1 Format Diff — clang-format suggestion generator"
     )
@@ -410,7 +582,7 @@ def main() -> None:
         help="Output JSON file path (default: stdout)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Check clang-format availability — degrade gracefully when absent
     # so the rest of the pipeline (pattern checking) is not blocked.
@@ -423,10 +595,8 @@ def main() -> None:
         empty_json = json.dumps([], ensure_ascii=False, indent=2)
         if args.output:
             Path(args.output).write_text(empty_json + "\n", encoding="utf-8")
-            print("Format suggestions: 0 items (clang-format unavailable).")
-        else:
-            print(empty_json)
-        sys.exit(0)
+            return 0, "Format suggestions: 0 items (clang-format unavailable).\n"
+        return 0, empty_json + "\n"
 
     files = json.loads(args.files)
 
@@ -442,7 +612,7 @@ def main() -> None:
                 f"Error: Diff file not found: {args.diff}",
                 file=sys.stderr,
             )
-            sys.exit(1)
+            return 1, ""
         diff_text = diff_path.read_text(encoding="utf-8", errors="replace")
         diff_data = parse_diff(diff_text)
         for fp in files:
@@ -451,19 +621,8 @@ def main() -> None:
 
     all_suggestions = []
     for file_path in files:
-        if has_diff:
-            added = added_lines_map.get(file_path, set())
-        else:
-            # No diff provided — treat all lines as in-range
-            path = Path(file_path)
-            if path.exists():
-                line_count = len(
-                    path.read_text(encoding="utf-8", errors="replace")
-                    .splitlines()
-                )
-                added = set(range(1, line_count + 1))
-            else:
-                added = set()
+        # No diff provided — process_file treats all lines as in-range
+        added = added_lines_map.get(file_path, set()) if has_diff else None
         suggestions = process_file(
             file_path,
             added,
@@ -487,15 +646,19 @@ def main() -> None:
     if args.output:
         output_path = Path(args.output)
         output_path.write_text(output_json + "\n", encoding="utf-8")
-        print(
+        return 0, (
             f"Format suggestions: {len(all_suggestions)} items. "
-            f"Written to: {args.output}"
+            f"Written to: {args.output}\n"
         )
-    else:
-        print(output_json)
+    return 0, output_json + "\n"
+
 
-    sys.exit(0)
+def main(argv: Optional[List[str]] = None, out: Optional[TextIO] = None) -> int:
+    """CLI entry point: write :func:`run` output to *out* (default stdout)."""
+    code, text = run(argv)
+    (out or sys.stdout).write(text)
+    return code
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
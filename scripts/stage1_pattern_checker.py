@@ -26,8 +26,10 @@ import json
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -39,11 +41,11 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 # (Markdown, YAML, text, etc.) that may contain false-positive strings.
 _CPP_EXTENSIONS = {".cpp", ".h", ".inl", ".hpp", ".cc", ".cxx", ".hxx"}
 
+from scripts.utils import json_io
 from scripts.utils.diff_parser import FileDiff, parse_diff
 
 
-# Patterns for detecting single-line C/C++ comments
-_SINGLE_LINE_COMMENT_RE = re.compile(r"^\s*//")
+# Pattern for detecting inline C/C++ comments
 _INLINE_COMMENT_RE = re.compile(r"//.*$")
 
 
@@ -98,6 +100,7 @@ def load_tier1_patterns(checklist_path: str) -> List[Dict[str, Any]]:
                         "id": item["id"],
                         "compiled": compiled,
                         "raw_pattern": item["pattern"],
+                        "required": _required_literal(compiled),
                         "prev_compiled": prev_compiled,
                         "severity": item.get("severity", "warning"),
                         "summary": item.get("summary", ""),
@@ -110,6 +113,151 @@ def load_tier1_patterns(checklist_path: str) -> List[Dict[str, Any]]:
     return patterns
 
 
+# Characters that end a literal run when scanning a raw pattern.
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Return the index just past the group whose ``(`` is at *i*."""
+    depth = 0
+    n = len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            i = _skip_class(pattern, i)
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Return the index just past the character class whose ``[`` is at *i*."""
+    n = len(pattern)
+    i += 1
+    if i < n and pattern[i] == "^":
+        i += 1
+    if i < n and pattern[i] == "]":
+        i += 1  # leading ']' is literal
+    while i < n:
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "]":
+            return i + 1
+        i += 1
+    return n
+
+
+# Fixed-length escapes whose trailing characters are part of the escape:
+# \xhh, \uhhhh and \Uhhhhhhhh.
+_ESCAPE_LENGTHS = {"x": 4, "u": 6, "U": 10}
+
+
+def _escape_end(pattern: str, i: int) -> int:
+    """Return the index just past the escape sequence whose ``\\`` is at *i*."""
+    n = len(pattern)
+    nxt = pattern[i + 1] if i + 1 < n else ""
+    if nxt in _ESCAPE_LENGTHS:
+        return min(i + _ESCAPE_LENGTHS[nxt], n)
+    if nxt == "N" and pattern.startswith("{", i + 2):
+        close = pattern.find("}", i + 3)
+        return n if close == -1 else close + 1
+    if "0" <= nxt <= "9":
+        # Octal escapes take up to three digits, back-references up to two;
+        # swallowing a literal digit too only shortens a run.
+        j = i + 1
+        while j < n and j < i + 4 and "0" <= pattern[j] <= "9":
+            j += 1
+        return j
+    return i + 2
+
+
+def _required_literal(compiled: re.Pattern) -> Optional[str]:
+    """Find the longest literal substring every match of *compiled* contains.
+
+    Only top-level literal runs are considered: group and class contents
+    are skipped, a quantified character is dropped from its run, and any
+    top-level ``|`` or IGNORECASE/VERBOSE flag disables the gate.  The result is
+    conservative — ``None`` simply means "always run the regex".
+
+    check_line tests ``required in target`` before ``compiled.search`` so
+    lines lacking the literal never enter the regex engine.
+    """
+    if compiled.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    pattern = compiled.pattern
+    runs: List[str] = []
+    current: List[str] = []
+
+    def end_run() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    i = 0
+    n = len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch in "?*{":
+            # Preceding atom is optional (or bounded) — it can't be required.
+            # A '?' right after a quantifier is a lazy modifier; same effect.
+            if current:
+                current.pop()
+            end_run()
+            if ch == "{":
+                close = pattern.find("}", i)
+                i = n if close == -1 else close + 1
+            else:
+                i += 1
+            continue
+        if ch == "+":
+            # Atom stays required, but repetition breaks contiguity.
+            end_run()
+            i += 1
+            continue
+        if ch == "|":
+            return None
+        if ch == "(":
+            end_run()
+            i = _skip_group(pattern, i)
+            continue
+        if ch == "[":
+            end_run()
+            i = _skip_class(pattern, i)
+            continue
+        if ch == "\\":
+            nxt = pattern[i + 1] if i + 1 < n else ""
+            if nxt and not nxt.isalnum():
+                # Escaped punctuation (e.g. ``\\(``) is a plain literal.
+                current.append(nxt)
+                i += 2
+            else:
+                # \\b, \\s, \\d, \\x41, back-references, etc.
+                end_run()
+                i = _escape_end(pattern, i)
+            continue
+        if ch in _REGEX_META:
+            end_run()
+        else:
+            current.append(ch)
+        i += 1
+    end_run()
+
+    if not runs:
+        return None
+    return max(runs, key=len)
+
+
 def _split_code_comment(line: str) -> tuple:
     """Split a line into code and inline comment parts.
 
@@ -153,6 +301,20 @@ def _split_code_comment(line: str) -> tuple:
     return line, ""
 
 
+def _is_comment_line(line: str) -> bool:
+    """Return True if *line* is entirely a ``//`` comment.
+
+    Uses plain string ops rather than a ``^\\s*//`` regex since this runs
+    once per added line.
+    """
+    return line.lstrip().startswith("//")
+
+
+def _is_blank(text: str) -> bool:
+    """Return True if *text* is empty or whitespace-only (no allocation)."""
+    return not text or text.isspace()
+
+
 def _strip_comments(line: str) -> str:
     """Remove inline C++ comments from a line for pattern matching.
 
@@ -171,40 +333,63 @@ def _strip_comments(line: str) -> str:
         Empty string if the entire line is a comment.
     """
     # Don't strip if entire line is a comment (return empty to skip matching)
-    if _SINGLE_LINE_COMMENT_RE.match(line):
+    if _is_comment_line(line):
         return ""
 
     code, _comment = _split_code_comment(line)
     return code
 
 
-def _generate_suggestion(rule_id: str, line: str) -> Optional[str]:
+def _fix_macro_no_semicolon(code: str, comment: str) -> Optional[str]:
+    """Append the missing ``;`` after a macro call, before any comment."""
+    code = code.rstrip()
+    if comment:
+        return code + "; " + comment
+    return code + ";"
+
+
+def _fix_declaration_macro_semicolon(code: str, comment: str) -> Optional[str]:
+    """Drop the redundant ``;`` after a declaration macro."""
+    code = code.rstrip()
+    if code.endswith(";"):
+        code = code[:-1]
+    if comment:
+        return code + " " + comment
+    return code
+
+
+# Auto-fix generators keyed by rule_id.  Each takes the (code, comment)
+# split of the line.  New fixable rules register here instead of
+# extending an if-chain in _generate_suggestion.
+_SUGGESTION_FIXERS: Dict[str, Callable[[str, str], Optional[str]]] = {
+    "macro_no_semicolon": _fix_macro_no_semicolon,
+    "declaration_macro_semicolon": _fix_declaration_macro_semicolon,
+}
+
+
+def _generate_suggestion(
+    rule_id: str,
+    line: str,
+    split: Optional[Tuple[str, str]] = None,
+) -> Optional[str]:
     """Generate auto-fix suggestion for fixable patterns.
 
     Args:
         rule_id: The pattern rule ID.
         line: The original source line.
+        split: Optional ``_split_code_comment(line)`` result.  check_line
+            already computes it for comment stripping, so passing it
+            avoids scanning the line a second time.
 
     Returns:
         Suggested replacement line, or None if not auto-fixable.
     """
-    if rule_id == "macro_no_semicolon":
-        code, comment = _split_code_comment(line)
-        code = code.rstrip()
-        if comment:
-            return code + "; " + comment
-        return code + ";"
-
-    if rule_id == "declaration_macro_semicolon":
-        code, comment = _split_code_comment(line)
-        code = code.rstrip()
-        if code.endswith(";"):
-            code = code[:-1]
-        if comment:
-            return code + " " + comment
-        return code
-
-    return None
+    fixer = _SUGGESTION_FIXERS.get(rule_id)
+    if fixer is None:
+        return None
+    if split is None:
+        split = _split_code_comment(line)
+    return fixer(*split)
 
 
 def check_line(
@@ -227,13 +412,25 @@ def check_line(
         List of finding dicts (without file/line info).
     """
     check_target = line
+    split: Optional[Tuple[str, str]] = None
     if skip_comments:
-        check_target = _strip_comments(line)
-        if not check_target.strip():
+        # Same result as _strip_comments(line), but the (code, comment)
+        # split is kept so fixers don't re-scan the line.
+        if _is_comment_line(line):
+            return []
+        split = _split_code_comment(line)
+        check_target = split[0]
+        if _is_blank(check_target):
             return []
 
     findings = []
     for pat in patterns:
+        # Cheap substring gate: skip the regex engine when the pattern's
+        # required literal is absent.  .get() keeps hand-built pattern
+        # dicts (without "required") working.
+        required = pat.get("required")
+        if required and required not in check_target:
+            continue
         if not pat["compiled"].search(check_target):
             continue
 
@@ -244,12 +441,12 @@ def check_line(
             prev_check_target = prev_line
             if skip_comments:
                 prev_check_target = _strip_comments(prev_line)
-                if not prev_check_target.strip():
+                if _is_blank(prev_check_target):
                     continue
             if not pat["prev_compiled"].search(prev_check_target):
                 continue
 
-        suggestion = _generate_suggestion(pat["id"], line)
+        suggestion = _generate_suggestion(pat["id"], line, split)
         findings.append(
             {
                 "rule_id": pat["id"],
@@ -262,56 +459,117 @@ def check_line(
     return findings
 
 
+def _check_file(
+    filepath: str,
+    file_diff: FileDiff,
+    patterns: List[Dict[str, Any]],
+    skip_comments: bool = True,
+) -> List[Dict[str, Any]]:
+    """Check the added lines of a single file against Tier 1 patterns.
+
+    Args:
+        filepath: Path of the file in the diff.
+        file_diff: Parsed diff data for *filepath*.
+        patterns: Compiled pattern list from load_tier1_patterns().
+        skip_comments: If True, skip comment lines.
+
+    Returns:
+        List of finding dicts for this file, in line order.
+    """
+    file_findings = []
+    sorted_line_nums = sorted(file_diff.added_lines.keys())
+    has_prev_patterns = any(p["prev_compiled"] is not None for p in patterns)
+    for i, line_num in enumerate(sorted_line_nums):
+        line = file_diff.added_lines[line_num]
+        # Only look up prev_line when at least one pattern uses
+        # prev_line_pattern — avoids unnecessary work otherwise.
+        prev_line: Optional[str] = None
+        if has_prev_patterns:
+            prev_line_num = line_num - 1
+            if i > 0 and sorted_line_nums[i - 1] == prev_line_num:
+                prev_line = file_diff.added_lines[sorted_line_nums[i - 1]]
+            elif prev_line_num in file_diff.context_lines:
+                prev_line = file_diff.context_lines[prev_line_num]
+        findings = check_line(
+            line, patterns, skip_comments=skip_comments, prev_line=prev_line
+        )
+        for finding in findings:
+            file_findings.append(
+                {
+                    "file": filepath,
+                    "line": line_num,
+                    **finding,
+                }
+            )
+    return file_findings
+
+
+# Per-process check_diff arguments, set once by _init_check_worker so
+# the pattern list is pickled per worker rather than per file.
+_worker_args: Dict[str, Any] = {}
+
+
+def _init_check_worker(
+    patterns: List[Dict[str, Any]],
+    skip_comments: bool,
+) -> None:
+    _worker_args.update(patterns=patterns, skip_comments=skip_comments)
+
+
+def _check_file_in_worker(filepath: str, file_diff: FileDiff) -> List[Dict[str, Any]]:
+    return _check_file(filepath, file_diff, **_worker_args)
+
+
 def check_diff(
     diff_data: Dict[str, FileDiff],
     patterns: List[Dict[str, Any]],
     skip_comments: bool = True,
+    max_workers: int = 1,
 ) -> List[Dict[str, Any]]:
     """Check all added lines in parsed diff data against Tier 1 patterns.
 
+    Runs serially by default.  Files are independent, so ``max_workers``
+    above 1 checks them in a process pool (regex matching holds the GIL,
+    so threads would not help); worker start-up only pays off on very
+    large diffs.
+
     Args:
         diff_data: Parsed diff data from parse_diff().
         patterns: Compiled pattern list from load_tier1_patterns().
         skip_comments: If True, skip comment lines.
+        max_workers: Process pool size; ``1`` (the default) stays serial.
 
     Returns:
         List of finding dicts with file, line, rule_id, severity,
         message, and suggestion fields.
     """
-    all_findings = []
-
-    for filepath in sorted(diff_data.keys()):
-        # Only check C++ files — skip Markdown, YAML, text, etc. to
-        # avoid false positives from documentation strings.
-        if Path(filepath).suffix.lower() not in _CPP_EXTENSIONS:
-            continue
-        file_diff = diff_data[filepath]
-        sorted_line_nums = sorted(file_diff.added_lines.keys())
-        has_prev_patterns = any(p["prev_compiled"] is not None for p in patterns)
-        for i, line_num in enumerate(sorted_line_nums):
-            line = file_diff.added_lines[line_num]
-            # Only look up prev_line when at least one pattern uses
-            # prev_line_pattern — avoids unnecessary work otherwise.
-            prev_line: Optional[str] = None
-            if has_prev_patterns:
-                prev_line_num = line_num - 1
-                if i > 0 and sorted_line_nums[i - 1] == prev_line_num:
-                    prev_line = file_diff.added_lines[sorted_line_nums[i - 1]]
-                elif prev_line_num in file_diff.context_lines:
-                    prev_line = file_diff.context_lines[prev_line_num]
-            findings = check_line(
-                line, patterns, skip_comments=skip_comments, prev_line=prev_line
-            )
-            for finding in findings:
-                all_findings.append(
-                    {
-                        "file": filepath,
-                        "line": line_num,
-                        **finding,
-                    }
+    # Only check C++ files — skip Markdown, YAML, text, etc. to
+    # avoid false positives from documentation strings.
+    filepaths = [
+        fp for fp in sorted(diff_data.keys())
+        if Path(fp).suffix.lower() in _CPP_EXTENSIONS
+    ]
+
+    if max_workers > 1 and len(filepaths) > 1:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_check_worker,
+            initargs=(patterns, skip_comments),
+        ) as executor:
+            per_file = list(
+                executor.map(
+                    _check_file_in_worker,
+                    filepaths,
+                    [diff_data[fp] for fp in filepaths],
                 )
+            )
+    else:
+        per_file = [
+            _check_file(fp, diff_data[fp], patterns, skip_comments)
+            for fp in filepaths
+        ]
 
-    return all_findings
+    return list(chain.from_iterable(per_file))
 
 
 def get_diff_from_git(files: List[str], base_ref: str) -> str:
@@ -378,6 +636,13 @@ def main() -> None:
         action="store_true",
         help="Don't skip comment lines (check everything)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Check files in this many worker processes (default: 1, serial). "
+        "Only worth it for very large diffs",
+    )
 
     args = parser.parse_args()
 
@@ -412,11 +677,14 @@ def main() -> None:
         diff_data = {k: v for k, v in diff_data.items() if k in requested_files}
 
     findings = check_diff(
-        diff_data, patterns, skip_comments=not args.no_skip_comments
+        diff_data,
+        patterns,
+        skip_comments=not args.no_skip_comments,
+        max_workers=args.jobs,
     )
 
     # Output
-    output_json = json.dumps(findings, ensure_ascii=False, indent=2)
+    output_json = json_io.dumps_pretty(findings)
 
     if args.output:
         output_path = Path(args.output)
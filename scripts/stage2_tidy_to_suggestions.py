@@ -18,13 +18,17 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from bisect import bisect_left
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.utils import json_io
+
 # ---------------------------------------------------------------------------
 # clang-tidy --export-fixes YAML schema (abbreviated):
 #
@@ -89,12 +93,33 @@ def _resolve_path(file_path: str, build_dir: Optional[str] = None) -> str:
         return str(p)
 
 
-def _offset_to_line(content: str, offset: int) -> int:
+def _newline_offsets(raw: bytes) -> List[int]:
+    """Return the sorted byte offsets of every ``\\n`` in UTF-8 *raw*."""
+    offsets: List[int] = []
+    pos = raw.find(b"\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = raw.find(b"\n", pos + 1)
+    return offsets
+
+
+def _offset_to_line(
+    content: str,
+    offset: int,
+    newline_offsets: Optional[List[int]] = None,
+) -> int:
     """Convert a byte offset to a 1-based line number.
 
     clang-tidy emits byte offsets, so we encode to UTF-8 first to get
     accurate line numbers when the file contains multi-byte characters.
+
+    When *newline_offsets* (from _newline_offsets()) is given, the
+    lookup is a binary search instead of an encode + count over the file
+    prefix — convert_diagnostics builds it once per file and reuses it
+    for every diagnostic in that file.
     """
+    if newline_offsets is not None:
+        return bisect_left(newline_offsets, offset) + 1
     raw = content.encode("utf-8")
     # Clamp to valid range
     offset = min(offset, len(raw))
@@ -105,6 +130,7 @@ def _apply_replacements(
     content: str,
     replacements: List[Dict[str, Any]],
     target_file: str,
+    content_bytes: Optional[bytes] = None,
 ) -> Optional[str]:
     """Apply clang-tidy replacements to source content and return the
     modified text.
@@ -119,10 +145,14 @@ def _apply_replacements(
 
     When multiple replacements target different offsets we apply them
     back-to-front (highest offset first) so earlier offsets remain valid.
+
+    *content_bytes* may carry the already-encoded ``content`` so callers
+    processing many diagnostics per file encode it only once.
     """
+    target = _normalise(target_file)
     applicable = [
         r for r in replacements
-        if _normalise(r.get("FilePath", "")) == _normalise(target_file)
+        if _normalise(r.get("FilePath", "")) == target
     ]
     if not applicable:
         return None
@@ -131,7 +161,7 @@ def _apply_replacements(
     applicable.sort(key=lambda r: r.get("Offset", 0), reverse=True)
 
     # Work in bytes — clang-tidy offsets are byte-based
-    modified = content.encode("utf-8")
+    modified = content_bytes if content_bytes is not None else content.encode("utf-8")
     for repl in applicable:
         offset = repl.get("Offset", 0)
         length = repl.get("Length", 0)
@@ -213,9 +243,17 @@ def _read_source(path: Path) -> str:
 def _extract_suggestion_span(
     original: str,
     modified: str,
+    orig_lines: Optional[List[str]] = None,
 ) -> Tuple[Optional[str], int, Optional[int]]:
     """Compare original and modified source to extract the changed span.
 
+    Args:
+        original: Original source text.
+        modified: Source text after applying replacements.
+        orig_lines: Optional pre-split ``original.splitlines()``.  Callers
+            that extract spans for many diagnostics in the same file pass
+            a cached split so the original is not re-split per diagnostic.
+
     Returns:
         (suggestion_text, start_line_1based, end_line_1based_or_None)
         - suggestion_text: the replacement text (modified lines in the changed
@@ -224,7 +262,8 @@ def _extract_suggestion_span(
         - end_line: 1-based last changed line in the *original* file,
           or None if the change is single-line.
     """
-    orig_lines = original.splitlines()
+    if orig_lines is None:
+        orig_lines = original.splitlines()
     mod_lines = modified.splitlines()
 
     # Find first differing line (from top)
@@ -308,6 +347,27 @@ def convert_diagnostics(
         message, and optional suggestion.
     """
     findings: List[Dict[str, Any]] = []
+    # Per-file cache of original.splitlines() — a file with many
+    # fixable diagnostics is split once instead of once per diagnostic.
+    orig_lines_cache: Dict[str, List[str]] = {}
+    # Per-file UTF-8 encoding of the source (clang-tidy offsets are
+    # byte-based) and its newline byte offsets, computed once per file.
+    encoded_cache: Dict[str, bytes] = {}
+    newline_cache: Dict[str, List[int]] = {}
+
+    def _encoded(src_path: str, content: str) -> bytes:
+        raw = encoded_cache.get(src_path)
+        if raw is None:
+            raw = content.encode("utf-8")
+            encoded_cache[src_path] = raw
+        return raw
+
+    def _line_of(src_path: str, content: str, offset: int) -> int:
+        newlines = newline_cache.get(src_path)
+        if newlines is None:
+            newlines = _newline_offsets(_encoded(src_path, content))
+            newline_cache[src_path] = newlines
+        return _offset_to_line(content, offset, newlines)
 
     for diag in diagnostics:
         if not isinstance(diag, dict):
@@ -336,12 +396,14 @@ def convert_diagnostics(
 
         # Compute line number
         if source_contents and file_path in source_contents:
-            line_num = _offset_to_line(source_contents[file_path], file_offset)
+            line_num = _line_of(
+                file_path, source_contents[file_path], file_offset
+            )
         elif source_contents:
             # Try with resolved path
             for src_path, content in source_contents.items():
                 if _normalise(src_path) == _normalise(file_path):
-                    line_num = _offset_to_line(content, file_offset)
+                    line_num = _line_of(src_path, content, file_offset)
                     break
             else:
                 # Rough estimate: ~80 chars per line
@@ -365,10 +427,16 @@ def convert_diagnostics(
                         break
 
             if content is not None:
-                modified = _apply_replacements(content, replacements, abs_path)
+                modified = _apply_replacements(
+                    content, replacements, abs_path, _encoded(abs_path, content)
+                )
                 if modified is not None and modified != content:
+                    orig_lines = orig_lines_cache.get(abs_path)
+                    if orig_lines is None:
+                        orig_lines = content.splitlines()
+                        orig_lines_cache[abs_path] = orig_lines
                     suggestion, span_start, span_end = _extract_suggestion_span(
-                        content, modified
+                        content, modified, orig_lines
                     )
                     # Use the span's line numbers instead of the diagnostic
                     # offset — the actual changed range may differ.
@@ -598,7 +666,7 @@ def main() -> None:
     if args.stage1_results:
         s1_path = Path(args.stage1_results)
         if s1_path.exists():
-            stage1 = json.loads(s1_path.read_text(encoding="utf-8"))
+            stage1 = json_io.loads(s1_path.read_bytes())
             findings = deduplicate(findings, stage1)
         else:
             print(
@@ -607,7 +675,7 @@ def main() -> None:
             )
 
     # Output
-    output_json = json.dumps(findings, ensure_ascii=False, indent=2)
+    output_json = json_io.dumps_pretty(findings)
 
     if args.output:
         output_path = Path(args.output)
@@ -7,8 +7,9 @@ Uses the Anthropic API (Claude) to perform semantic code review covering:
 - GC safety, thread safety, networking, performance, UE5 patterns
 - Design, comments, security
 
-Each reviewable file is sent to the API individually with the system prompt
-and diff context.  Findings from Stage 1/2 are excluded to avoid duplicates.
+Each reviewable file is sent to the API with the system prompt and diff
+context; small files are packed together into a shared call.  Findings
+from Stage 1/2 are excluded to avoid duplicates.
 
 Usage:
     python -m scripts.stage3_llm_reviewer \\
@@ -28,17 +29,29 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import http.client
+import io
 import json
 import logging
 import os
+import re
 import sys
+import threading
 import time
+import urllib.error
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from scripts.utils.diff_parser import parse_diff
+from scripts.utils.llm_cache import LLMCache, cache_key
+from scripts.utils.rate_limit import RateLimiter
 from scripts.utils.token_budget import (
     BUDGET_PER_FILE,
     BudgetTracker,
@@ -61,6 +74,29 @@ DEFAULT_TEMPERATURE = 0
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2.0  # seconds
 
+# Number of files reviewed concurrently.  Kept small so a PR with many
+# files stays well inside the Anthropic concurrent-request / RPM limits.
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Chunk budgets are rounded down to a multiple of CHUNK_TILE tokens so
+# oversized files split into uniform chunks; CHUNK_TILE_STEP is the single
+# growth step tried when that leaves a nearly empty trailing chunk.
+CHUNK_TILE = 1024
+CHUNK_TILE_STEP = 256
+
+# Full source is only attached when the file's diff is at most this many
+# estimated tokens; larger diffs carry enough context on their own.
+FULL_SOURCE_DIFF_THRESHOLD = 1500
+
+# Thread count for prefetching full sources from --source-dir.
+_SOURCE_READ_WORKERS = 10
+
+# Files whose single-file user message is at most this many tokens are
+# packed together into one API call (up to BATCH_MAX_FILES per call, so the
+# shared DEFAULT_MAX_TOKENS output budget is not crowded out).
+BATCH_SMALL_FILE_TOKENS = 1000
+BATCH_MAX_FILES = 5
+
 # C++ file extensions eligible for LLM review.
 _CPP_EXTENSIONS = {".cpp", ".h", ".inl", ".hpp", ".cc", ".cxx", ".hxx"}
 
@@ -155,9 +191,12 @@ JSON 배열만 반환. 이슈 없으면 [].
 """
 
 
+@functools.lru_cache(maxsize=2)
 def build_system_prompt(has_compile_commands: bool) -> str:
     """Build the full system prompt for the LLM reviewer.
 
+    Memoized: the prompt depends only on *has_compile_commands*.
+
     Args:
         has_compile_commands: Whether compile_commands.json is available.
             If False, clang-tidy fallback checks are included.
@@ -165,12 +204,17 @@ def build_system_prompt(has_compile_commands: bool) -> str:
     Returns:
         Complete system prompt string.
     """
-    parts = [_SYSTEM_PROMPT_BASE]
-    if not has_compile_commands:
-        parts.append(_CLANG_TIDY_FALLBACK_SECTION)
-    parts.append(_SYSTEM_PROMPT_LLM_ITEMS)
-    parts.append(_SYSTEM_PROMPT_OUTPUT)
-    return "\n".join(parts)
+    fallback = "" if has_compile_commands else f"{_CLANG_TIDY_FALLBACK_SECTION}\n"
+    return (
+        f"{_SYSTEM_PROMPT_BASE}\n{fallback}"
+        f"{_SYSTEM_PROMPT_LLM_ITEMS}\n{_SYSTEM_PROMPT_OUTPUT}"
+    )
+
+
+@functools.lru_cache(maxsize=2)
+def _system_prompt_tokens(has_compile_commands: bool) -> int:
+    """Return the estimated token count of :func:`build_system_prompt`."""
+    return estimate_tokens(build_system_prompt(has_compile_commands))
 
 
 def build_user_message(
@@ -188,22 +232,98 @@ def build_user_message(
     Returns:
         User message string.
     """
-    parts = [f"## 파일: `{file_path}`\n"]
+    return (
+        f"{_file_section(file_path, diff_text, full_source)}\n"
+        "위 diff를 코드 리뷰하고 JSON 배열로 결과를 반환하세요."
+    )
+
+
+def build_batch_user_message(
+    files: List[Tuple[str, str, Optional[str]]],
+) -> str:
+    """Build one user message covering several files.
+
+    Each file gets the same ``## 파일:`` section as
+    :func:`build_user_message`, separated by ``---`` rules, followed by an
+    instruction to tag every finding with one of the listed paths.
+
+    Args:
+        files: ``(file_path, diff_text, full_source)`` tuples.
+
+    Returns:
+        User message string.
+    """
+    sections = "\n---\n\n".join(
+        _file_section(fp, diff, src) for fp, diff, src in files
+    )
+    return (
+        f"{sections}\n"
+        "위 파일들의 diff를 코드 리뷰하고 JSON 배열로 결과를 반환하세요. "
+        "각 항목의 \"file\"은 위에 나열된 파일 경로 중 하나와 정확히 일치해야 합니다."
+    )
+
+
+def _file_section(
+    file_path: str,
+    diff_text: str,
+    full_source: Optional[str],
+) -> str:
+    """Render the header, optional full source and diff of one file."""
+    source = (
+        f"### 전체 소스\n```cpp\n\n{full_source}\n\n```\n\n"
+        if full_source is not None
+        else ""
+    )
+    return (
+        f"## 파일: `{file_path}`\n\n{source}"
+        f"### Diff (변경 사항)\n```diff\n\n{diff_text}\n\n```\n"
+    )
 
-    if full_source is not None:
-        parts.append("### 전체 소스\n```cpp\n")
-        parts.append(full_source)
-        parts.append("\n```\n")
 
-    parts.append("### Diff (변경 사항)\n```diff\n")
-    parts.append(diff_text)
-    parts.append("\n```\n")
+def pack_files(
+    files: List[Tuple[str, str, Optional[str]]],
+    system_tokens: int,
+) -> List[List[Tuple[str, str, Optional[str]]]]:
+    """Greedily group small files so they can share one API call.
 
-    parts.append("위 diff를 코드 리뷰하고 JSON 배열로 결과를 반환하세요.")
-    return "\n".join(parts)
+    Files are taken in the given order.  A file whose single-file message
+    exceeds :data:`BATCH_SMALL_FILE_TOKENS` always forms its own group;
+    small files are appended to the open group while the combined message
+    stays within ``BUDGET_PER_FILE - system_tokens`` and the group has
+    fewer than :data:`BATCH_MAX_FILES` members.
 
+    Args:
+        files: ``(file_path, diff_text, full_source)`` tuples.
+        system_tokens: Estimated tokens of the system prompt.
 
-def load_exclude_findings(file_paths: List[str]) -> Set[Tuple[str, int]]:
+    Returns:
+        List of groups; single-element groups are reviewed individually.
+    """
+    limit = BUDGET_PER_FILE - system_tokens
+    groups: List[List[Tuple[str, str, Optional[str]]]] = []
+    current: List[Tuple[str, str, Optional[str]]] = []
+    current_tokens = 0
+
+    for item in files:
+        tokens = estimate_tokens(build_user_message(*item))
+        if tokens > BATCH_SMALL_FILE_TOKENS:
+            groups.append([item])
+            continue
+        if current and (
+            current_tokens + tokens > limit or len(current) >= BATCH_MAX_FILES
+        ):
+            groups.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += tokens
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+def load_exclude_findings(file_paths: List[str]) -> Dict[str, Set[int]]:
     """Load findings from Stage 1/2 to exclude from Stage 3 review.
 
     Uses ``(file, line)`` as the exclusion key because Stage 1/2 rule
@@ -217,9 +337,9 @@ def load_exclude_findings(file_paths: List[str]) -> Set[Tuple[str, int]]:
         file_paths: Paths to JSON finding files from earlier stages.
 
     Returns:
-        Set of (file, line) tuples to exclude.
+        Mapping of file path to the set of line numbers to exclude.
     """
-    excluded: Set[Tuple[str, int]] = set()
+    excluded: Dict[str, Set[int]] = {}
 
     for fp in file_paths:
         path = Path(fp)
@@ -240,7 +360,7 @@ def load_exclude_findings(file_paths: List[str]) -> Set[Tuple[str, int]]:
                 except (TypeError, ValueError):
                     continue
                 if file and line > 0:
-                    excluded.add((file, line))
+                    excluded.setdefault(file, set()).add(line)
         except (json.JSONDecodeError, OSError) as e:
             logger.warning("Failed to load exclude findings from %s: %s", fp, e)
 
@@ -249,7 +369,7 @@ def load_exclude_findings(file_paths: List[str]) -> Set[Tuple[str, int]]:
 
 def filter_excluded(
     findings: List[Dict[str, Any]],
-    excluded: Set[Tuple[str, int]],
+    excluded: Dict[str, Set[int]],
 ) -> List[Dict[str, Any]]:
     """Remove findings that overlap with Stage 1/2 results.
 
@@ -260,19 +380,25 @@ def filter_excluded(
 
     Args:
         findings: Raw findings from LLM response.
-        excluded: Set of (file, line) tuples from earlier stages.
+        excluded: Mapping of file path to excluded lines from earlier stages.
 
     Returns:
         Filtered list of findings.
     """
+    if not excluded:
+        return list(findings)
     result = []
     for f in findings:
         file = f.get("file", "")
+        lines = excluded.get(file) if isinstance(file, str) else None
+        if not lines:
+            result.append(f)
+            continue
         try:
             line = int(f.get("line", 0))
         except (TypeError, ValueError):
             line = 0
-        if (file, line) not in excluded:
+        if line not in lines:
             result.append(f)
     return result
 
@@ -285,8 +411,9 @@ def parse_llm_response(response_text: str) -> List[Dict[str, Any]]:
     strategies to extract the JSON array robustly:
 
     1. Extract content inside markdown code fences first (highest priority).
-    2. Iterate over every ``[`` position and attempt ``json.loads`` from
-       there, guarding against false matches like ``[주의]``.
+    2. Decode a JSON value at each ``[`` position with ``raw_decode``,
+       guarding against false matches like ``[주의]`` and resuming after
+       any array that decodes but is not a findings array.
 
     Args:
         response_text: Raw text response from the LLM.
@@ -294,6 +421,15 @@ def parse_llm_response(response_text: str) -> List[Dict[str, Any]]:
     Returns:
         List of finding dicts.  Empty list on parse failure.
     """
+    findings = _find_findings_array(response_text)
+    if findings is None:
+        logger.warning("No JSON array found in LLM response")
+        return []
+    return findings
+
+
+def _find_findings_array(response_text: str) -> Optional[List[Dict[str, Any]]]:
+    """Core of :func:`parse_llm_response`; returns None on parse failure."""
     text = response_text.strip()
 
     # Strategy 1: Extract content inside markdown code fences.
@@ -308,7 +444,9 @@ def parse_llm_response(response_text: str) -> List[Dict[str, Any]]:
     # Use raw_decode to consume exactly one JSON value, ignoring trailing text.
     # Prefer arrays containing dict elements; remember the first empty array
     # as a fallback (valid "no issues" response) but keep scanning for a
-    # non-empty findings array.
+    # non-empty findings array.  When an array decodes but is rejected, its
+    # nested arrays are checked on the decoded value and scanning resumes
+    # after it, so no span of the text is lexed twice.
     decoder = json.JSONDecoder()
     pos = 0
     first_empty: Optional[list] = None
@@ -318,40 +456,71 @@ def parse_llm_response(response_text: str) -> List[Dict[str, Any]]:
             break
         try:
             data, end_idx = decoder.raw_decode(text, start)
-            if isinstance(data, list):
-                if _is_findings_array(data) and len(data) > 0:
-                    return data
-                if len(data) == 0 and first_empty is None:
-                    first_empty = data
         except (json.JSONDecodeError, ValueError):
-            pass
-        pos = start + 1
+            pos = start + 1
+            continue
+        for candidate in _iter_arrays(data):
+            if len(candidate) > 0 and _is_findings_array(candidate):
+                return candidate
+            if len(candidate) == 0 and first_empty is None:
+                first_empty = candidate
+        pos = end_idx
+
+    # No dict-containing array found; return remembered empty array or None
+    return first_empty
 
-    # No dict-containing array found; return remembered empty array or []
-    if first_empty is not None:
-        return first_empty
 
-    logger.warning("No JSON array found in LLM response")
-    return []
+def _parse_response(
+    response_text: str, stop_reason: Optional[str]
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Parse an API response into raw findings.
+
+    Returns:
+        Tuple of (findings, cacheable).  Only a complete response
+        (``stop_reason == "end_turn"``) that held a findings array is
+        cacheable; a truncated or unparseable one would otherwise be
+        cached as "no issues" and the diff never reviewed again.
+    """
+    findings = _find_findings_array(response_text)
+    if findings is None:
+        logger.warning("No JSON array found in LLM response")
+        return [], False
+    if stop_reason != "end_turn":
+        logger.warning("Incomplete LLM response (stop_reason=%s)", stop_reason)
+        return findings, False
+    return findings, True
+
+
+# First markdown code fence: an opening line starting with ``` (optionally
+# followed by a language tag), then everything up to a line that is just
+# ``` or the end of the text.
+_FENCE_RE = re.compile(
+    r"^[^\S\n]*```[^\n]*(?:\n|\Z)(.*?)(?:^[^\S\n]*```[^\S\n]*$|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
 
 
 def _extract_fenced_content(text: str) -> Optional[str]:
     """Extract text inside the first markdown code fence, if present."""
     if "```" not in text:
         return None
-    lines = text.split("\n")
-    inside = False
-    content_lines: List[str] = []
-    for line in lines:
-        stripped = line.strip()
-        if not inside and stripped.startswith("```"):
-            inside = True
-            continue
-        if inside and stripped == "```":
-            break
-        if inside:
-            content_lines.append(line)
-    return "\n".join(content_lines).strip() if content_lines else None
+    m = _FENCE_RE.search(text)
+    if m is None or not m.group(1):
+        return None
+    return m.group(1).strip()
+
+
+def _iter_arrays(value: Any) -> Iterator[list]:
+    """Yield *value* and every array nested in it, in document order."""
+    if isinstance(value, list):
+        yield value
+        for item in value:
+            if isinstance(item, (list, dict)):
+                yield from _iter_arrays(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            if isinstance(item, (list, dict)):
+                yield from _iter_arrays(item)
 
 
 def _is_findings_array(data: list) -> bool:
@@ -373,7 +542,6 @@ def _is_findings_array(data: list) -> bool:
 
 def _try_parse_json_array(text: str) -> Optional[List[Dict[str, Any]]]:
     """Try to parse text as a JSON array. Returns None on failure."""
-    text = text.strip()
     try:
         data = json.loads(text)
         if isinstance(data, list):
@@ -383,66 +551,130 @@ def _try_parse_json_array(text: str) -> Optional[List[Dict[str, Any]]]:
     return None
 
 
-def validate_finding(finding: Dict[str, Any], file_path: str) -> Dict[str, Any]:
-    """Normalize and validate a single finding from LLM output.
+_SEVERITIES = frozenset(("error", "warning", "info", "suggestion"))
 
-    Ensures required fields are present and types are correct.
-    Sets the ``stage`` field to ``"stage3"`` and ``rule_id`` from ``category``.
 
-    Args:
-        finding: Raw finding dict from LLM.
-        file_path: Expected file path (used as fallback).
+@dataclass(slots=True)
+class Finding:
+    """A normalized Stage 3 finding.
 
-    Returns:
-        Normalized finding dict.
+    Built from raw LLM output with :meth:`from_llm` and converted to the
+    JSON dict shared with Stage 1/2 and ``post_review`` by :meth:`to_dict`.
     """
-    normalized: Dict[str, Any] = {}
-
-    # File — always use the caller-provided file_path.  The LLM may
-    # return path variants (e.g. "b/Source/...") that break downstream
-    # dedup key matching and inline comment placement.
-    normalized["file"] = file_path
-
-    # Line numbers — coerce to int
-    try:
-        normalized["line"] = int(finding.get("line", 0))
-    except (TypeError, ValueError):
-        normalized["line"] = 0
 
-    end_line = finding.get("end_line")
-    if end_line is not None:
+    file: str
+    line: int
+    severity: str
+    category: str
+    rule_id: str
+    message: str
+    end_line: Optional[int] = None
+    suggestion: Optional[str] = None
+    stage: str = "stage3"
+
+    @classmethod
+    def from_llm(cls, finding: Dict[str, Any], file_path: str) -> "Finding":
+        """Normalize and validate a single finding from LLM output.
+
+        Ensures required fields are present and types are correct.
+        Sets ``rule_id`` from ``category``.
+
+        Args:
+            finding: Raw finding dict from LLM.
+            file_path: Expected file path (used as fallback).
+
+        Returns:
+            Normalized finding.
+        """
+        # Line numbers — coerce to int
         try:
-            normalized["end_line"] = int(end_line)
+            line = int(finding.get("line", 0))
         except (TypeError, ValueError):
-            pass
+            line = 0
+
+        end_line = finding.get("end_line")
+        if end_line is not None:
+            try:
+                end_line = int(end_line)
+            except (TypeError, ValueError):
+                end_line = None
+
+        # Severity — validate against known values; force str for non-string input.
+        severity = finding.get("severity", "warning")
+        if not isinstance(severity, str) or severity not in _SEVERITIES:
+            severity = "warning"
+
+        # Category / rule_id — force str to prevent unhashable types in
+        # post_review.deduplicate_findings() tuple keys.
+        category = finding.get("category", "general")
+        if not isinstance(category, str):
+            category = "general"
+
+        # Message — force str for safety.
+        message = finding.get("message", "")
+        if not isinstance(message, str):
+            message = ""
+
+        # Suggestion (optional) — force str.
+        suggestion = finding.get("suggestion")
+        suggestion = str(suggestion) if suggestion else None
+
+        # File — always use the caller-provided file_path.  The LLM may
+        # return path variants (e.g. "b/Source/...") that break downstream
+        # dedup key matching and inline comment placement.
+        return cls(
+            file=file_path,
+            line=line,
+            severity=severity,
+            category=category,
+            rule_id=category,  # post_review uses rule_id or category
+            message=message,
+            end_line=end_line,
+            suggestion=suggestion,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON dict form; unset optional fields are omitted."""
+        d: Dict[str, Any] = {"file": self.file, "line": self.line}
+        if self.end_line is not None:
+            d["end_line"] = self.end_line
+        d["severity"] = self.severity
+        d["category"] = self.category
+        d["rule_id"] = self.rule_id
+        d["message"] = self.message
+        if self.suggestion is not None:
+            d["suggestion"] = self.suggestion
+        d["stage"] = self.stage
+        return d
+
 
-    # Severity — validate against known values; force str for non-string input.
-    raw_severity = finding.get("severity", "warning")
-    severity = raw_severity if isinstance(raw_severity, str) else "warning"
-    if severity not in ("error", "warning", "info", "suggestion"):
-        severity = "warning"
-    normalized["severity"] = severity
+def validate_finding(finding: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+    """Normalize and validate a single finding from LLM output.
 
-    # Category / rule_id — force str to prevent unhashable types in
-    # post_review.deduplicate_findings() tuple keys.
-    raw_category = finding.get("category", "general")
-    category = str(raw_category) if isinstance(raw_category, str) else "general"
-    normalized["category"] = category
-    normalized["rule_id"] = category  # post_review uses rule_id or category
+    Dict-returning wrapper around :meth:`Finding.from_llm`.
 
-    # Message — force str for safety.
-    raw_message = finding.get("message", "")
-    normalized["message"] = str(raw_message) if isinstance(raw_message, str) else ""
+    Args:
+        finding: Raw finding dict from LLM.
+        file_path: Expected file path (used as fallback).
 
-    # Suggestion (optional) — force str.
-    suggestion = finding.get("suggestion")
-    if suggestion:
-        normalized["suggestion"] = str(suggestion) if isinstance(suggestion, str) else str(suggestion)
+    Returns:
+        Normalized finding dict.
+    """
+    return Finding.from_llm(finding, file_path).to_dict()
 
-    # Stage tag
-    normalized["stage"] = "stage3"
 
-    return normalized
+def _findings_to_dicts(
+    findings: List[Finding],
+    excluded: Dict[str, Set[int]],
+) -> List[Dict[str, Any]]:
+    """Drop findings on Stage 1/2 lines and convert the rest to dicts."""
+    result = []
+    for f in findings:
+        lines = excluded.get(f.file)
+        if lines and f.line in lines:
+            continue
+        result.append(f.to_dict())
+    return result
 
 
 def call_anthropic_api(
@@ -454,9 +686,13 @@ def call_anthropic_api(
     temperature: int = DEFAULT_TEMPERATURE,
     api_key: Optional[str] = None,
     api_url: Optional[str] = None,
-) -> Tuple[str, int, int]:
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Tuple[str, int, int, Optional[str]]:
     """Call the Anthropic Messages API.
 
+    The request is made with ``"stream": true`` and the server-sent event
+    stream is consumed incrementally; a plain JSON body is still accepted.
+
     Args:
         system_prompt: System message content.
         user_message: User message content.
@@ -465,16 +701,17 @@ def call_anthropic_api(
         temperature: Sampling temperature.
         api_key: API key (defaults to ANTHROPIC_API_KEY env var).
         api_url: Optional base URL override.
+        rate_limiter: Optional limiter consulted before every attempt and
+            updated from the rate-limit headers of every response.
 
     Returns:
-        Tuple of (response_text, input_tokens, output_tokens).
+        Tuple of (response_text, input_tokens, output_tokens, stop_reason).
+        ``stop_reason`` is ``"end_turn"`` for a complete response and None
+        when the API did not report one.
 
     Raises:
         RuntimeError: On API errors after retries are exhausted.
     """
-    import urllib.error
-    import urllib.request
-
     key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
     if not key:
         raise RuntimeError(
@@ -491,6 +728,7 @@ def call_anthropic_api(
         "temperature": temperature,
         "system": system_prompt,
         "messages": [{"role": "user", "content": user_message}],
+        "stream": True,
     }
 
     headers = {
@@ -501,11 +739,19 @@ def call_anthropic_api(
 
     data = json.dumps(payload).encode("utf-8")
 
+    estimated_input = estimate_tokens(system_prompt) + estimate_tokens(user_message)
+
     last_error: Optional[Exception] = None
     for attempt in range(MAX_RETRIES + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire(estimated_input)
         try:
-            req = urllib.request.Request(url, data=data, headers=headers, method="POST")
-            with urllib.request.urlopen(req, timeout=120) as resp:
+            with _post(url, data, headers, timeout=120) as resp:
+                if rate_limiter is not None:
+                    rate_limiter.update_from_headers(resp.headers)
+                if resp.headers.get_content_type() == "text/event-stream":
+                    return _read_message_stream(resp)
+                # Non-streaming body (e.g. a proxy that ignores "stream").
                 raw_body = resp.read().decode("utf-8")
                 try:
                     body = json.loads(raw_body)
@@ -524,15 +770,19 @@ def call_anthropic_api(
             input_tokens = usage.get("input_tokens", 0)
             output_tokens = usage.get("output_tokens", 0)
 
-            return text, input_tokens, output_tokens
+            return text, input_tokens, output_tokens, body.get("stop_reason")
 
         except urllib.error.HTTPError as e:
             last_error = e
             status = e.code
+            if rate_limiter is not None:
+                rate_limiter.update_from_headers(e.headers)
             # Rate limit (429) or server error (5xx) — retry
             if status == 429 or status >= 500:
                 if attempt < MAX_RETRIES:
-                    delay = RETRY_BASE_DELAY * (2**attempt)
+                    delay = max(
+                        RETRY_BASE_DELAY * (2**attempt), _retry_after(e.headers)
+                    )
                     logger.warning(
                         "API error %d on attempt %d, retrying in %.1fs...",
                         status,
@@ -551,7 +801,20 @@ def call_anthropic_api(
                 f"Anthropic API error {status}: {error_body}"
             ) from e
 
-        except (urllib.error.URLError, OSError) as e:
+        except _RetryableStreamError as e:
+            last_error = e
+            if attempt < MAX_RETRIES:
+                delay = RETRY_BASE_DELAY * (2**attempt)
+                logger.warning(
+                    "%s on attempt %d, retrying in %.1fs...", e, attempt + 1, delay
+                )
+                time.sleep(delay)
+                continue
+            raise RuntimeError(
+                f"API stream failed after {MAX_RETRIES + 1} attempts: {e}"
+            ) from e
+
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
             last_error = e
             if attempt < MAX_RETRIES:
                 delay = RETRY_BASE_DELAY * (2**attempt)
@@ -568,37 +831,237 @@ def call_anthropic_api(
     raise RuntimeError(f"API call failed after {MAX_RETRIES + 1} attempts") from last_error
 
 
+# Keep-alive connections, one per (scheme, host, port) per worker thread.
+# http.client connections are not thread-safe, so each thread that reviews
+# files reuses its own connection across calls instead of paying a new TLS
+# handshake per request.
+_thread_connections = threading.local()
+
+
+def _get_connection(
+    scheme: str, host: str, port: Optional[int], timeout: float
+) -> http.client.HTTPConnection:
+    """Return this thread's pooled connection for *scheme*://*host*:*port*."""
+    pool = getattr(_thread_connections, "pool", None)
+    if pool is None:
+        pool = _thread_connections.pool = {}
+    key = (scheme, host, port)
+    conn = pool.get(key)
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        pool[key] = conn
+    return conn
+
+
+def _drop_connection(scheme: str, host: str, port: Optional[int]) -> None:
+    """Close and forget this thread's pooled connection, if any."""
+    pool = getattr(_thread_connections, "pool", {})
+    conn = pool.pop((scheme, host, port), None)
+    if conn is not None:
+        conn.close()
+
+
+@functools.lru_cache(maxsize=8)
+def _request_target(url: str) -> Tuple[str, str, Optional[int], str]:
+    """Split *url* into ``(scheme, host, port, path)`` for http.client."""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return parts.scheme, parts.hostname or "", parts.port, path
+
+
+@contextlib.contextmanager
+def _post(
+    url: str,
+    data: bytes,
+    headers: Dict[str, str],
+    *,
+    timeout: float = 120,
+) -> Iterator[http.client.HTTPResponse]:
+    """POST *data* to *url* over a pooled keep-alive connection.
+
+    Used as a context manager yielding the response.  If sending the
+    request on a reused connection fails (the server has meanwhile closed
+    it), the request is sent once more on a fresh connection.  A failure
+    while waiting for the response is raised instead: the server may
+    already have processed the POST, and resending it would bill the
+    review twice.  If the body is not fully consumed (or an exception
+    escapes the block) the connection is discarded rather than reused.
+
+    Raises:
+        urllib.error.HTTPError: For non-2xx responses (body preloaded).
+        OSError, http.client.HTTPException: On network failures.
+    """
+    scheme, host, port, path = _request_target(url)
+
+    while True:
+        conn = _get_connection(scheme, host, port, timeout)
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", path, body=data, headers=headers)
+            break
+        except (http.client.HTTPException, OSError):
+            _drop_connection(scheme, host, port)
+            if not reused:
+                raise
+    try:
+        resp = conn.getresponse()
+    except (http.client.HTTPException, OSError):
+        _drop_connection(scheme, host, port)
+        raise
+
+    if not 200 <= resp.status < 300:
+        try:
+            body = resp.read()
+        except (http.client.HTTPException, OSError):
+            body = b""
+        if not resp.isclosed():
+            _drop_connection(scheme, host, port)
+        raise urllib.error.HTTPError(
+            url, resp.status, resp.reason, resp.headers, io.BytesIO(body)
+        )
+
+    try:
+        yield resp
+    except BaseException:
+        _drop_connection(scheme, host, port)
+        raise
+    if not resp.isclosed():
+        _drop_connection(scheme, host, port)
+
+
+def _retry_after(headers: Any) -> float:
+    """Return the ``retry-after`` header in seconds, or 0 if absent."""
+    value = headers.get("retry-after") if headers is not None else None
+    if not isinstance(value, str):
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return 0.0
+
+
+# Mid-stream error event types that correspond to retryable HTTP statuses
+# (529 overloaded, 500 internal error) once the 200 response has started.
+_RETRYABLE_STREAM_ERRORS = frozenset({"overloaded_error", "api_error"})
+
+
+class _RetryableStreamError(RuntimeError):
+    """A transient ``error`` event received in the middle of an SSE stream."""
+
+
+def _read_message_stream(resp) -> Tuple[str, int, int, Optional[str]]:
+    """Consume a Messages API server-sent event stream.
+
+    Text deltas are collected as they arrive; token usage comes from the
+    ``message_start`` event and the cumulative ``message_delta`` usage,
+    which also carries the ``stop_reason``.
+
+    Args:
+        resp: Open HTTP response yielding SSE lines as bytes.
+
+    Returns:
+        Tuple of (response_text, input_tokens, output_tokens, stop_reason).
+
+    Raises:
+        _RetryableStreamError: On an ``overloaded_error`` or ``api_error``
+            event, which the API reports as 529/500 before streaming starts.
+        RuntimeError: If the stream carries any other ``error`` event or a
+            malformed ``data:`` payload.
+    """
+    text_parts: List[str] = []
+    input_tokens = 0
+    output_tokens = 0
+    stop_reason: Optional[str] = None
+    data_lines: List[str] = []
+
+    def _dispatch(raw: str) -> None:
+        nonlocal input_tokens, output_tokens, stop_reason
+        try:
+            event = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"API returned malformed stream event: {raw[:200]}") from e
+        etype = event.get("type")
+        if etype == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                text_parts.append(delta.get("text", ""))
+        elif etype == "message_start":
+            usage = event.get("message", {}).get("usage", {})
+            input_tokens = usage.get("input_tokens", input_tokens)
+            output_tokens = usage.get("output_tokens", output_tokens)
+        elif etype == "message_delta":
+            stop_reason = event.get("delta", {}).get("stop_reason", stop_reason)
+            usage = event.get("usage", {})
+            input_tokens = usage.get("input_tokens", input_tokens)
+            output_tokens = usage.get("output_tokens", output_tokens)
+        elif etype == "error":
+            error = event.get("error") or {}
+            if isinstance(error, dict) and error.get("type") in _RETRYABLE_STREAM_ERRORS:
+                raise _RetryableStreamError(f"Anthropic API stream error: {error}")
+            raise RuntimeError(f"Anthropic API stream error: {error}")
+
+    for raw_line in resp:
+        line = raw_line.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data_lines:
+                _dispatch("\n".join(data_lines))
+                data_lines = []
+        elif line.startswith("data:"):
+            data_lines.append(line[5:].lstrip(" "))
+    if data_lines:
+        _dispatch("\n".join(data_lines))
+
+    return "".join(text_parts), input_tokens, output_tokens, stop_reason
+
+
 def review_file(
     file_path: str,
     diff_text: str,
     system_prompt: str,
-    excluded: Set[Tuple[str, int]],
+    excluded: Dict[str, Set[int]],
     budget: BudgetTracker,
     *,
     full_source: Optional[str] = None,
     model: str = DEFAULT_MODEL,
     api_key: Optional[str] = None,
     api_url: Optional[str] = None,
+    cache: Optional[LLMCache] = None,
+    system_prompt_tokens: Optional[int] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> List[Dict[str, Any]]:
     """Review a single file using the LLM.
 
+    When *cache* is given, validated findings are stored per request and
+    a cache hit skips both the API call and the budget check.
+
     Args:
         file_path: Path of the file.
         diff_text: Unified diff text for the file.
         system_prompt: System prompt to use.
-        excluded: Set of (file, line) tuples from earlier stages.
+        excluded: Mapping of file path to excluded lines from earlier stages.
         budget: Budget tracker instance.
         full_source: Optional full file source.
         model: Model ID.
         api_key: API key.
         api_url: API base URL.
+        cache: Optional LLM result cache.
+        system_prompt_tokens: Precomputed ``estimate_tokens(system_prompt)``;
+            computed here when omitted.
+        rate_limiter: Optional client-side rate limiter for API calls.
 
     Returns:
         List of validated findings for this file.
     """
     # Check budget
     user_msg = build_user_message(file_path, diff_text, full_source)
-    system_tokens = estimate_tokens(system_prompt)
+    if system_prompt_tokens is None:
+        system_prompt_tokens = estimate_tokens(system_prompt)
+    system_tokens = system_prompt_tokens
     user_tokens = estimate_tokens(user_msg)
     total_input = system_tokens + user_tokens
 
@@ -608,22 +1071,24 @@ def review_file(
         # fences, and instruction text around the diff content.  Measure this
         # with an empty diff so we subtract it from the per-chunk budget.
         wrapper_overhead = estimate_tokens(build_user_message(file_path, ""))
-        chunk_budget = max(BUDGET_PER_FILE - system_tokens - wrapper_overhead, 1000)
-        chunks = chunk_diff(diff_text, chunk_budget)
+        chunks = _chunk_for_review(
+            diff_text, BUDGET_PER_FILE - system_tokens - wrapper_overhead
+        )
         all_findings: List[Dict[str, Any]] = []
         file_input_used = 0  # cumulative input tokens for this file
         chunks_reviewed = 0
         file_had_skip = False
         for i, chunk in enumerate(chunks):
             # Include full source only in first chunk, and only if it fits
-            chunk_source = full_source if i == 0 else None
-            if chunk_source is not None:
-                tentative_msg = build_user_message(file_path, chunk, chunk_source)
-                if system_tokens + estimate_tokens(tentative_msg) > BUDGET_PER_FILE:
-                    # Full source too large — drop it to stay within per-file limit
-                    chunk_source = None
-            chunk_msg = build_user_message(file_path, chunk, chunk_source)
+            with_source = i == 0 and full_source is not None
+            chunk_msg = build_user_message(
+                file_path, chunk, full_source if with_source else None
+            )
             chunk_tokens = system_tokens + estimate_tokens(chunk_msg)
+            if with_source and chunk_tokens > BUDGET_PER_FILE:
+                # Full source too large — drop it to stay within per-file limit
+                chunk_msg = build_user_message(file_path, chunk)
+                chunk_tokens = system_tokens + estimate_tokens(chunk_msg)
             if chunk_tokens > BUDGET_PER_FILE:
                 logger.warning(
                     "Chunk %d for %s exceeds per-file budget (%d > %d), skipping",
@@ -631,6 +1096,13 @@ def review_file(
                 )
                 file_had_skip = True
                 continue
+            key = cache_key(system_prompt, chunk_msg, model) if cache else None
+            cached = cache.get(key) if cache else None
+            if cached is not None:
+                logger.info("Cache hit for %s chunk %d", file_path, i)
+                chunks_reviewed += 1
+                all_findings.extend(filter_excluded(cached, excluded))
+                continue
             # Enforce per-file cumulative limit
             if file_input_used + chunk_tokens > BUDGET_PER_FILE:
                 logger.warning(
@@ -638,58 +1110,203 @@ def review_file(
                     file_path, file_input_used, chunk_tokens, BUDGET_PER_FILE,
                 )
                 break
-            if not budget.can_review_file(chunk_tokens):
+            if not budget.reserve(chunk_tokens):
                 logger.warning(
                     "Budget exhausted, skipping remaining chunks for %s", file_path
                 )
                 file_had_skip = True
                 break
             try:
-                resp_text, actual_input, actual_output = call_anthropic_api(
+                resp_text, actual_input, actual_output, stop_reason = call_anthropic_api(
                     system_prompt,
                     chunk_msg,
                     model=model,
                     api_key=api_key,
                     api_url=api_url,
+                    rate_limiter=rate_limiter,
                 )
-                budget.record_chunk_usage(actual_input, actual_output)
-                file_input_used += actual_input
-                chunks_reviewed += 1
-                findings = parse_llm_response(resp_text)
-                findings = [validate_finding(f, file_path) for f in findings if isinstance(f, dict)]
-                findings = filter_excluded(findings, excluded)
-                all_findings.extend(findings)
             except RuntimeError as e:
+                budget.settle(chunk_tokens)
                 logger.error("API error reviewing %s chunk %d: %s", file_path, i, e)
+                continue
+            budget.settle(chunk_tokens, actual_input, actual_output)
+            file_input_used += actual_input
+            chunks_reviewed += 1
+            raw_findings, cacheable = _parse_response(resp_text, stop_reason)
+            findings = [
+                Finding.from_llm(f, file_path)
+                for f in raw_findings
+                if isinstance(f, dict)
+            ]
+            if cache and cacheable:
+                cache.put(key, [f.to_dict() for f in findings])
+            all_findings.extend(_findings_to_dicts(findings, excluded))
         if chunks_reviewed > 0:
             budget.record_file_reviewed()
         if file_had_skip and chunks_reviewed == 0:
             budget.record_skip()
         return all_findings
 
-    if not budget.can_review_file(total_input):
+    key = cache_key(system_prompt, user_msg, model) if cache else None
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        logger.info("Cache hit for %s", file_path)
+        budget.record_file_reviewed()
+        return filter_excluded(cached, excluded)
+
+    if not budget.reserve(total_input):
         logger.warning("Budget exhausted, skipping file: %s", file_path)
         budget.record_skip()
         return []
 
     try:
-        resp_text, actual_input, actual_output = call_anthropic_api(
+        resp_text, actual_input, actual_output, stop_reason = call_anthropic_api(
             system_prompt,
             user_msg,
             model=model,
             api_key=api_key,
             api_url=api_url,
+            rate_limiter=rate_limiter,
         )
-        budget.record_usage(actual_input, actual_output)
     except RuntimeError as e:
+        budget.settle(total_input)
         logger.error("API error reviewing %s: %s", file_path, e)
         return []
+    budget.settle(total_input, actual_input, actual_output)
+    budget.record_file_reviewed()
+
+    raw_findings, cacheable = _parse_response(resp_text, stop_reason)
+    findings = [
+        Finding.from_llm(f, file_path)
+        for f in raw_findings
+        if isinstance(f, dict)
+    ]
+    if cache and cacheable:
+        cache.put(key, [f.to_dict() for f in findings])
+    return _findings_to_dicts(findings, excluded)
+
+
+def _chunk_for_review(diff_text: str, available_tokens: int) -> List[str]:
+    """Split *diff_text* for review using a tile-aligned chunk budget.
+
+    The budget is rounded down to a multiple of :data:`CHUNK_TILE` (at
+    least one tile).  If that leaves a trailing chunk under half a tile,
+    one retry with the budget grown by :data:`CHUNK_TILE_STEP` is kept
+    when it stays within *available_tokens* and yields fewer chunks.
+    """
+    budget = max((available_tokens // CHUNK_TILE) * CHUNK_TILE, CHUNK_TILE)
+    chunks = chunk_diff(diff_text, budget)
+    if len(chunks) > 1 and estimate_tokens(chunks[-1]) < CHUNK_TILE // 2:
+        grown = budget + CHUNK_TILE_STEP
+        if grown <= available_tokens:
+            retry = chunk_diff(diff_text, grown)
+            if len(retry) < len(chunks):
+                chunks = retry
+    return chunks
+
+
+def review_batch(
+    files: List[Tuple[str, str, Optional[str]]],
+    system_prompt: str,
+    excluded: Dict[str, Set[int]],
+    budget: BudgetTracker,
+    *,
+    model: str = DEFAULT_MODEL,
+    api_key: Optional[str] = None,
+    api_url: Optional[str] = None,
+    cache: Optional[LLMCache] = None,
+    system_prompt_tokens: Optional[int] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> List[Dict[str, Any]]:
+    """Review several small files with a single LLM call.
 
-    findings = parse_llm_response(resp_text)
-    findings = [validate_finding(f, file_path) for f in findings if isinstance(f, dict)]
-    findings = filter_excluded(findings, excluded)
+    Findings are attributed to a file through their ``file`` field, which
+    must name one of the batched paths (``a/``/``b/`` prefixes are
+    tolerated).  Findings naming any other file are dropped.
 
-    return findings
+    Args:
+        files: ``(file_path, diff_text, full_source)`` tuples, as grouped
+            by :func:`pack_files`.
+        system_prompt: System prompt to use.
+        excluded: Mapping of file path to excluded lines from earlier stages.
+        budget: Budget tracker instance.
+        model: Model ID.
+        api_key: API key.
+        api_url: API base URL.
+        cache: Optional LLM result cache.
+        system_prompt_tokens: Precomputed ``estimate_tokens(system_prompt)``.
+        rate_limiter: Optional client-side rate limiter for API calls.
+
+    Returns:
+        List of validated findings for all files in the batch.
+    """
+    if system_prompt_tokens is None:
+        system_prompt_tokens = estimate_tokens(system_prompt)
+    paths = [fp for fp, _, _ in files]
+    user_msg = build_batch_user_message(files)
+
+    key = cache_key(system_prompt, user_msg, model) if cache else None
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        logger.info("Cache hit for batch %s", ", ".join(paths))
+        for _ in paths:
+            budget.record_file_reviewed()
+        return filter_excluded(cached, excluded)
+
+    total_input = system_prompt_tokens + estimate_tokens(user_msg)
+    if not budget.reserve(total_input):
+        logger.warning("Budget exhausted, skipping files: %s", ", ".join(paths))
+        for _ in paths:
+            budget.record_skip()
+        return []
+
+    try:
+        resp_text, actual_input, actual_output, stop_reason = call_anthropic_api(
+            system_prompt,
+            user_msg,
+            model=model,
+            api_key=api_key,
+            api_url=api_url,
+            rate_limiter=rate_limiter,
+        )
+    except RuntimeError as e:
+        budget.settle(total_input)
+        logger.error("API error reviewing batch %s: %s", ", ".join(paths), e)
+        return []
+    budget.settle(total_input, actual_input, actual_output)
+    for _ in paths:
+        budget.record_file_reviewed()
+
+    raw_findings, cacheable = _parse_response(resp_text, stop_reason)
+    findings: List[Finding] = []
+    for f in raw_findings:
+        if not isinstance(f, dict):
+            continue
+        file_path = _match_batch_path(f.get("file"), paths)
+        if file_path is None:
+            logger.warning(
+                "Dropping batch finding for unknown file %r", f.get("file")
+            )
+            continue
+        findings.append(Finding.from_llm(f, file_path))
+    if cache and cacheable:
+        cache.put(key, [f.to_dict() for f in findings])
+    return _findings_to_dicts(findings, excluded)
+
+
+def _match_batch_path(raw_file: Any, paths: List[str]) -> Optional[str]:
+    """Map the ``file`` value of a batched finding onto a batched path."""
+    if not isinstance(raw_file, str):
+        return None
+    candidate = raw_file.strip()
+    if candidate in paths:
+        return candidate
+    if candidate[:2] in ("a/", "b/") and candidate[2:] in paths:
+        return candidate[2:]
+    for path in paths:
+        if candidate.endswith("/" + path):
+            return path
+    return None
 
 
 def review_pr(
@@ -701,6 +1318,12 @@ def review_pr(
     model: str = DEFAULT_MODEL,
     api_key: Optional[str] = None,
     api_url: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cache_dir: Optional[str] = None,
+    batch_small_files: bool = True,
+    full_source_diff_threshold: int = FULL_SOURCE_DIFF_THRESHOLD,
+    rpm: Optional[int] = None,
+    tpm: Optional[int] = None,
 ) -> Tuple[List[Dict[str, Any]], dict]:
     """Review all files in a PR diff.
 
@@ -712,17 +1335,31 @@ def review_pr(
         model: Model ID.
         api_key: API key.
         api_url: API base URL.
+        max_concurrency: Maximum number of files reviewed in parallel.
+        cache_dir: Directory for the LLM result cache.  ``None`` disables
+            caching.
+        batch_small_files: Pack small files into shared API calls (see
+            :func:`pack_files`).
+        full_source_diff_threshold: Attach full source only to files whose
+            diff is at most this many estimated tokens.
+        rpm: Client-side requests-per-minute limit.  Learned from the
+            API's rate-limit headers when omitted.
+        tpm: Client-side input-tokens-per-minute limit.  Learned from the
+            API's rate-limit headers when omitted.
 
     Returns:
         Tuple of (all_findings, budget_summary).
     """
     system_prompt = build_system_prompt(has_compile_commands)
+    system_prompt_tokens = _system_prompt_tokens(has_compile_commands)
     excluded = load_exclude_findings(exclude_files or [])
     budget = BudgetTracker()
 
     parsed = parse_diff(diff_text)
-    all_findings: List[Dict[str, Any]] = []
 
+    # Filter cheaply on the calling thread so that only files which will
+    # actually hit the API occupy a worker slot.
+    diffs: List[Tuple[str, str]] = []
     for file_path, file_diff in sorted(parsed.items()):
         # Skip non-C++ files
         ext = Path(file_path).suffix.lower()
@@ -733,22 +1370,65 @@ def review_pr(
         if should_skip_file(file_path):
             continue
 
+        # Skip files whose added lines were all flagged by Stage 1/2;
+        # findings on those lines would be filtered out afterwards anyway.
+        added = file_diff.added_lines
+        if added and excluded.get(file_path, set()).issuperset(added):
+            logger.info("All changed lines of %s already flagged, skipping", file_path)
+            continue
+
         # Reconstruct diff text for this file
         file_diff_text = _reconstruct_file_diff(file_diff)
         if not file_diff_text.strip():
             continue
 
-        # Try to load full source
-        full_source = None
-        if source_dir:
-            source_path = Path(source_dir) / file_path
-            if source_path.exists():
-                try:
-                    full_source = source_path.read_text(encoding="utf-8", errors="replace")
-                except OSError:
-                    pass
-
-        findings = review_file(
+        diffs.append((file_path, file_diff_text))
+
+    # Load full sources up front and concurrently so slow or network
+    # filesystems cost roughly one read latency rather than one per file.
+    # Large diffs already carry enough context; skip their full source.
+    source_cache: Dict[str, Optional[str]] = {}
+    if source_dir and diffs:
+        wanted: List[str] = []
+        for fp, diff in diffs:
+            diff_tokens = estimate_tokens(diff)
+            if diff_tokens > full_source_diff_threshold:
+                logger.info(
+                    "Omitting full source for %s (diff ~%d tokens > %d)",
+                    fp, diff_tokens, full_source_diff_threshold,
+                )
+            else:
+                wanted.append(fp)
+        if wanted:
+            paths = [Path(source_dir) / fp for fp in wanted]
+            with ThreadPoolExecutor(max_workers=min(_SOURCE_READ_WORKERS, len(paths))) as pool:
+                source_cache = dict(zip(wanted, pool.map(_safe_read, paths)))
+
+    targets: List[Tuple[str, str, Optional[str]]] = [
+        (fp, diff, source_cache.get(fp)) for fp, diff in diffs
+    ]
+
+    if batch_small_files:
+        units = pack_files(targets, system_prompt_tokens)
+    else:
+        units = [[t] for t in targets]
+
+    def _review_unit(unit: List[Tuple[str, str, Optional[str]]]) -> List[Dict[str, Any]]:
+        if len(unit) > 1:
+            return review_batch(
+                unit,
+                system_prompt,
+                excluded,
+                budget,
+                model=model,
+                api_key=api_key,
+                api_url=api_url,
+                cache=cache,
+                system_prompt_tokens=system_prompt_tokens,
+                rate_limiter=rate_limiter,
+            )
+        file_path, file_diff_text, full_source = unit[0]
+        return review_file(
             file_path,
             file_diff_text,
             system_prompt,
@@ -758,12 +1438,44 @@ def review_pr(
             model=model,
             api_key=api_key,
             api_url=api_url,
+            cache=cache,
+            system_prompt_tokens=system_prompt_tokens,
+            rate_limiter=rate_limiter,
         )
+
+    # API calls are I/O bound (socket reads release the GIL), so units are
+    # reviewed on a small thread pool.  Findings are ordered by file path
+    # afterwards (stable, so per-file order is kept) and the output does
+    # not depend on which request finished first.
+    cache = LLMCache(cache_dir) if cache_dir and units else None
+    rate_limiter = RateLimiter(rpm=rpm, tpm=tpm)
+    workers = min(max_concurrency, len(units))
+    try:
+        if workers <= 1:
+            results = [_review_unit(u) for u in units]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_review_unit, units))
+    finally:
+        if cache:
+            cache.close()
+
+    all_findings: List[Dict[str, Any]] = []
+    for findings in results:
         all_findings.extend(findings)
+    all_findings.sort(key=lambda f: f["file"])
 
     return all_findings, budget.summary()
 
 
+def _safe_read(path: Path) -> Optional[str]:
+    """Read *path* as text, returning None if it is missing or unreadable."""
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+
+
 def _reconstruct_file_diff(file_diff) -> str:
     """Reconstruct a unified diff text from a FileDiff object.
 
@@ -850,6 +1562,42 @@ def main(argv: Optional[List[str]] = None) -> int:
         "--api-url",
         help="Anthropic API base URL override",
     )
+    parser.add_argument(
+        "--full-source-diff-threshold",
+        type=int,
+        default=FULL_SOURCE_DIFF_THRESHOLD,
+        help=(
+            "Only attach full source for files whose diff is at most this many "
+            f"estimated tokens (default: {FULL_SOURCE_DIFF_THRESHOLD})"
+        ),
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        help="Client-side requests-per-minute limit (default: learned from API headers)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        help="Client-side input-tokens-per-minute limit (default: learned from API headers)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum number of files reviewed in parallel (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache LLM results in this directory so unchanged diffs are not "
+        "re-reviewed (default: no cache)",
+    )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="Review every file with its own API call instead of packing small files",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -869,7 +1617,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         prompt = build_system_prompt(has_cc)
         print("=== System Prompt ===")
         print(prompt)
-        print(f"\n=== Prompt tokens (estimated): {estimate_tokens(prompt)} ===")
+        print(f"\n=== Prompt tokens (estimated): {_system_prompt_tokens(has_cc)} ===")
         return 0
 
     # Load diff
@@ -888,6 +1636,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         model=args.model,
         api_key=args.api_key,
         api_url=args.api_url,
+        max_concurrency=args.max_concurrency,
+        cache_dir=args.cache_dir,
+        batch_small_files=not args.no_batch,
+        full_source_diff_threshold=args.full_source_diff_threshold,
+        rpm=args.rpm,
+        tpm=args.tpm,
     )
 
     # Write output
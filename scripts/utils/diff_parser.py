@@ -22,7 +22,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 
 @dataclass
@@ -42,12 +42,23 @@ class FileDiff:
         }
 
 
+# A run of consecutive octal escapes; each escape is exactly 4 chars.
+_OCTAL_SEQ_RE = re.compile(r"(?:\\[0-3][0-7]{2})+")
+
+
+def _decode_octal_run(m: re.Match[str]) -> str:
+    """Decode a run of ``\\ooo`` escapes as one UTF-8 byte sequence."""
+    run = m.group(0)
+    raw = bytes(int(run[i + 1 : i + 4], 8) for i in range(0, len(run), 4))
+    return raw.decode("utf-8", errors="replace")
+
+
 def _decode_git_path(path: str) -> str:
     """Decode Git escape sequences in a path string.
 
     Git quotes paths containing non-ASCII or special characters.
     Octal escapes represent raw UTF-8 bytes, so consecutive sequences
-    must be collected into a bytearray and decoded together.
+    are decoded together as a single byte string.
 
     Args:
         path: Path string, possibly containing escape sequences.
@@ -62,30 +73,37 @@ def _decode_git_path(path: str) -> str:
     path = path.replace('\\"', '"')
     path = path.replace("\\t", "\t").replace("\\n", "\n")
 
-    parts: list[str] = []
-    pending_bytes = bytearray()
-    i = 0
-    while i < len(path):
-        m = re.match(r"\\([0-3][0-7]{2})", path[i:])
-        if m:
-            pending_bytes.append(int(m.group(1), 8))
-            i += len(m.group(0))
-        else:
-            if pending_bytes:
-                parts.append(pending_bytes.decode("utf-8", errors="replace"))
-                pending_bytes = bytearray()
-            parts.append(path[i])
-            i += 1
-    if pending_bytes:
-        parts.append(pending_bytes.decode("utf-8", errors="replace"))
-
-    path = "".join(parts)
+    path = _OCTAL_SEQ_RE.sub(_decode_octal_run, path)
     path = path.replace("\x00BACKSLASH\x00", "\\")
     return path
 
 
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of *text* one at a time, without line terminators.
+
+    Streams instead of materialising ``text.splitlines()``, so parsing a
+    large diff doesn't hold a second copy of it as a list of lines.  Lines
+    are split on ``\\n`` only (a trailing ``\\r`` is dropped); unlike
+    splitlines(), form feeds and other Unicode line breaks inside source
+    lines don't cut a diff line in two.
+    """
+    pos = 0
+    end = len(text)
+    while pos < end:
+        nl = text.find("\n", pos)
+        if nl == -1:
+            nl = end
+        line = text[pos:nl]
+        if line.endswith("\r"):
+            line = line[:-1]
+        yield line
+        pos = nl + 1
+
+
 # --- Regex patterns for parsing unified diff ---
-_DIFF_MARKER_RE = re.compile(r"^diff --git ")
+# "diff --git " file markers are detected with str.startswith, and the
+# hunk regex only runs on lines starting with "@@": both are rare, so
+# hunk body lines never pay for a regex call.
 _PLUS_HEADER_RE = re.compile(r'^\+\+\+ "?b/(.*?)"?$')
 _MINUS_HEADER_RE = re.compile(r"^--- ")
 _HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
@@ -119,14 +137,9 @@ def parse_diff(diff_text: str) -> Dict[str, FileDiff]:
         """Save the accumulated hunk to the current file's data."""
         nonlocal hunk_lines
         if current_file and hunk_lines and current_file in result:
-            # Calculate end line from hunk content
-            end_line = hunk_start
-            for hl in hunk_lines:
-                if hl.startswith("+") or hl.startswith(" ") or hl == "":
-                    end_line += 1
-            end_line -= 1  # last increment was one too many
-            if end_line < hunk_start:
-                end_line = hunk_start
+            # line_num has already been advanced past every added and
+            # context line of this hunk, so it is one past the end line.
+            end_line = max(line_num - 1, hunk_start)
 
             result[current_file].hunks.append(
                 {
@@ -138,9 +151,9 @@ def parse_diff(diff_text: str) -> Dict[str, FileDiff]:
             )
             hunk_lines = []
 
-    for raw_line in diff_text.splitlines():
+    for raw_line in _iter_lines(diff_text):
         # --- New file section ---
-        if _DIFF_MARKER_RE.match(raw_line):
+        if raw_line.startswith("diff --git "):
             _flush_hunk()
             current_file = None  # Reset so deleted files don't corrupt prior entry
             in_header = True
@@ -161,8 +174,7 @@ def parse_diff(diff_text: str) -> Dict[str, FileDiff]:
                 continue
 
         # --- Hunk header ---
-        m = _HUNK_RE.match(raw_line)
-        if m:
+        if raw_line.startswith("@@") and (m := _HUNK_RE.match(raw_line)):
             _flush_hunk()
             in_header = False
             in_hunk = True
@@ -174,22 +186,25 @@ def parse_diff(diff_text: str) -> Dict[str, FileDiff]:
 
         # --- Hunk body ---
         if in_hunk and current_file and current_file in result:
-            if raw_line.startswith("+"):
+            # Dispatch on the prefix character; additions and context
+            # lines dominate, so they are tested first.
+            c = raw_line[:1]
+            if c == "+":
                 # Added line — record with new-file line number
                 content = raw_line[1:]
                 result[current_file].added_lines[line_num] = content
                 hunk_lines.append(raw_line)
                 line_num += 1
-            elif raw_line.startswith("-"):
-                # Removed line — don't increment new-file line counter
-                hunk_lines.append(raw_line)
-            elif raw_line.startswith(" "):
+            elif c == " ":
                 # Context line — record content and advance new-file counter
                 content = raw_line[1:]
                 result[current_file].context_lines[line_num] = content
                 hunk_lines.append(raw_line)
                 line_num += 1
-            elif raw_line.startswith("\\"):
+            elif c == "-":
+                # Removed line — don't increment new-file line counter
+                hunk_lines.append(raw_line)
+            elif c == "\\":
                 # "\ No newline at end of file"
                 hunk_lines.append(raw_line)
             else:
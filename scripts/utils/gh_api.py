@@ -10,13 +10,26 @@ Used by:
 
 from __future__ import annotations
 
-import json
+import http.client
+import io
+import re
 import subprocess
 import sys
 import time
 import urllib.error
-import urllib.request
-from typing import Any, Dict, List, Optional, Union
+import urllib.parse
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from scripts.utils import json_io
+
+# Headers sent with every API request (plus Authorization per client).
+_BASE_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "Content-Type": "application/json",
+}
+
+# One entry of an RFC 8288 Link header: <url>; rel="next"
+_LINK_RE = re.compile(r'<([^>]*)>\s*;\s*rel="([^"]*)"')
 
 
 def get_pr_labels(pr_number: int) -> List[str]:
@@ -52,7 +65,10 @@ def get_pr_labels(pr_number: int) -> List[str]:
 class GitHubClient:
     """HTTP client for GitHub REST API (supports GHES and github.com).
 
-    Uses urllib to avoid external dependencies beyond the standard library.
+    Uses http.client to avoid external dependencies beyond the standard
+    library.  Requests reuse one keep-alive connection per client, so a
+    review run pays for a single TCP/TLS handshake instead of one per call.
+    A client is not safe to share between threads.
 
     Args:
         token: Personal access token for authentication.
@@ -70,6 +86,69 @@ class GitHubClient:
         self.token = token
         self.api_url = api_url.rstrip("/")
         self.max_retries = max_retries
+        self._headers = {**_BASE_HEADERS, "Authorization": f"token {token}"}
+
+        parts = urllib.parse.urlsplit(self.api_url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._base_path = parts.path
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def close(self) -> None:
+        """Close the pooled connection, if one is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        """Send one request over the pooled connection and read the body.
+
+        If sending on a reused connection fails because the server has
+        meanwhile closed it, the request is sent once more on a fresh
+        connection.  A failure while waiting for the response is raised
+        instead: the server may already have acted on the request, and a
+        resent POST could create a duplicate review.
+
+        Raises:
+            OSError, http.client.HTTPException: On network failures.
+        """
+        while True:
+            if self._conn is None:
+                if self._scheme == "https":
+                    self._conn = http.client.HTTPSConnection(
+                        self._host, self._port, timeout=60
+                    )
+                else:
+                    self._conn = http.client.HTTPConnection(
+                        self._host, self._port, timeout=60
+                    )
+            reused = self._conn.sock is not None
+            try:
+                self._conn.request(
+                    method, self._base_path + path, body=data, headers=headers
+                )
+                break
+            except (http.client.HTTPException, OSError):
+                self.close()
+                if not reused:
+                    raise
+
+        try:
+            resp = self._conn.getresponse()
+            resp_body = resp.read()
+        except (http.client.HTTPException, OSError):
+            self.close()
+            raise
+        if resp.will_close:
+            self.close()
+        return resp, resp_body
 
     def _request(
         self,
@@ -90,26 +169,37 @@ class GitHubClient:
         Raises:
             RuntimeError: If the request fails after retries.
         """
+        return self._request_with_headers(method, path, body)[0]
+
+    def _request_with_headers(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Union[Dict[str, Any], List[Any]], Any]:
+        """Like :meth:`_request`, but also return the response headers.
+
+        Returns:
+            ``(parsed_json, headers)``; ``headers`` is a mapping-like object
+            supporting ``get``.
+        """
         url = f"{self.api_url}{path}"
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json",
-        }
+        headers = self._headers
 
-        data = json.dumps(body).encode("utf-8") if body else None
+        data = json_io.dumps_bytes(body) if body else None
 
         last_error: Optional[Exception] = None
         for attempt in range(self.max_retries + 1):
             try:
-                req = urllib.request.Request(
-                    url, data=data, headers=headers, method=method
-                )
-                with urllib.request.urlopen(req, timeout=60) as resp:
-                    resp_body = resp.read().decode("utf-8")
-                    if resp_body:
-                        return json.loads(resp_body)
-                    return {}
+                resp, resp_body = self._send(method, path, data, headers)
+                if not 200 <= resp.status < 300:
+                    raise urllib.error.HTTPError(
+                        url, resp.status, resp.reason, resp.headers,
+                        io.BytesIO(resp_body),
+                    )
+                if resp_body:
+                    return json_io.loads(resp_body), resp.headers
+                return {}, resp.headers
             except urllib.error.HTTPError as e:
                 last_error = e
                 status = e.code
@@ -133,7 +223,7 @@ class GitHubClient:
                 raise RuntimeError(
                     f"GitHub API error {status} on {method} {path}: {error_body}"
                 ) from e
-            except (urllib.error.URLError, OSError) as e:
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
                 last_error = e
                 if attempt < self.max_retries:
                     wait = 2 ** (attempt + 1)
@@ -160,8 +250,11 @@ class GitHubClient:
     ) -> List[Any]:
         """Fetch all pages of a paginated GET endpoint.
 
-        Uses page-number pagination (``?per_page=N&page=P``) and stops when
-        an empty page is returned.
+        Follows the ``rel="next"`` URL of the ``Link`` response header, so
+        the last page is recognised without requesting an extra empty one.
+        If a response carries no ``Link`` header at all (e.g. stripped by a
+        proxy), falls back to page-number pagination
+        (``?per_page=N&page=P``), stopping at a short or empty page.
 
         Args:
             path: API path **without** query parameters.
@@ -173,18 +266,41 @@ class GitHubClient:
         all_items: List[Any] = []
         separator = "&" if "?" in path else "?"
         page = 1
-        while True:
-            paginated_path = f"{path}{separator}per_page={per_page}&page={page}"
-            result = self._request("GET", paginated_path)
+        paginated_path: Optional[str] = (
+            f"{path}{separator}per_page={per_page}&page={page}"
+        )
+        while paginated_path:
+            result, headers = self._request_with_headers("GET", paginated_path)
             if not isinstance(result, list) or len(result) == 0:
                 break
             all_items.extend(result)
-            if len(result) < per_page:
+            link = headers.get("Link") if headers is not None else None
+            if link:
+                paginated_path = self._next_page_path(link)
+            elif len(result) < per_page:
                 # Last page — no more results
                 break
-            page += 1
+            else:
+                page += 1
+                paginated_path = f"{path}{separator}per_page={per_page}&page={page}"
         return all_items
 
+    def _next_page_path(self, link_header: str) -> Optional[str]:
+        """Return the API path of the ``rel="next"`` link, or None.
+
+        Args:
+            link_header: Raw ``Link`` header, e.g.
+                ``<https://api.github.com/...?page=2>; rel="next", <...>; rel="last"``.
+        """
+        for m in _LINK_RE.finditer(link_header):
+            if "next" in m.group(2).split():
+                parts = urllib.parse.urlsplit(m.group(1))
+                path = parts.path
+                if self._base_path and path.startswith(self._base_path):
+                    path = path[len(self._base_path):]
+                return f"{path}?{parts.query}" if parts.query else path
+        return None
+
     def create_review(
         self,
         owner: str,
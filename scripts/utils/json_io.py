@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""JSON encode/decode helpers shared by the review pipeline scripts.
+
+Uses ``orjson`` when it is installed and falls back to the stdlib
+``json`` module otherwise.  For the payloads the stages actually write
+(lists of dicts with ``str`` keys and ``str``/``int``/``None`` values)
+both backends produce identical text (UTF-8, 2-space indent,
+``ensure_ascii=False``).  They are not interchangeable in general:
+orjson rejects non-``str`` dict keys and integers wider than 64 bits,
+and formats some floats differently.  Objects orjson refuses are
+encoded with ``json`` instead.  Compact bytes (:func:`dumps_bytes`) are
+used for GitHub API request bodies, where only JSON validity matters.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize *obj* as indented JSON text (2 spaces, non-ASCII kept)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize *obj* as compact UTF-8 JSON bytes (e.g. an HTTP body)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from *data* (``str`` or UTF-8 ``bytes``).
+
+    Raises:
+        ValueError: If *data* is not valid JSON (both backends raise a
+            ``ValueError`` subclass).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
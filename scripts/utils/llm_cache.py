@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""On-disk cache of Stage 3 LLM review results.
+
+Maps a hash of ``(system_prompt, user_message, model)`` to the validated
+findings produced for that request, so re-running Stage 3 on an unchanged
+PR (or resuming after a crash) skips the API call entirely.  Backed by a
+single SQLite table; any database error degrades to a cache miss.  Entries
+expire after ``max_age`` seconds and are pruned when the cache is opened.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached value layout changes so stale rows are ignored.
+_CACHE_VERSION = 1
+
+_DB_NAME = f"stage3-llm-v{_CACHE_VERSION}.sqlite3"
+
+# Default entry lifetime: long enough to cover re-runs of an open PR.
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def cache_key(system_prompt: str, user_message: str, model: str) -> str:
+    """Return the cache key for a single API request."""
+    raw = f"{system_prompt}\0{user_message}\0{model}".encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed findings cache shared by all Stage 3 worker threads.
+
+    Callers should only :meth:`put` findings from complete, successfully
+    parsed responses; anything stored is served until it expires.
+
+    Usage:
+        cache = LLMCache(cache_dir)
+        key = cache_key(system_prompt, user_msg, model)
+        findings = cache.get(key)
+        if findings is None:
+            # ... call API, parse, validate ...
+            cache.put(key, findings)
+
+    Args:
+        cache_dir: Directory holding the SQLite database.
+        max_age: Seconds after which an entry is treated as a miss and
+            pruned.
+        clock: Wall-clock time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_age: float = DEFAULT_MAX_AGE,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(cache_dir) / _DB_NAME
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS findings ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "DELETE FROM findings WHERE created_at < ?",
+                (clock() - max_age,),
+            )
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("LLM cache disabled (%s): %s", self.path, e)
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached findings for *key*, or None on a miss or expired entry."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM findings WHERE key = ? AND created_at >= ?",
+                    (key, self._clock() - self.max_age),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+        if row is None:
+            return None
+        try:
+            value = json.loads(row[0])
+        except (TypeError, ValueError):
+            return None
+        return value if isinstance(value, list) else None
+
+    def put(self, key: str, findings: List[Dict[str, Any]]) -> None:
+        """Store *findings* under *key*, replacing any previous entry."""
+        if self._conn is None:
+            return
+        value = json.dumps(findings, ensure_ascii=False).encode("utf-8")
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO findings (key, value, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, value, self._clock()),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
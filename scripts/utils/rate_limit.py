@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Client-side rate limiting for Anthropic API calls.
+
+Stage 3 reviews files concurrently, which makes it easy to run into the
+per-minute request (RPM) and input-token (TPM) limits and then lose time
+in 429 backoff.  :class:`RateLimiter` paces requests up front with one
+token bucket per dimension.  Buckets can be sized from CLI flags and are
+re-tuned from the ``anthropic-ratelimit-*`` headers of every response, so
+the limiter follows whatever tier the API key actually has.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Response headers describing the per-minute limits.  Input-token headers
+# are preferred over the combined token headers when both are present.
+_REQUESTS_LIMIT = "anthropic-ratelimit-requests-limit"
+_REQUESTS_REMAINING = "anthropic-ratelimit-requests-remaining"
+_TOKEN_HEADER_PREFIXES = (
+    "anthropic-ratelimit-input-tokens",
+    "anthropic-ratelimit-tokens",
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens and refills at ``refill_rate`` tokens
+    per second.  :meth:`acquire` blocks until the requested amount is
+    available.
+
+    Args:
+        capacity: Maximum number of stored tokens.
+        refill_rate: Tokens added per second.
+        clock: Monotonic time source (injectable for tests).
+        sleep: Sleep function (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take *amount* tokens, sleeping until they are available.
+
+        Requests larger than the bucket are clamped to its capacity so
+        they wait for a full bucket rather than forever.
+
+        Returns:
+            Total seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                needed = min(float(amount), self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= needed
+                    return waited
+                if self.refill_rate <= 0:
+                    # Nothing will ever refill; don't block forever.
+                    self._tokens = 0.0
+                    return waited
+                delay = (needed - self._tokens) / self.refill_rate
+            self._sleep(delay)
+            waited += delay
+
+    def reconfigure(
+        self,
+        capacity: float,
+        refill_rate: float,
+        available: Optional[float] = None,
+    ) -> None:
+        """Update the bucket size and rate, optionally capping stored tokens."""
+        with self._lock:
+            self._refill()
+            self.capacity = float(capacity)
+            self.refill_rate = float(refill_rate)
+            self._tokens = min(self._tokens, self.capacity)
+            if available is not None:
+                self._tokens = min(self._tokens, float(available))
+
+
+class RateLimiter:
+    """Paces API calls by requests per minute and input tokens per minute.
+
+    A dimension without a configured limit is unlimited until a response
+    header reports one.
+
+    Usage:
+        limiter = RateLimiter(rpm=50, tpm=40_000)
+        limiter.acquire(estimated_input_tokens)
+        # ... make the request ...
+        limiter.update_from_headers(resp.headers)
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.requests = self._bucket(rpm)
+        self.tokens = self._bucket(tpm)
+
+    def _bucket(self, per_minute: Optional[int]) -> Optional[TokenBucket]:
+        if not per_minute or per_minute <= 0:
+            return None
+        return TokenBucket(
+            per_minute, per_minute / 60.0, clock=self._clock, sleep=self._sleep
+        )
+
+    def acquire(self, tokens: int) -> float:
+        """Wait for one request slot and *tokens* input tokens.
+
+        Returns:
+            Total seconds spent waiting.
+        """
+        waited = 0.0
+        if self.requests is not None:
+            waited += self.requests.acquire(1)
+        if self.tokens is not None:
+            waited += self.tokens.acquire(tokens)
+        return waited
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Re-tune both buckets from ``anthropic-ratelimit-*`` headers.
+
+        Args:
+            headers: Mapping-like object with a ``get`` method (e.g. the
+                ``headers`` of an HTTP response or ``HTTPError``).
+        """
+        if headers is None:
+            return
+        req_limit = _header_int(headers, _REQUESTS_LIMIT)
+        if req_limit:
+            self._retune(
+                "requests", req_limit, _header_int(headers, _REQUESTS_REMAINING)
+            )
+        for prefix in _TOKEN_HEADER_PREFIXES:
+            tok_limit = _header_int(headers, f"{prefix}-limit")
+            if tok_limit:
+                self._retune(
+                    "tokens", tok_limit, _header_int(headers, f"{prefix}-remaining")
+                )
+                break
+
+    def _retune(self, attr: str, limit: int, remaining: Optional[int]) -> None:
+        with self._lock:
+            bucket = getattr(self, attr)
+            if bucket is None:
+                bucket = TokenBucket(
+                    limit, limit / 60.0, clock=self._clock, sleep=self._sleep
+                )
+                setattr(self, attr, bucket)
+            bucket.reconfigure(limit, limit / 60.0, remaining)
+
+
+def _header_int(headers: Any, name: str) -> Optional[int]:
+    """Return header *name* as an int, or None if missing or malformed."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return int(value.strip())
+    except ValueError:
+        return None
@@ -14,7 +14,8 @@ Budget constants:
 from __future__ import annotations
 
 import re
-from typing import List
+import threading
+from typing import List, Tuple
 
 # ---------------------------------------------------------------------------
 # Budget constants
@@ -24,24 +25,35 @@ BUDGET_PER_PR: int = 100_000  # max input tokens per PR
 BUDGET_PER_FILE: int = 20_000  # max input tokens per file
 COST_LIMIT_PER_PR: float = 2.00  # max USD per PR
 
-# Approximate input token cost for claude-sonnet-4-5 ($3 per 1M input tokens).
-_INPUT_COST_PER_TOKEN: float = 3.0 / 1_000_000
+# Approximate input token cost for claude-sonnet-4-5 ($3 per 1M input tokens),
+# in integer micro-USD so BudgetTracker can accumulate cost exactly.
+_INPUT_COST_MICRO_PER_TOKEN: int = 3
 # Approximate output token cost ($15 per 1M output tokens).
-_OUTPUT_COST_PER_TOKEN: float = 15.0 / 1_000_000
+_OUTPUT_COST_MICRO_PER_TOKEN: int = 15
+_MICRO_PER_USD: int = 1_000_000
+_INPUT_COST_PER_TOKEN: float = _INPUT_COST_MICRO_PER_TOKEN / _MICRO_PER_USD
+_OUTPUT_COST_PER_TOKEN: float = _OUTPUT_COST_MICRO_PER_TOKEN / _MICRO_PER_USD
 # Assumed average output tokens per file review call.
 _ESTIMATED_OUTPUT_PER_FILE: int = 1_000
 # Worst-case output tokens (matches DEFAULT_MAX_TOKENS in stage3_llm_reviewer).
 _MAX_OUTPUT_PER_CALL: int = 4_096
 
-# Skip patterns for files that should never reach Stage 3.
-_SKIP_PATTERNS = [
-    r"(^|/)ThirdParty/",
-    r"\.(generated|gen)\.",
-    r"\.generated\.h$",
-    r"\.pb\.(h|cc)$",
-    r"(^|/)Intermediate/",
-]
-_SKIP_RE = [re.compile(p, re.IGNORECASE) for p in _SKIP_PATTERNS]
+# Skip rules for files that should never reach Stage 3, matched
+# case-insensitively with plain string checks (no regex needed):
+#   - a path component named ThirdParty/ or Intermediate/
+#   - a .generated. / .gen. infix (covers *.generated.h)
+#   - protobuf output (*.pb.h, *.pb.cc)
+_SKIP_DIRS = ("thirdparty/", "intermediate/")
+_SKIP_NESTED_DIRS = tuple("/" + d for d in _SKIP_DIRS)
+_SKIP_INFIXES = (".generated.", ".gen.")
+# Every needle that may appear anywhere in the path, checked in one loop.
+_SKIP_SUBSTRINGS = _SKIP_NESTED_DIRS + _SKIP_INFIXES
+_SKIP_SUFFIXES = (".pb.h", ".pb.cc")
+
+# Hunk header patterns used when splitting oversized diffs.
+_HUNK_SPLIT_RE = re.compile(r"^@@\s.*?@@", re.MULTILINE)
+_HUNK_HDR_PARSE_RE = re.compile(r"@@\s+-(\d+)(?:,\d+)?\s+\+(\d+)(?:,\d+)?\s+@@")
+_HUNK_HDR_ANNOT_RE = re.compile(r"@@\s[^@]*@@(.*)")
 
 
 def estimate_tokens(text: str) -> int:
@@ -72,6 +84,14 @@ def estimate_cost(input_tokens: int, output_tokens: int = _ESTIMATED_OUTPUT_PER_
     return (input_tokens * _INPUT_COST_PER_TOKEN) + (output_tokens * _OUTPUT_COST_PER_TOKEN)
 
 
+def _cost_micro(input_tokens: int, output_tokens: int) -> int:
+    """Exact cost of an API call in integer micro-USD."""
+    return (
+        input_tokens * _INPUT_COST_MICRO_PER_TOKEN
+        + output_tokens * _OUTPUT_COST_MICRO_PER_TOKEN
+    )
+
+
 def should_skip_file(file_path: str) -> bool:
     """Check if a file should be skipped by Stage 3.
 
@@ -84,8 +104,11 @@ def should_skip_file(file_path: str) -> bool:
     Returns:
         True if the file should be skipped.
     """
-    for pattern in _SKIP_RE:
-        if pattern.search(file_path):
+    low = file_path.lower()
+    if low.startswith(_SKIP_DIRS) or low.endswith(_SKIP_SUFFIXES):
+        return True
+    for needle in _SKIP_SUBSTRINGS:
+        if needle in low:
             return True
     return False
 
@@ -106,21 +129,13 @@ def chunk_diff(file_diff: str, max_tokens: int = BUDGET_PER_FILE) -> List[str]:
     if estimate_tokens(file_diff) <= max_tokens:
         return [file_diff]
 
-    # Split by hunk headers (@@ ... @@)
-    hunk_pattern = re.compile(r"^(@@\s.*?@@.*)", re.MULTILINE)
-    parts = hunk_pattern.split(file_diff)
-
-    # parts[0] is the diff header (before first @@).
-    # Then alternating: hunk_header, hunk_content, hunk_header, hunk_content ...
-    header = parts[0] if parts else ""
-    hunks: List[str] = []
-
-    i = 1
-    while i < len(parts):
-        hunk_header = parts[i]
-        hunk_body = parts[i + 1] if i + 1 < len(parts) else ""
-        hunks.append(hunk_header + hunk_body)
-        i += 2
+    # Split by hunk headers (@@ ... @@).  Each hunk is sliced straight out
+    # of file_diff from its header to the next one; everything before the
+    # first @@ is the diff header.
+    starts = [m.start() for m in _HUNK_SPLIT_RE.finditer(file_diff)]
+    header = file_diff[: starts[0]] if starts else file_diff
+    ends = starts[1:] + [len(file_diff)]
+    hunks: List[str] = [file_diff[s:e] for s, e in zip(starts, ends)]
 
     if not hunks:
         # No hunk headers found — split by lines as fallback.
@@ -146,10 +161,7 @@ def chunk_diff(file_diff: str, max_tokens: int = BUDGET_PER_FILE) -> List[str]:
                     hunk_body = ""
 
                 # Parse original start lines from @@ header.
-                hdr_match = re.match(
-                    r"@@\s+-(\d+)(?:,\d+)?\s+\+(\d+)(?:,\d+)?\s+@@",
-                    hunk_hdr_line,
-                )
+                hdr_match = _HUNK_HDR_PARSE_RE.match(hunk_hdr_line)
                 old_start = int(hdr_match.group(1)) if hdr_match else 1
                 new_start = int(hdr_match.group(2)) if hdr_match else 1
 
@@ -160,22 +172,17 @@ def chunk_diff(file_diff: str, max_tokens: int = BUDGET_PER_FILE) -> List[str]:
                 sub_chunks = _split_by_lines(hunk_body, body_budget)
 
                 # Rewrite @@ header per sub-chunk with correct line ranges.
+                # Each sub-chunk is scanned once: the same counts size its
+                # header and advance the start lines for the next one.
+                annotation = _hunk_annotation(hunk_hdr_line)
                 for sc in sub_chunks:
-                    new_hdr = _rewrite_hunk_header(
-                        hunk_hdr_line, old_start, new_start, sc,
+                    old_len, new_len = _count_hunk_lines(sc)
+                    chunks.append(
+                        f"{header}@@ -{old_start},{old_len} "
+                        f"+{new_start},{new_len} @@{annotation}\n{sc}"
                     )
-                    chunks.append(header + new_hdr + "\n" + sc)
-                    # Advance start lines for the next sub-chunk.
-                    for ln in sc.split("\n"):
-                        if _is_diff_meta_line(ln):
-                            continue
-                        if ln.startswith("+"):
-                            new_start += 1
-                        elif ln.startswith("-"):
-                            old_start += 1
-                        elif ln:
-                            old_start += 1
-                            new_start += 1
+                    old_start += old_len
+                    new_start += new_len
                 current = header
             else:
                 current = header + hunk
@@ -198,19 +205,12 @@ def _is_diff_meta_line(line: str) -> bool:
     return line.startswith("\\")
 
 
-def _rewrite_hunk_header(
-    original_header: str,
-    old_start: int,
-    new_start: int,
-    body: str,
-) -> str:
-    """Rewrite a ``@@ ... @@`` header to match *body*'s actual line counts.
+def _count_hunk_lines(body: str) -> Tuple[int, int]:
+    """Return ``(old_len, new_len)`` line counts for a hunk *body*.
 
-    Counts context / addition / deletion lines in *body* and produces
-    ``@@ -old_start,old_len +new_start,new_len @@`` (preserving any
-    trailing function-name annotation from the original header).
-
-    Diff meta-lines (e.g. ``\\ No newline at end of file``) are skipped.
+    Context lines count toward both sides, ``-`` lines toward the old
+    side and ``+`` lines toward the new side.  Diff meta-lines (e.g.
+    ``\\ No newline at end of file``) and empty lines are skipped.
     """
     old_len = 0
     new_len = 0
@@ -226,11 +226,31 @@ def _rewrite_hunk_header(
             if ln:  # skip truly empty trailing lines
                 old_len += 1
                 new_len += 1
+    return old_len, new_len
+
 
-    # Preserve trailing annotation after the closing @@, e.g. " funcName"
-    m = re.match(r"@@\s[^@]*@@(.*)", original_header)
-    annotation = m.group(1) if m else ""
+def _hunk_annotation(header: str) -> str:
+    """Return the trailing text after a header's closing ``@@``, if any."""
+    m = _HUNK_HDR_ANNOT_RE.match(header)
+    return m.group(1) if m else ""
+
+
+def _rewrite_hunk_header(
+    original_header: str,
+    old_start: int,
+    new_start: int,
+    body: str,
+) -> str:
+    """Rewrite a ``@@ ... @@`` header to match *body*'s actual line counts.
 
+    Counts context / addition / deletion lines in *body* and produces
+    ``@@ -old_start,old_len +new_start,new_len @@`` (preserving any
+    trailing function-name annotation from the original header).
+
+    Diff meta-lines (e.g. ``\\ No newline at end of file``) are skipped.
+    """
+    old_len, new_len = _count_hunk_lines(body)
+    annotation = _hunk_annotation(original_header)
     return f"@@ -{old_start},{old_len} +{new_start},{new_len} @@{annotation}"
 
 
@@ -278,11 +298,23 @@ def _split_by_lines(text: str, max_tokens: int) -> List[str]:
 class BudgetTracker:
     """Tracks cumulative token usage and cost across a PR review session.
 
+    All methods are guarded by an internal lock so a single tracker can be
+    shared by the worker threads that review files concurrently.  Cost is
+    accumulated as integer micro-USD (``total_cost_micro``) so many small
+    calls don't drift through float rounding; ``total_cost`` is the USD
+    view of it.
+
+    Concurrent callers must use :meth:`reserve` rather than
+    :meth:`can_review_file`: the check and the reservation happen under
+    one lock acquisition, so in-flight calls count against the limits and
+    workers cannot all pass the check before any of them records usage.
+
     Usage:
         tracker = BudgetTracker()
-        if tracker.can_review_file(estimated_tokens):
+        if tracker.reserve(estimated_tokens):
             # ... call API ...
-            tracker.record_usage(input_tokens, output_tokens)
+            tracker.settle(estimated_tokens, input_tokens, output_tokens)
+            tracker.record_file_reviewed()
         else:
             # skip file — budget exhausted
     """
@@ -296,9 +328,18 @@ class BudgetTracker:
         self.max_cost = max_cost
         self.total_input_tokens = 0
         self.total_output_tokens = 0
-        self.total_cost = 0.0
+        self.total_cost_micro = 0
         self.files_reviewed = 0
         self.files_skipped_budget = 0
+        # Input tokens and call count held by reserve() until settle().
+        self._reserved_input_tokens = 0
+        self._reserved_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_cost(self) -> float:
+        """Cumulative cost in USD."""
+        return self.total_cost_micro / _MICRO_PER_USD
 
     def can_review_file(self, estimated_input_tokens: int) -> bool:
         """Check if there is enough budget remaining to review a file.
@@ -313,14 +354,62 @@ class BudgetTracker:
         Returns:
             True if the file can be reviewed within budget.
         """
-        if self.total_input_tokens + estimated_input_tokens > self.max_tokens:
+        with self._lock:
+            return self._fits(estimated_input_tokens)
+
+    def _fits(self, estimated_input_tokens: int) -> bool:
+        """Budget check shared by can_review_file and reserve; caller holds the lock."""
+        input_tokens = self._reserved_input_tokens + estimated_input_tokens
+        if self.total_input_tokens + input_tokens > self.max_tokens:
             return False
-        estimated_cost = self.total_cost + estimate_cost(
-            estimated_input_tokens, _MAX_OUTPUT_PER_CALL
+        estimated_cost_micro = self.total_cost_micro + _cost_micro(
+            input_tokens, (self._reserved_calls + 1) * _MAX_OUTPUT_PER_CALL
         )
-        if estimated_cost > self.max_cost:
-            return False
-        return True
+        return estimated_cost_micro <= self.max_cost * _MICRO_PER_USD
+
+    def reserve(self, estimated_input_tokens: int) -> bool:
+        """Atomically check the budget and hold it for one API call.
+
+        The reservation covers *estimated_input_tokens* and the worst-case
+        output cost, and counts against later checks until :meth:`settle`
+        releases it.
+
+        Args:
+            estimated_input_tokens: Estimated input tokens for the call.
+
+        Returns:
+            True if the call fits and was reserved; False if it would
+            exceed the budget (nothing is reserved).
+        """
+        with self._lock:
+            if not self._fits(estimated_input_tokens):
+                return False
+            self._reserved_input_tokens += estimated_input_tokens
+            self._reserved_calls += 1
+            return True
+
+    def settle(
+        self,
+        estimated_input_tokens: int,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """Release a :meth:`reserve` hold and record the call's actual usage.
+
+        Like :meth:`record_chunk_usage`, this does not count a reviewed
+        file.  Call it with no usage when the request failed.
+
+        Args:
+            estimated_input_tokens: The amount passed to :meth:`reserve`.
+            input_tokens: Actual input tokens used.
+            output_tokens: Actual output tokens used.
+        """
+        with self._lock:
+            self._reserved_input_tokens -= estimated_input_tokens
+            self._reserved_calls -= 1
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cost_micro += _cost_micro(input_tokens, output_tokens)
 
     def record_usage(self, input_tokens: int, output_tokens: int) -> None:
         """Record actual token usage after an API call.
@@ -333,10 +422,11 @@ class BudgetTracker:
             input_tokens: Actual input tokens used.
             output_tokens: Actual output tokens used.
         """
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.total_cost += estimate_cost(input_tokens, output_tokens)
-        self.files_reviewed += 1
+        with self._lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cost_micro += _cost_micro(input_tokens, output_tokens)
+            self.files_reviewed += 1
 
     def record_chunk_usage(self, input_tokens: int, output_tokens: int) -> None:
         """Record token usage for a single chunk without incrementing file count.
@@ -345,26 +435,30 @@ class BudgetTracker:
             input_tokens: Actual input tokens used.
             output_tokens: Actual output tokens used.
         """
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.total_cost += estimate_cost(input_tokens, output_tokens)
+        with self._lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cost_micro += _cost_micro(input_tokens, output_tokens)
 
     def record_file_reviewed(self) -> None:
         """Increment the file-reviewed counter by one."""
-        self.files_reviewed += 1
+        with self._lock:
+            self.files_reviewed += 1
 
     def record_skip(self) -> None:
         """Record that a file was skipped due to budget exhaustion."""
-        self.files_skipped_budget += 1
+        with self._lock:
+            self.files_skipped_budget += 1
 
     def summary(self) -> dict:
         """Return a summary dict of budget usage."""
-        return {
-            "total_input_tokens": self.total_input_tokens,
-            "total_output_tokens": self.total_output_tokens,
-            "total_cost_usd": round(self.total_cost, 4),
-            "files_reviewed": self.files_reviewed,
-            "files_skipped_budget": self.files_skipped_budget,
-            "budget_remaining_tokens": self.max_tokens - self.total_input_tokens,
-            "budget_remaining_usd": round(self.max_cost - self.total_cost, 4),
-        }
+        with self._lock:
+            return {
+                "total_input_tokens": self.total_input_tokens,
+                "total_output_tokens": self.total_output_tokens,
+                "total_cost_usd": round(self.total_cost, 4),
+                "files_reviewed": self.files_reviewed,
+                "files_skipped_budget": self.files_skipped_budget,
+                "budget_remaining_tokens": self.max_tokens - self.total_input_tokens,
+                "budget_remaining_usd": round(self.max_cost - self.total_cost, 4),
+            }
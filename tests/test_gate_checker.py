@@ -17,7 +17,6 @@ import textwrap
 from pathlib import Path
 
 import pytest
-import yaml
 
 # Adjust path so we can import from scripts/
 import sys
@@ -29,7 +28,9 @@ from scripts.gate_checker import (
     determine_allowed_stages,
     filter_files,
     load_config,
+    main,
     parse_diff_files,
+    parse_diff_files_bytes,
     run_gate_check,
 )
 
@@ -43,8 +44,19 @@ CONFIG_PATH = Path(__file__).resolve().parent.parent / "configs" / "gate_config.
 
 def _load_test_config():
     """Load the real gate_config.yml for integration tests."""
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_config(str(CONFIG_PATH))
+
+
+@pytest.fixture(scope="session")
+def sample_diff_bytes():
+    """Raw sample_diff.patch, read once per session."""
+    return (FIXTURES_DIR / "sample_diff.patch").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def sample_diff_text(sample_diff_bytes):
+    """sample_diff.patch decoded as UTF-8."""
+    return sample_diff_bytes.decode("utf-8")
 
 
 def _make_diff_header(filepath: str) -> str:
@@ -54,18 +66,18 @@ def _make_diff_header(filepath: str) -> str:
 
 def _make_diff(filepaths: list[str]) -> str:
     """Generate a minimal unified diff with multiple files."""
-    lines = []
-    for fp in filepaths:
-        lines.append(f"diff --git a/{fp} b/{fp}")
-        lines.append("new file mode 100644")
-        lines.append("index 0000000..1234567")
-        lines.append(f"--- /dev/null")
-        lines.append(f"+++ b/{fp}")
-        lines.append("@@ -0,0 +1,3 @@")
-        lines.append("+// content")
-        lines.append("+void Foo() {}")
-        lines.append("+")
-    return "\n".join(lines)
+    return "\n".join([
+        f"diff --git a/{fp} b/{fp}\n"
+        "new file mode 100644\n"
+        "index 0000000..1234567\n"
+        "--- /dev/null\n"
+        f"+++ b/{fp}\n"
+        "@@ -0,0 +1,3 @@\n"
+        "+// content\n"
+        "+void Foo() {}\n"
+        "+"
+        for fp in filepaths
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -158,6 +170,20 @@ class TestParseDiffFiles:
         files = parse_diff_files(diff)
         assert files == ['Source/foo"bar.cpp']
 
+    @pytest.mark.parametrize(
+        "quoted, expected",
+        [
+            ("Source/tab\\there.cpp", "Source/tab\there.cpp"),
+            ("Source/back\\\\slash.cpp", "Source/back\\slash.cpp"),
+            ("Source/bell\\a.cpp", "Source/bell\a.cpp"),
+            # Not a Git escape: the backslash is kept literally.
+            ("Source/odd\\q.cpp", "Source/odd\\q.cpp"),
+        ],
+    )
+    def test_quoted_path_c_escapes(self, quoted, expected):
+        diff = f'diff --git "a/{quoted}" "b/{quoted}"\n+++ "b/{quoted}"'
+        assert parse_diff_files(diff) == [expected]
+
     def test_binary_file_detection(self):
         """Binary files are detected via 'Binary files ... and b/path differ'."""
         diff = textwrap.dedent("""\
@@ -237,10 +263,35 @@ class TestParseDiffFiles:
     def test_empty_diff(self):
         assert parse_diff_files("") == []
 
-    def test_fixture_diff(self):
+    def test_text_before_first_diff_ignored(self):
+        """Preamble (e.g. a format-patch commit message) is not a header."""
+        diff = "Subject: tweak\n+++ b/Preamble.cpp\n" + _make_diff(["Source/A.cpp"])
+        assert parse_diff_files(diff) == ["Source/A.cpp"]
+
+    def test_crlf_line_endings(self):
+        diff = _make_diff(["Source/A.cpp", "Source/B.h"]).replace("\n", "\r\n")
+        assert parse_diff_files(diff) == ["Source/A.cpp", "Source/B.h"]
+
+    def test_bytes_matches_text_on_fixture(self, sample_diff_bytes, sample_diff_text):
+        assert parse_diff_files_bytes(sample_diff_bytes) == parse_diff_files(
+            sample_diff_text
+        )
+
+    def test_bytes_invalid_utf8_only_in_body(self):
+        raw = (
+            b"diff --git a/Source/A.cpp b/Source/A.cpp\n"
+            b"--- a/Source/A.cpp\n"
+            b"+++ b/Source/A.cpp\n"
+            b"@@ -1 +1 @@\n"
+            b"-// \xc7\xd1\xb1\xdb\n"
+            b"+// new\n"
+        )
+        assert parse_diff_files_bytes(raw) == ["Source/A.cpp"]
+        assert run_gate_check(raw, _load_test_config())["reviewable_count"] == 1
+
+    def test_fixture_diff(self, sample_diff_text):
         """Parse the sample_diff.patch fixture."""
-        diff_text = (FIXTURES_DIR / "sample_diff.patch").read_text(encoding="utf-8")
-        files = parse_diff_files(diff_text)
+        files = parse_diff_files(sample_diff_text)
         assert len(files) == 10
         assert "Source/MyGame/Actors/MyActor.cpp" in files
         assert "ThirdParty/protobuf/src/google/protobuf/message.cc" in files
@@ -322,6 +373,54 @@ class TestFilterFiles:
         assert reviewable == []
         assert len(skipped) == 1
 
+    def test_extension_taken_from_file_name_only(self):
+        files = ["Source/My.Module/README", "Source/.clang-format", "Source/A.H"]
+        reviewable, skipped = filter_files(files, self.skip_patterns)
+        assert reviewable == ["Source/A.H"]
+        assert [s["reason"] for s in skipped] == [
+            "C++ 파일이 아님: (확장자 없음)",
+            "C++ 파일이 아님: (확장자 없음)",
+        ]
+
+    def test_reason_is_first_pattern_in_config_order(self):
+        """A later pattern matching earlier in the path must not win."""
+        files = ["Binaries/ThirdParty/lib.h"]
+        _, skipped = filter_files(files, ["ThirdParty/", "Binaries/"])
+        assert skipped[0]["reason"] == "경로 필터: ThirdParty/"
+
+    def test_patterns_with_groups(self):
+        patterns = [r"(Gen)/", r"(\w+)\.\1\.h$"]
+        files = ["Source/A.A.h", "Source/A.B.h", "Gen/X.cpp"]
+        reviewable, skipped = filter_files(files, patterns)
+        assert reviewable == ["Source/A.B.h"]
+        assert [s["file"] for s in skipped] == ["Source/A.A.h", "Gen/X.cpp"]
+
+    def test_skip_patterns_compiled_once(self):
+        from scripts.gate_checker import _compile_skip_patterns
+
+        patterns = ["CompileOnce/", r"\.once$"]
+        filter_files(["CompileOnce/a.h"], patterns)
+        hits = _compile_skip_patterns.cache_info().hits
+        _, skipped = filter_files(["b.once"], list(patterns))
+        assert _compile_skip_patterns.cache_info().hits == hits + 1
+        assert skipped[0]["reason"] == "경로 필터: \\.once$"
+
+    def test_skipped_entries_share_reason_strings(self):
+        files = [f"Plugins/ThirdParty/lib{i}.h" for i in range(3)] + ["a.txt", "b.txt"]
+        _, skipped = filter_files(files, ["ThirdParty/"])
+        reasons = [s["reason"] for s in skipped]
+        assert reasons[0] is reasons[1] is reasons[2]
+        assert reasons[3] is reasons[4]
+        assert reasons[3] == "C++ 파일이 아님: .txt"
+
+    def test_invalid_pattern_ignored(self, capsys):
+        reviewable, skipped = filter_files(
+            ["ThirdParty/x.h", "Source/A.cpp"], ["[unclosed", "ThirdParty/"]
+        )
+        assert reviewable == ["Source/A.cpp"]
+        assert len(skipped) == 1
+        assert "Invalid skip pattern" in capsys.readouterr().err
+
 
 # ---------------------------------------------------------------------------
 # Unit Tests: classify_pr
@@ -529,11 +628,9 @@ class TestRunGateCheck:
         assert result["reviewable_files"] == ["Source/MyActor.cpp"]
         assert result["skipped_count"] == 2
 
-    def test_fixture_sample_diff(self):
+    def test_fixture_sample_diff(self, sample_diff_text):
         """Integration test using the sample_diff.patch fixture."""
-        diff_text = (FIXTURES_DIR / "sample_diff.patch").read_text(encoding="utf-8")
-
-        result = run_gate_check(diff_text, self.config, labels=[])
+        result = run_gate_check(sample_diff_text, self.config, labels=[])
 
         assert result["total_changed_files"] == 10
         # Reviewable: MyActor.cpp, MyActor.h, Helper.cpp, Helper.h = 4 C++ files
@@ -589,6 +686,26 @@ class TestLoadConfig:
         assert "large_pr_labels" in config
         assert config["max_reviewable_files"] == 50
 
+    def test_repeated_loads_are_cached_copies(self):
+        first = load_config(str(CONFIG_PATH))
+        first["skip_patterns"].append("Mutated/")
+        second = load_config(str(CONFIG_PATH))
+        assert "Mutated/" not in second["skip_patterns"]
+        assert second is not first
+
+    def test_reload_after_file_changes(self, tmp_path):
+        cfg = tmp_path / "gate.yml"
+        cfg.write_text(
+            "skip_patterns: []\nmax_reviewable_files: 5\nlarge_pr_labels: []\n"
+        )
+        assert load_config(str(cfg))["max_reviewable_files"] == 5
+        cfg.write_text(
+            "skip_patterns: []\nmax_reviewable_files: 7\nlarge_pr_labels: []\n"
+        )
+        st = cfg.stat()
+        os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config(str(cfg))["max_reviewable_files"] == 7
+
     def test_missing_config_file(self):
         with pytest.raises(FileNotFoundError):
             load_config("/nonexistent/path/config.yml")
@@ -643,32 +760,22 @@ class TestCLI:
     def test_cli_with_labels(self, tmp_path):
         """Test CLI with --labels flag."""
         output_file = tmp_path / "result.json"
-        script = Path(__file__).resolve().parent.parent / "scripts" / "gate_checker.py"
         diff_file = FIXTURES_DIR / "sample_diff.patch"
 
-        import subprocess
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(script),
-                "--diff", str(diff_file),
-                "--config", str(CONFIG_PATH),
-                "--output", str(output_file),
-                "--labels", "migration",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        rc = main([
+            "--diff", str(diff_file),
+            "--config", str(CONFIG_PATH),
+            "--output", str(output_file),
+            "--labels", "migration",
+        ])
 
-        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        assert rc == 0
         data = json.loads(output_file.read_text())
         assert data["is_large_pr"] is True
 
     def test_cli_with_non_utf8_diff(self, tmp_path):
         """CLI should not crash on diff files containing non-UTF8 bytes."""
         output_file = tmp_path / "result.json"
-        script = Path(__file__).resolve().parent.parent / "scripts" / "gate_checker.py"
 
         # Create a diff with valid headers but non-UTF8 bytes in a hunk
         diff_file = tmp_path / "non_utf8.patch"
@@ -682,21 +789,22 @@ class TestCLI:
         )
         diff_file.write_bytes(header)
 
-        import subprocess
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(script),
-                "--diff", str(diff_file),
-                "--config", str(CONFIG_PATH),
-                "--output", str(output_file),
-            ],
-            capture_output=True,
-            text=True,
-        )
+        rc = main([
+            "--diff", str(diff_file),
+            "--config", str(CONFIG_PATH),
+            "--output", str(output_file),
+        ])
 
-        assert result.returncode == 0, f"CLI failed on non-UTF8: {result.stderr}"
+        assert rc == 0
         data = json.loads(output_file.read_text())
         assert data["reviewable_count"] == 1
         assert "Source/Actor.cpp" in data["reviewable_files"]
+
+    def test_cli_stdout_and_missing_diff(self, tmp_path, capsys):
+        diff_file = FIXTURES_DIR / "sample_diff.patch"
+        assert main(["--diff", str(diff_file), "--config", str(CONFIG_PATH)]) == 0
+        assert json.loads(capsys.readouterr().out)["reviewable_count"] == 4
+
+        missing = tmp_path / "missing.patch"
+        assert main(["--diff", str(missing), "--config", str(CONFIG_PATH)]) == 1
+        assert "Diff file not found" in capsys.readouterr().err
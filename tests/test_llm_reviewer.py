@@ -190,6 +190,17 @@ class TestShouldSkipFile:
     def test_intermediate(self):
         assert should_skip_file("Intermediate/Build/foo.cpp")
 
+    def test_case_insensitive(self):
+        assert should_skip_file("Source/thirdparty/lib.h")
+        assert should_skip_file("INTERMEDIATE/Build/foo.cpp")
+        assert should_skip_file("Source/MyActor.GENERATED.h")
+
+    def test_partial_component_not_skipped(self):
+        assert not should_skip_file("Source/MyThirdParty/lib.h")
+        assert not should_skip_file("Source/MyIntermediate/foo.cpp")
+        assert not should_skip_file("Source/Gen.cpp")
+        assert not should_skip_file("Source/proto/message.pb.cpp")
+
 
 class TestChunkDiff:
     """Tests for chunk_diff."""
@@ -245,6 +256,38 @@ class TestBudgetTracker:
         assert bt.total_output_tokens == 200
         assert bt.files_reviewed == 1
 
+    def test_concurrent_record_usage(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        bt = BudgetTracker(max_tokens=10_000_000, max_cost=1000.0)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: bt.record_usage(10, 1), range(1000)))
+        assert bt.total_input_tokens == 10_000
+        assert bt.files_reviewed == 1000
+
+    def test_reservation_counts_until_settled(self):
+        bt = BudgetTracker(max_tokens=10_000, max_cost=10.0)
+        assert bt.reserve(6000)
+        assert not bt.can_review_file(6000)
+        assert not bt.reserve(6000)
+        bt.settle(6000, 1000, 100)
+        assert bt.total_input_tokens == 1000
+        assert bt.total_output_tokens == 100
+        assert bt.files_reviewed == 0
+        assert bt.reserve(6000)
+        bt.settle(6000)  # failed request: release only
+        assert bt.total_input_tokens == 1000
+        assert bt.summary()["budget_remaining_tokens"] == 9000
+
+    def test_cost_accumulates_exactly(self):
+        """Many small calls sum to the exact cost, with no float drift."""
+        bt = BudgetTracker(max_tokens=10_000_000, max_cost=1000.0)
+        for _ in range(1000):
+            bt.record_chunk_usage(1, 1)
+        assert bt.total_cost_micro == 18_000
+        assert bt.total_cost == 0.018
+        assert bt.summary()["total_cost_usd"] == 0.018
+
     def test_record_skip(self):
         bt = BudgetTracker()
         bt.record_skip()
@@ -270,6 +313,13 @@ class TestBudgetTracker:
 class TestBuildSystemPrompt:
     """Tests for build_system_prompt."""
 
+    def test_memoized(self):
+        from scripts.stage3_llm_reviewer import _system_prompt_tokens
+
+        assert build_system_prompt(False) is build_system_prompt(False)
+        assert _system_prompt_tokens(False) == estimate_tokens(build_system_prompt(False))
+        assert _system_prompt_tokens(True) < _system_prompt_tokens(False)
+
     def test_with_compile_commands(self):
         prompt = build_system_prompt(has_compile_commands=True)
         assert "UE5 C++ 시니어 코드 리뷰어" in prompt
@@ -309,6 +359,15 @@ class TestBuildSystemPrompt:
 class TestBuildUserMessage:
     """Tests for build_user_message."""
 
+    def test_exact_layout(self):
+        msg = build_user_message("A.cpp", "+x", "int y;")
+        assert msg == (
+            "## 파일: `A.cpp`\n\n"
+            "### 전체 소스\n```cpp\n\nint y;\n\n```\n\n"
+            "### Diff (변경 사항)\n```diff\n\n+x\n\n```\n\n"
+            "위 diff를 코드 리뷰하고 JSON 배열로 결과를 반환하세요."
+        )
+
     def test_basic_message(self):
         msg = build_user_message("Source/MyActor.cpp", "+ auto x = 1;")
         assert "Source/MyActor.cpp" in msg
@@ -380,11 +439,85 @@ class TestParseLlmResponse:
         assert findings == []
 
 
+    def test_nested_findings_array(self):
+        response = 'Result: [[{"line": 3, "message": "x"}]]'
+        findings = parse_llm_response(response)
+        assert findings == [{"line": 3, "message": "x"}]
+
+    def test_skips_rejected_array_then_finds_next(self):
+        response = 'Lines [1, 2, [3]] then [{"line": 1, "message": "m"}]'
+        findings = parse_llm_response(response)
+        assert findings == [{"line": 1, "message": "m"}]
+
+    def test_rejected_array_not_relexed(self):
+        # Inner '[' positions of a decoded-but-rejected array are not
+        # re-decoded one by one.
+        scalars = "[" + ", ".join(["[1]"] * 500) + "]"
+        response = scalars + ' [{"line": 1, "message": "m"}]'
+        with patch.object(
+            json.JSONDecoder, "raw_decode",
+            autospec=True, side_effect=json.JSONDecoder.raw_decode,
+        ) as spy:
+            findings = parse_llm_response(response)
+        assert findings == [{"line": 1, "message": "m"}]
+        assert spy.call_count == 2
+
+class TestExtractFencedContent:
+    """Tests for _extract_fenced_content."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("no fences here", None),
+        ("```\n```", None),
+        ("```json\n[1]\n```\nafter", "[1]"),
+        ("inline ```json\n[1]\n```", None),
+        ("pre\n  ```json  \n [1]\n  ```  \npost", "[1]"),
+        ("```json\n[1]\n``` trailing\n[2]", "[1]\n``` trailing\n[2]"),
+        ("```\nno close", "no close"),
+        ("```cpp\nint x;\n```\n```json\n[]\n```", "int x;"),
+        ("```\r\n[1]\r\n```\r\n", "[1]"),
+    ])
+    def test_cases(self, text, expected):
+        from scripts.stage3_llm_reviewer import _extract_fenced_content
+        assert _extract_fenced_content(text) == expected
+
+
 # ---------------------------------------------------------------------------
 # Tests: validate_finding
 # ---------------------------------------------------------------------------
 
 
+class TestFinding:
+    """Tests for the Finding dataclass."""
+
+    def test_from_llm_and_to_dict_key_order(self):
+        from scripts.stage3_llm_reviewer import Finding
+
+        f = Finding.from_llm(
+            {"line": "7", "end_line": 9, "severity": "error",
+             "category": "gc_safety", "message": "m", "suggestion": "s"},
+            "Source/A.cpp",
+        )
+        assert f.line == 7 and f.end_line == 9
+        assert list(f.to_dict()) == [
+            "file", "line", "end_line", "severity", "category",
+            "rule_id", "message", "suggestion", "stage",
+        ]
+
+    def test_optional_fields_omitted(self):
+        from scripts.stage3_llm_reviewer import Finding
+
+        d = Finding.from_llm({"line": 1}, "a.cpp").to_dict()
+        assert "end_line" not in d
+        assert "suggestion" not in d
+        assert d["stage"] == "stage3"
+
+    def test_slots(self):
+        from scripts.stage3_llm_reviewer import Finding
+
+        f = Finding.from_llm({"line": 1}, "a.cpp")
+        assert not hasattr(f, "__dict__")
+
+
 class TestValidateFinding:
     """Tests for validate_finding."""
 
@@ -496,8 +629,8 @@ class TestExcludeFindings:
         f.write_text(json.dumps(findings))
 
         excluded = load_exclude_findings([str(f)])
-        assert ("Source/A.cpp", 10) in excluded
-        assert ("Source/A.cpp", 20) in excluded
+        assert 10 in excluded["Source/A.cpp"]
+        assert 20 in excluded["Source/A.cpp"]
 
     def test_load_missing_file(self):
         excluded = load_exclude_findings(["/nonexistent/file.json"])
@@ -510,8 +643,8 @@ class TestExcludeFindings:
         f2.write_text(json.dumps([{"file": "b.cpp", "line": 2, "rule_id": "r2"}]))
 
         excluded = load_exclude_findings([str(f1), str(f2)])
-        assert ("a.cpp", 1) in excluded
-        assert ("b.cpp", 2) in excluded
+        assert 1 in excluded["a.cpp"]
+        assert 2 in excluded["b.cpp"]
 
     def test_filter_excluded(self):
         findings = [
@@ -519,7 +652,7 @@ class TestExcludeFindings:
             {"file": "a.cpp", "line": 20, "rule_id": "r2", "message": "exclude"},
             {"file": "b.cpp", "line": 5, "rule_id": "r3", "message": "keep too"},
         ]
-        excluded = {("a.cpp", 20)}
+        excluded = {"a.cpp": {20}}
         result = filter_excluded(findings, excluded)
         assert len(result) == 2
         assert result[0]["message"] == "keep"
@@ -527,12 +660,12 @@ class TestExcludeFindings:
 
     def test_filter_empty_excluded(self):
         findings = [{"file": "a.cpp", "line": 10, "message": "keep"}]
-        result = filter_excluded(findings, set())
+        result = filter_excluded(findings, {})
         assert len(result) == 1
 
     def test_filter_all_excluded(self):
         findings = [{"file": "a.cpp", "line": 10, "rule_id": "r1"}]
-        excluded = {("a.cpp", 10)}
+        excluded = {"a.cpp": {10}}
         result = filter_excluded(findings, excluded)
         assert len(result) == 0
 
@@ -546,7 +679,7 @@ class TestExcludeFindings:
             {"file": "a.cpp", "line": 10, "category": "convention", "message": "Stage 3"},
         ]
         # Stage 1 used a different rule_id on the same line.
-        excluded = {("a.cpp", 10)}
+        excluded = {"a.cpp": {10}}
         result = filter_excluded(findings, excluded)
         assert len(result) == 0
 
@@ -555,7 +688,7 @@ class TestExcludeFindings:
         findings = [
             {"file": "a.cpp", "line": 10, "rule_id": "logtemp", "message": "dup"},
         ]
-        excluded = {("a.cpp", 10)}
+        excluded = {"a.cpp": {10}}
         result = filter_excluded(findings, excluded)
         assert len(result) == 0
 
@@ -570,14 +703,14 @@ class TestReviewFile:
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_basic_review(self, mock_api):
-        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200)
+        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200, "end_turn")
 
         budget = BudgetTracker()
         findings = review_file(
             "Source/MyActor.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
         )
 
@@ -595,7 +728,7 @@ class TestReviewFile:
             "Source/MyActor.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
         )
 
@@ -603,14 +736,14 @@ class TestReviewFile:
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_empty_response(self, mock_api):
-        mock_api.return_value = ("[]", 300, 10)
+        mock_api.return_value = ("[]", 300, 10, "end_turn")
 
         budget = BudgetTracker()
         findings = review_file(
             "Source/MyActor.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
         )
 
@@ -620,9 +753,9 @@ class TestReviewFile:
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_excludes_stage1_findings(self, mock_api):
         # LLM returns findings on lines 12 and 13
-        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200)
+        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200, "end_turn")
 
-        excluded = {("Source/MyActor.cpp", 12)}
+        excluded = {"Source/MyActor.cpp": {12}}
         budget = BudgetTracker()
         findings = review_file(
             "Source/MyActor.cpp",
@@ -645,38 +778,92 @@ class TestReviewFile:
             "Source/MyActor.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
         )
 
         assert findings == []
         assert budget.files_skipped_budget == 1
 
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_concurrent_workers_respect_budget(self, mock_api):
+        """Workers racing for a tight budget must not overshoot it."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        system_prompt = build_system_prompt(True)
+        est = estimate_tokens(system_prompt) + estimate_tokens(
+            build_user_message("Source/MyActor.cpp", SAMPLE_DIFF)
+        )
+        calls = []
+        calls_lock = threading.Lock()
+
+        def slow_api(*_args, **_kwargs):
+            with calls_lock:
+                calls.append(1)
+            time.sleep(0.05)  # keep every call in flight at once
+            return "[]", est, 10, "end_turn"
+
+        mock_api.side_effect = slow_api
+        budget = BudgetTracker(max_tokens=2 * est + est // 2, max_cost=100.0)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda _: review_file(
+                    "Source/MyActor.cpp", SAMPLE_DIFF, system_prompt, set(), budget
+                ),
+                range(8),
+            ))
+
+        assert len(calls) == 2
+        assert budget.total_input_tokens <= budget.max_tokens
+        assert budget.files_reviewed == 2
+        assert budget.files_skipped_budget == 6
+
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_json_parse_failure(self, mock_api):
-        mock_api.return_value = ("This is not valid JSON response", 500, 200)
+        mock_api.return_value = ("This is not valid JSON response", 500, 200, "end_turn")
+
+        budget = BudgetTracker()
+        findings = review_file(
+            "Source/MyActor.cpp",
+            SAMPLE_DIFF,
+            build_system_prompt(True),
+            {},
+            budget,
+        )
+
+        assert findings == []
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_precomputed_system_prompt_tokens_used(self, mock_api):
+        mock_api.return_value = ("[]", 300, 10, "end_turn")
 
         budget = BudgetTracker()
         findings = review_file(
             "Source/MyActor.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
+            system_prompt_tokens=BUDGET_PER_FILE,
         )
 
+        # The supplied count leaves no room for the diff, so nothing is sent.
         assert findings == []
+        mock_api.assert_not_called()
+        assert budget.files_skipped_budget == 1
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_with_full_source(self, mock_api):
-        mock_api.return_value = ("[]", 1000, 50)
+        mock_api.return_value = ("[]", 1000, 50, "end_turn")
 
         budget = BudgetTracker()
         findings = review_file(
             "Source/MyActor.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
             full_source="void Foo() {}",
         )
@@ -698,7 +885,7 @@ class TestReviewPr:
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_basic_pr_review(self, mock_api):
-        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200)
+        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200, "end_turn")
 
         findings, summary = review_pr(SAMPLE_DIFF)
 
@@ -707,13 +894,26 @@ class TestReviewPr:
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_multi_file_pr(self, mock_api):
-        mock_api.return_value = ("[]", 300, 50)
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
 
         findings, summary = review_pr(SAMPLE_DIFF_MULTI)
 
         # Should review MyActor.cpp and MyWidget.h, skip README.md
         assert summary["files_reviewed"] == 2
-        # README.md is not a C++ file, should not be reviewed
+        # Both small C++ files share one call; README.md is not reviewed
+        assert mock_api.call_count == 1
+        user_msg = mock_api.call_args[0][1]
+        assert "`Source/MyActor.cpp`" in user_msg
+        assert "`Source/MyWidget.h`" in user_msg
+        assert "README.md" not in user_msg
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_multi_file_pr_unbatched(self, mock_api):
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        findings, summary = review_pr(SAMPLE_DIFF_MULTI, batch_small_files=False)
+
+        assert summary["files_reviewed"] == 2
         assert mock_api.call_count == 2
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
@@ -726,7 +926,7 @@ class TestReviewPr:
              # Readme
             +New content
         """)
-        mock_api.return_value = ("[]", 100, 10)
+        mock_api.return_value = ("[]", 100, 10, "end_turn")
 
         findings, summary = review_pr(diff)
 
@@ -743,7 +943,7 @@ class TestReviewPr:
              void Foo() {}
             +void Bar() {}
         """)
-        mock_api.return_value = ("[]", 100, 10)
+        mock_api.return_value = ("[]", 100, 10, "end_turn")
 
         findings, summary = review_pr(diff)
 
@@ -758,7 +958,7 @@ class TestReviewPr:
             {"file": "Source/MyActor.cpp", "line": 99, "severity": "warning",
              "category": "conv", "message": "unique"},
         ])
-        mock_api.return_value = (response, 500, 200)
+        mock_api.return_value = (response, 500, 200, "end_turn")
 
         # Create exclude file with line 12 — should be excluded by (file, line).
         exclude_file = tmp_path / "stage1.json"
@@ -775,6 +975,37 @@ class TestReviewPr:
         assert len(findings) == 1
         assert findings[0]["line"] == 99
 
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_fully_excluded_file_not_sent(self, mock_api, tmp_path):
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        # SAMPLE_DIFF adds lines 12 and 13; both flagged by Stage 1.
+        exclude_file = tmp_path / "stage1.json"
+        exclude_file.write_text(json.dumps([
+            {"file": "Source/MyActor.cpp", "line": 12, "rule_id": "auto"},
+            {"file": "Source/MyActor.cpp", "line": 13, "rule_id": "not_op"},
+        ]))
+
+        findings, summary = review_pr(
+            SAMPLE_DIFF, exclude_files=[str(exclude_file)],
+        )
+
+        mock_api.assert_not_called()
+        assert findings == []
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_partially_excluded_file_still_sent(self, mock_api, tmp_path):
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        exclude_file = tmp_path / "stage1.json"
+        exclude_file.write_text(json.dumps([
+            {"file": "Source/MyActor.cpp", "line": 12, "rule_id": "auto"},
+        ]))
+
+        review_pr(SAMPLE_DIFF, exclude_files=[str(exclude_file)])
+
+        mock_api.assert_called_once()
+
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_empty_diff_no_api_call(self, mock_api):
         findings, summary = review_pr("")
@@ -785,7 +1016,7 @@ class TestReviewPr:
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_has_compile_commands_true(self, mock_api):
-        mock_api.return_value = ("[]", 300, 50)
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
 
         findings, summary = review_pr(
             SAMPLE_DIFF,
@@ -798,7 +1029,7 @@ class TestReviewPr:
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_has_compile_commands_false(self, mock_api):
-        mock_api.return_value = ("[]", 300, 50)
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
 
         findings, summary = review_pr(
             SAMPLE_DIFF,
@@ -815,17 +1046,17 @@ class TestReviewPr:
         # First file errors, second succeeds
         mock_api.side_effect = [
             RuntimeError("API error"),
-            ("[]", 300, 50),
+            ("[]", 300, 50, "end_turn"),
         ]
 
-        findings, summary = review_pr(SAMPLE_DIFF_MULTI)
+        findings, summary = review_pr(SAMPLE_DIFF_MULTI, batch_small_files=False)
 
         # One file errored but pipeline continues
         assert summary["files_reviewed"] == 1  # Only the second succeeded
 
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_source_dir_provides_context(self, mock_api, tmp_path):
-        mock_api.return_value = ("[]", 1000, 50)
+        mock_api.return_value = ("[]", 1000, 50, "end_turn")
 
         # Create a source file
         source = tmp_path / "Source" / "MyActor.cpp"
@@ -841,6 +1072,383 @@ class TestReviewPr:
         user_msg = call_args[0][1]
         assert "전체 소스" in user_msg
 
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_source_prefetch_missing_file(self, mock_api, tmp_path):
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        # Only MyWidget.h exists under source_dir
+        source = tmp_path / "Source" / "MyWidget.h"
+        source.parent.mkdir(parents=True)
+        source.write_text("class AMyWidget {};")
+
+        review_pr(
+            SAMPLE_DIFF_MULTI,
+            source_dir=str(tmp_path),
+            batch_small_files=False,
+        )
+
+        messages = {
+            c[0][1].split("`")[1]: c[0][1] for c in mock_api.call_args_list
+        }
+        assert "전체 소스" not in messages["Source/MyActor.cpp"]
+        assert "class AMyWidget {};" in messages["Source/MyWidget.h"]
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_large_diff_omits_full_source(self, mock_api, tmp_path):
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        source = tmp_path / "Source" / "MyActor.cpp"
+        source.parent.mkdir(parents=True)
+        source.write_text("void AMyActor::BeginPlay() {}")
+
+        review_pr(
+            SAMPLE_DIFF,
+            source_dir=str(tmp_path),
+            full_source_diff_threshold=10,
+        )
+
+        user_msg = mock_api.call_args[0][1]
+        assert "전체 소스" not in user_msg
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_concurrent_results_ordered_by_path(self, mock_api):
+        """Findings are emitted in file-path order regardless of completion order."""
+        import time as _time
+
+        def fake_api(system_prompt, user_message, **kwargs):
+            # Make the alphabetically-first file finish last.
+            if "MyActor.cpp" in user_message:
+                _time.sleep(0.05)
+                path = "Source/MyActor.cpp"
+            else:
+                path = "Source/MyWidget.h"
+            return json.dumps([{"line": 1, "message": path}]), 100, 10, "end_turn"
+
+        mock_api.side_effect = fake_api
+
+        findings, summary = review_pr(
+            SAMPLE_DIFF_MULTI, max_concurrency=4, batch_small_files=False,
+        )
+
+        assert [f["file"] for f in findings] == [
+            "Source/MyActor.cpp", "Source/MyWidget.h",
+        ]
+        assert summary["files_reviewed"] == 2
+        assert summary["total_input_tokens"] == 200
+
+    @patch("scripts.stage3_llm_reviewer.ThreadPoolExecutor")
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_no_pool_for_single_reviewable_file(self, mock_api, mock_pool):
+        """Skipped files (README.md) do not count towards the worker pool."""
+        diff = SAMPLE_DIFF + textwrap.dedent("""\
+            diff --git a/README.md b/README.md
+            --- a/README.md
+            +++ b/README.md
+            @@ -1,2 +1,3 @@
+             # Project
+            +Some text
+        """)
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        findings, summary = review_pr(diff, max_concurrency=4)
+
+        mock_pool.assert_not_called()
+        assert summary["files_reviewed"] == 1
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_sequential_when_concurrency_one(self, mock_api):
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        findings, summary = review_pr(
+            SAMPLE_DIFF_MULTI, max_concurrency=1, batch_small_files=False,
+        )
+
+        assert summary["files_reviewed"] == 2
+        assert mock_api.call_count == 2
+
+
+class TestBatchReview:
+    """Tests for packing small files into shared API calls."""
+
+    def test_pack_files_groups_small_files(self):
+        from scripts.stage3_llm_reviewer import pack_files
+
+        files = [(f"Source/F{i}.cpp", "+int x;", None) for i in range(7)]
+        groups = pack_files(files, 1000)
+        # BATCH_MAX_FILES caps each group
+        assert [len(g) for g in groups] == [5, 2]
+        assert [fp for g in groups for fp, _, _ in g] == [fp for fp, _, _ in files]
+
+    def test_pack_files_large_file_alone(self):
+        from scripts.stage3_llm_reviewer import BATCH_SMALL_FILE_TOKENS, pack_files
+
+        big = ("Source/Big.cpp", "+" + "x" * (BATCH_SMALL_FILE_TOKENS * 3 + 30), None)
+        small_a = ("Source/A.cpp", "+int a;", None)
+        small_b = ("Source/C.cpp", "+int c;", None)
+        groups = pack_files([small_a, big, small_b], 1000)
+        assert groups == [[big], [small_a, small_b]]
+
+    def test_pack_files_respects_budget(self):
+        from scripts.stage3_llm_reviewer import pack_files
+
+        files = [(f"Source/F{i}.cpp", "+" + "y" * 2400, None) for i in range(3)]
+        # ~800 tokens each; only two fit under the remaining budget.
+        groups = pack_files(files, BUDGET_PER_FILE - 1800)
+        assert [len(g) for g in groups] == [2, 1]
+
+    def test_batch_message_lists_every_file(self):
+        from scripts.stage3_llm_reviewer import build_batch_user_message
+
+        msg = build_batch_user_message([
+            ("Source/A.cpp", "+int a;", None),
+            ("Source/B.h", "+int b;", "int b;"),
+        ])
+        assert msg.index("`Source/A.cpp`") < msg.index("`Source/B.h`")
+        assert msg.count("### Diff (변경 사항)") == 2
+        assert msg.count("### 전체 소스") == 1
+        assert "---" in msg
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_findings_attributed_by_file(self, mock_api):
+        mock_api.return_value = (json.dumps([
+            {"file": "Source/MyWidget.h", "line": 6, "message": "raw ptr"},
+            {"file": "b/Source/MyActor.cpp", "line": 12, "message": "auto"},
+            {"file": "Source/Other.cpp", "line": 1, "message": "unknown"},
+        ]), 800, 100, "end_turn")
+
+        findings, summary = review_pr(SAMPLE_DIFF_MULTI)
+
+        assert mock_api.call_count == 1
+        assert [(f["file"], f["line"]) for f in findings] == [
+            ("Source/MyActor.cpp", 12),
+            ("Source/MyWidget.h", 6),
+        ]
+        assert summary["files_reviewed"] == 2
+        assert summary["total_input_tokens"] == 800
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_batch_api_error(self, mock_api):
+        mock_api.side_effect = RuntimeError("API error")
+
+        findings, summary = review_pr(SAMPLE_DIFF_MULTI)
+
+        assert findings == []
+        assert summary["files_reviewed"] == 0
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimit:
+    """Tests for the client-side RPM/TPM limiter."""
+
+    def test_bucket_blocks_until_refilled(self):
+        from scripts.utils.rate_limit import TokenBucket
+
+        clock = FakeClock()
+        bucket = TokenBucket(2, 1.0, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(1.0)
+        assert clock.now == pytest.approx(1.0)
+
+    def test_bucket_clamps_oversized_request(self):
+        from scripts.utils.rate_limit import TokenBucket
+
+        clock = FakeClock()
+        bucket = TokenBucket(10, 5.0, clock=clock, sleep=clock.sleep)
+        bucket.acquire(10)
+        # Larger than capacity: waits for a full bucket, not forever.
+        assert bucket.acquire(1000) == pytest.approx(2.0)
+
+    def test_limiter_unlimited_without_config(self):
+        from scripts.utils.rate_limit import RateLimiter
+
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        for _ in range(100):
+            limiter.acquire(100_000)
+        assert clock.sleeps == []
+
+    def test_limiter_rpm(self):
+        from scripts.utils.rate_limit import RateLimiter
+
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=60, clock=clock, sleep=clock.sleep)
+        for _ in range(60):
+            limiter.acquire(0)
+        assert clock.sleeps == []
+        limiter.acquire(0)
+        assert clock.now == pytest.approx(1.0)
+
+    def test_limiter_tuned_from_headers(self):
+        from scripts.utils.rate_limit import RateLimiter
+
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.update_from_headers({
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-input-tokens-limit": "60000",
+            "anthropic-ratelimit-input-tokens-remaining": "59000",
+            "anthropic-ratelimit-tokens-limit": "999999",
+        })
+        assert limiter.requests.capacity == 50
+        assert limiter.tokens.capacity == 60000
+        # No requests remaining: the next one waits for one refill slot.
+        limiter.acquire(0)
+        assert clock.now == pytest.approx(60 / 50)
+
+    def test_malformed_headers_ignored(self):
+        from scripts.utils.rate_limit import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.update_from_headers({"anthropic-ratelimit-requests-limit": "lots"})
+        assert limiter.requests is None
+
+    def test_call_anthropic_api_consults_limiter(self):
+        from scripts.stage3_llm_reviewer import call_anthropic_api
+
+        resp = MagicMock()
+        resp.headers = MagicMock()
+        headers = {"anthropic-ratelimit-requests-limit": "5"}
+        resp.headers.get.side_effect = headers.get
+        resp.headers.get_content_type.return_value = "application/json"
+        resp.read.return_value = json.dumps({
+            "content": [{"type": "text", "text": "[]"}],
+            "usage": {"input_tokens": 10, "output_tokens": 2},
+        }).encode()
+        resp.__enter__ = MagicMock(return_value=resp)
+        resp.__exit__ = MagicMock(return_value=False)
+        limiter = MagicMock()
+
+        with patch("scripts.stage3_llm_reviewer._post", return_value=resp):
+            result = call_anthropic_api(
+                "s" * 30, "u" * 60, api_key="test-key", rate_limiter=limiter,
+            )
+
+        assert result == ("[]", 10, 2, None)
+        limiter.acquire.assert_called_once_with(30)
+        limiter.update_from_headers.assert_called_once_with(resp.headers)
+
+
+class TestLLMCache:
+    """Tests for the on-disk LLM result cache."""
+
+    def test_key_depends_on_all_inputs(self):
+        from scripts.utils.llm_cache import cache_key
+
+        base = cache_key("sys", "user", "model")
+        assert base == cache_key("sys", "user", "model")
+        assert base != cache_key("sys2", "user", "model")
+        assert base != cache_key("sys", "user2", "model")
+        assert base != cache_key("sys", "user", "model2")
+        # The separator keeps field boundaries distinct.
+        assert cache_key("ab", "c", "m") != cache_key("a", "bc", "m")
+
+    def test_roundtrip(self, tmp_path):
+        from scripts.utils.llm_cache import LLMCache
+
+        cache = LLMCache(tmp_path)
+        assert cache.get("k") is None
+        cache.put("k", [{"line": 1, "message": "한국어"}])
+        assert cache.get("k") == [{"line": 1, "message": "한국어"}]
+        cache.close()
+
+        # Persisted across instances
+        reopened = LLMCache(tmp_path)
+        assert reopened.get("k") == [{"line": 1, "message": "한국어"}]
+        reopened.close()
+
+    def test_expired_entries_miss_and_are_pruned(self, tmp_path):
+        from scripts.utils.llm_cache import LLMCache
+
+        now = [1000.0]
+        cache = LLMCache(tmp_path, max_age=60, clock=lambda: now[0])
+        cache.put("k", [])
+        now[0] += 61
+        assert cache.get("k") is None
+        cache.close()
+
+        reopened = LLMCache(tmp_path, max_age=3600, clock=lambda: now[0])
+        assert reopened.get("k") == []  # still on disk, younger than an hour
+        reopened.close()
+        pruned = LLMCache(tmp_path, max_age=60, clock=lambda: now[0])
+        count = pruned._conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+        assert count == 0
+        pruned.close()
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_second_run_skips_api(self, mock_api, tmp_path):
+        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200, "end_turn")
+
+        first, summary1 = review_pr(SAMPLE_DIFF, cache_dir=str(tmp_path))
+        second, summary2 = review_pr(SAMPLE_DIFF, cache_dir=str(tmp_path))
+
+        mock_api.assert_called_once()
+        assert second == first
+        assert summary2["files_reviewed"] == 1
+        assert summary2["total_input_tokens"] == 0
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_cached_findings_still_filtered(self, mock_api, tmp_path):
+        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200, "end_turn")
+        review_pr(SAMPLE_DIFF, cache_dir=str(tmp_path))
+
+        exclude_file = tmp_path / "stage1.json"
+        exclude_file.write_text(json.dumps([
+            {"file": "Source/MyActor.cpp", "line": 12, "rule_id": "auto"},
+        ]))
+        findings, _ = review_pr(
+            SAMPLE_DIFF,
+            exclude_files=[str(exclude_file)],
+            cache_dir=str(tmp_path),
+        )
+
+        mock_api.assert_called_once()
+        assert [f["line"] for f in findings] == [13]
+
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_model_change_misses(self, mock_api, tmp_path):
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+
+        review_pr(SAMPLE_DIFF, cache_dir=str(tmp_path), model="model-a")
+        review_pr(SAMPLE_DIFF, cache_dir=str(tmp_path), model="model-b")
+
+        assert mock_api.call_count == 2
+
+    @pytest.mark.parametrize(
+        "response, stop_reason",
+        [
+            ("Sorry, I cannot produce JSON.", "end_turn"),
+            ('[{"line": 12, "message": "trunc', "max_tokens"),
+            ("[]", "max_tokens"),
+            ("[]", None),
+        ],
+    )
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_incomplete_or_unparsed_response_not_cached(
+        self, mock_api, tmp_path, response, stop_reason
+    ):
+        mock_api.return_value = (response, 300, 50, stop_reason)
+
+        review_pr(SAMPLE_DIFF, cache_dir=str(tmp_path))
+        review_pr(SAMPLE_DIFF, cache_dir=str(tmp_path))
+
+        assert mock_api.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Tests: CLI (main function)
@@ -911,7 +1519,7 @@ class TestCLI:
     def test_full_run_with_output(self, mock_api, tmp_path):
         from scripts.stage3_llm_reviewer import main
 
-        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200)
+        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200, "end_turn")
 
         diff_file = tmp_path / "test.diff"
         diff_file.write_text(SAMPLE_DIFF)
@@ -935,11 +1543,28 @@ class TestCLI:
         budget_file = output_file.with_suffix(".budget.json")
         assert budget_file.exists()
 
+    @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
+    def test_cache_off_by_default(self, mock_api, tmp_path):
+        from scripts.stage3_llm_reviewer import main
+
+        mock_api.return_value = ("[]", 300, 50, "end_turn")
+        diff_file = tmp_path / "test.diff"
+        diff_file.write_text(SAMPLE_DIFF)
+
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
+            for _ in range(2):
+                assert main([
+                    "--diff", str(diff_file),
+                    "--output", str(tmp_path / "out.json"),
+                ]) == 0
+
+        assert mock_api.call_count == 2
+
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_with_exclude_findings(self, mock_api, tmp_path):
         from scripts.stage3_llm_reviewer import main
 
-        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200)
+        mock_api.return_value = (SAMPLE_LLM_RESPONSE, 500, 200, "end_turn")
 
         diff_file = tmp_path / "test.diff"
         diff_file.write_text(SAMPLE_DIFF)
@@ -1090,14 +1715,14 @@ class TestNonDictElementFiltering:
             42,
             None,
         ])
-        mock_api.return_value = (response, 500, 200)
+        mock_api.return_value = (response, 500, 200, "end_turn")
 
         budget = BudgetTracker()
         findings = review_file(
             "Source/A.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
         )
 
@@ -1110,14 +1735,14 @@ class TestNonDictElementFiltering:
     def test_all_non_dict_returns_empty(self, mock_api):
         """Array of only non-dict elements should return empty list."""
         response = json.dumps(["text", 123, True, None])
-        mock_api.return_value = (response, 500, 200)
+        mock_api.return_value = (response, 500, 200, "end_turn")
 
         budget = BudgetTracker()
         findings = review_file(
             "Source/A.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
         )
 
@@ -1135,7 +1760,7 @@ class TestChunkingPerFileBudget:
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_large_full_source_dropped_when_exceeds_per_file(self, mock_api):
         """When full_source makes chunk exceed BUDGET_PER_FILE, source is dropped."""
-        mock_api.return_value = ("[]", 500, 50)
+        mock_api.return_value = ("[]", 500, 50, "end_turn")
 
         # Create a very large full_source that would blow the per-file budget
         huge_source = "int x;\n" * 30000  # ~210K chars → ~70K tokens
@@ -1147,7 +1772,7 @@ class TestChunkingPerFileBudget:
             "Source/Big.cpp",
             SAMPLE_DIFF,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
             full_source=huge_source,
         )
@@ -1224,7 +1849,7 @@ class TestWrapperOverheadAccounting:
     @patch("scripts.stage3_llm_reviewer.call_anthropic_api")
     def test_chunks_not_skipped_due_to_wrapper(self, mock_api):
         """Chunks should fit within BUDGET_PER_FILE after wrapping."""
-        mock_api.return_value = ("[]", 500, 50)
+        mock_api.return_value = ("[]", 500, 50, "end_turn")
 
         # Build a diff whose raw size is near BUDGET_PER_FILE but
         # would exceed it once wrapped without overhead accounting.
@@ -1241,7 +1866,7 @@ class TestWrapperOverheadAccounting:
             "Source/F.cpp",
             diff,
             build_system_prompt(True),
-            set(),
+            {},
             budget,
         )
 
@@ -1279,6 +1904,55 @@ class TestSplitByLinesMinToken:
         assert chunks[0] == text
 
 
+class TestChunkTiling:
+    """review_file rounds the chunk budget to CHUNK_TILE multiples."""
+
+    def test_budget_rounded_down_to_tile(self):
+        from scripts.stage3_llm_reviewer import CHUNK_TILE, _chunk_for_review
+
+        with patch(
+            "scripts.stage3_llm_reviewer.chunk_diff", return_value=["x"]
+        ) as mock_chunk:
+            _chunk_for_review("diff", 5 * CHUNK_TILE - 1)
+        assert mock_chunk.call_args[0][1] == 4 * CHUNK_TILE
+
+    def test_budget_floor_is_one_tile(self):
+        from scripts.stage3_llm_reviewer import CHUNK_TILE, _chunk_for_review
+
+        with patch(
+            "scripts.stage3_llm_reviewer.chunk_diff", return_value=["x"]
+        ) as mock_chunk:
+            _chunk_for_review("diff", 10)
+        assert mock_chunk.call_args[0][1] == CHUNK_TILE
+
+    def test_small_trailing_chunk_retried_with_grown_budget(self):
+        from scripts.stage3_llm_reviewer import (
+            CHUNK_TILE, CHUNK_TILE_STEP, _chunk_for_review,
+        )
+
+        full = "a" * (3 * 4 * CHUNK_TILE)
+        with patch(
+            "scripts.stage3_llm_reviewer.chunk_diff",
+            side_effect=[[full, "+tiny"], [full + "+tiny"]],
+        ) as mock_chunk:
+            chunks = _chunk_for_review("diff", 4 * CHUNK_TILE + CHUNK_TILE_STEP)
+        assert chunks == [full + "+tiny"]
+        assert [c[0][1] for c in mock_chunk.call_args_list] == [
+            4 * CHUNK_TILE, 4 * CHUNK_TILE + CHUNK_TILE_STEP,
+        ]
+
+    def test_no_retry_beyond_available_budget(self):
+        from scripts.stage3_llm_reviewer import CHUNK_TILE, _chunk_for_review
+
+        with patch(
+            "scripts.stage3_llm_reviewer.chunk_diff",
+            return_value=["a" * 9000, "+tiny"],
+        ) as mock_chunk:
+            chunks = _chunk_for_review("diff", 4 * CHUNK_TILE + 10)
+        assert len(chunks) == 2
+        assert mock_chunk.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # Tests: chunk skip records budget.record_skip (review comment fix)
 # ---------------------------------------------------------------------------
@@ -1291,7 +1965,7 @@ class TestChunkSkipRecording:
     @patch("scripts.stage3_llm_reviewer.BUDGET_PER_FILE", 50)
     def test_oversize_chunk_records_skip(self, mock_api):
         """When a chunk exceeds BUDGET_PER_FILE, files_skipped_budget increments."""
-        mock_api.return_value = ("[]", 10, 5)
+        mock_api.return_value = ("[]", 10, 5, "end_turn")
 
         budget = BudgetTracker(max_tokens=500_000, max_cost=10.0)
 
@@ -1304,7 +1978,7 @@ class TestChunkSkipRecording:
             "Source/Big.cpp",
             big_diff,
             "system",
-            set(),
+            {},
             budget,
         )
 
@@ -1437,7 +2111,7 @@ class TestValidateFindingFieldTypes:
         finding = {"file": ["a.cpp"], "line": 10, "message": "x", "category": "general"}
         result = validate_finding(finding, "b.cpp")
         # Must not raise unhashable type error
-        excluded = {("b.cpp", 10)}
+        excluded = {"b.cpp": {10}}
         filtered = filter_excluded([result], excluded)
         assert len(filtered) == 0
 
@@ -1461,8 +2135,8 @@ class TestLoadExcludeFindingsNonDict:
         f = tmp_path / "exclude.json"
         f.write_text(json.dumps(data))
         result = load_exclude_findings([str(f)])
-        assert ("a.cpp", 10) in result
-        assert ("b.cpp", 20) in result
+        assert 10 in result["a.cpp"]
+        assert 20 in result["b.cpp"]
         assert len(result) == 2  # non-dict elements skipped
 
     def test_all_non_dict_elements(self, tmp_path):
@@ -1541,7 +2215,7 @@ class TestApiResponseJsonParseError:
         mock_resp.__enter__ = MagicMock(return_value=mock_resp)
         mock_resp.__exit__ = MagicMock(return_value=False)
 
-        with patch("urllib.request.urlopen", return_value=mock_resp):
+        with patch("scripts.stage3_llm_reviewer._post", return_value=mock_resp):
             import pytest
             with pytest.raises(RuntimeError, match="non-JSON response"):
                 call_anthropic_api(
@@ -1550,6 +2224,199 @@ class TestApiResponseJsonParseError:
                 )
 
 
+class TestApiStreaming:
+    """call_anthropic_api consumes the SSE stream into the same tuple."""
+
+    @staticmethod
+    def _stream_response(events):
+        lines = []
+        for event in events:
+            lines.append(f"event: {event['type']}\n".encode())
+            lines.append(f"data: {json.dumps(event)}\n".encode())
+            lines.append(b"\n")
+        resp = MagicMock()
+        resp.headers.get_content_type.return_value = "text/event-stream"
+        resp.__iter__.return_value = iter(lines)
+        resp.__enter__ = MagicMock(return_value=resp)
+        resp.__exit__ = MagicMock(return_value=False)
+        return resp
+
+    def test_text_and_usage_from_stream(self):
+        from scripts.stage3_llm_reviewer import call_anthropic_api
+
+        resp = self._stream_response([
+            {"type": "message_start",
+             "message": {"usage": {"input_tokens": 321, "output_tokens": 1}}},
+            {"type": "content_block_start", "index": 0,
+             "content_block": {"type": "text", "text": ""}},
+            {"type": "ping"},
+            {"type": "content_block_delta", "index": 0,
+             "delta": {"type": "text_delta", "text": "[{\"line\": 1, "}},
+            {"type": "content_block_delta", "index": 0,
+             "delta": {"type": "text_delta", "text": "\"message\": \"한\"}]"}},
+            {"type": "content_block_stop", "index": 0},
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+             "usage": {"output_tokens": 42}},
+            {"type": "message_stop"},
+        ])
+
+        with patch("scripts.stage3_llm_reviewer._post", return_value=resp) as mock_open:
+            text, input_tokens, output_tokens, stop_reason = call_anthropic_api(
+                "system", "user", api_key="test-key",
+            )
+
+        assert text == '[{"line": 1, "message": "한"}]'
+        assert (input_tokens, output_tokens) == (321, 42)
+        assert stop_reason == "end_turn"
+        sent = json.loads(mock_open.call_args[0][1])
+        assert sent["stream"] is True
+
+    def test_stream_error_event_raises(self):
+        from scripts.stage3_llm_reviewer import call_anthropic_api
+
+        resp = self._stream_response([
+            {"type": "message_start", "message": {"usage": {"input_tokens": 1}}},
+            {"type": "error",
+             "error": {"type": "invalid_request_error", "message": "Bad"}},
+        ])
+
+        with patch("scripts.stage3_llm_reviewer._post", return_value=resp) as mock_post:
+            with pytest.raises(RuntimeError, match="stream error"):
+                call_anthropic_api("system", "user", api_key="test-key")
+        assert mock_post.call_count == 1
+
+    @pytest.mark.parametrize("error_type", ["overloaded_error", "api_error"])
+    def test_transient_stream_error_retried(self, error_type):
+        from scripts.stage3_llm_reviewer import call_anthropic_api
+
+        failing = self._stream_response([
+            {"type": "message_start", "message": {"usage": {"input_tokens": 1}}},
+            {"type": "error", "error": {"type": error_type, "message": "x"}},
+        ])
+        ok = self._stream_response([
+            {"type": "message_start", "message": {"usage": {"input_tokens": 5}}},
+            {"type": "content_block_delta", "index": 0,
+             "delta": {"type": "text_delta", "text": "[]"}},
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+             "usage": {"output_tokens": 2}},
+        ])
+
+        with patch("scripts.stage3_llm_reviewer._post", side_effect=[failing, ok]):
+            with patch("scripts.stage3_llm_reviewer.time.sleep") as mock_sleep:
+                result = call_anthropic_api("system", "user", api_key="test-key")
+
+        assert result == ("[]", 5, 2, "end_turn")
+        mock_sleep.assert_called_once()
+
+    def test_transient_stream_error_gives_up_after_retries(self):
+        from scripts.stage3_llm_reviewer import MAX_RETRIES, call_anthropic_api
+
+        responses = [
+            self._stream_response([
+                {"type": "error", "error": {"type": "overloaded_error"}},
+            ])
+            for _ in range(MAX_RETRIES + 1)
+        ]
+        with patch("scripts.stage3_llm_reviewer._post", side_effect=responses):
+            with patch("scripts.stage3_llm_reviewer.time.sleep"):
+                with pytest.raises(RuntimeError, match="after"):
+                    call_anthropic_api("system", "user", api_key="test-key")
+
+
+class TestConnectionReuse:
+    """call_anthropic_api keeps one HTTP connection alive per thread."""
+
+    @pytest.fixture
+    def server(self):
+        import http.server
+        import threading
+
+        connections: List[Any] = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                connections.append(self.client_address)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path.endswith("/fail"):
+                    body = b'{"error": "bad"}'
+                    self.send_response(400)
+                else:
+                    body = json.dumps({
+                        "content": [{"type": "text", "text": "[]"}],
+                        "usage": {"input_tokens": 7, "output_tokens": 3},
+                    }).encode()
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", connections
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_sequential_calls_share_connection(self, server):
+        from scripts.stage3_llm_reviewer import call_anthropic_api
+
+        url, connections = server
+        for _ in range(3):
+            result = call_anthropic_api(
+                "system", "user", api_key="test-key", api_url=url,
+            )
+            assert result == ("[]", 7, 3, None)
+        assert len(connections) == 1
+
+    def test_client_error_keeps_pool_usable(self, server):
+        from scripts.stage3_llm_reviewer import _post
+
+        url, connections = server
+        with pytest.raises(Exception) as exc_info:
+            with _post(f"{url}/fail", b"{}", {"Content-Type": "application/json"}):
+                pass
+        assert exc_info.value.code == 400
+        with _post(f"{url}/ok", b"{}", {"Content-Type": "application/json"}) as resp:
+            assert resp.status == 200
+            resp.read()
+        assert len(connections) == 1
+
+    def test_stale_connection_resent_only_if_send_failed(self):
+        from scripts import stage3_llm_reviewer as mod
+
+        stale = MagicMock(sock=object())
+        stale.request.side_effect = BrokenPipeError()
+        fresh = MagicMock(sock=None)
+        fresh.getresponse.return_value = MagicMock(status=200)
+        with patch.object(mod, "_get_connection", side_effect=[stale, fresh]):
+            with mod._post("http://h/v1", b"{}", {}) as resp:
+                assert resp is fresh.getresponse.return_value
+        fresh.request.assert_called_once()
+
+    def test_no_resend_after_request_was_sent(self):
+        """A failure awaiting the response must not POST the request again."""
+        import http.client
+        from scripts import stage3_llm_reviewer as mod
+
+        conn = MagicMock(sock=object())
+        conn.getresponse.side_effect = http.client.RemoteDisconnected()
+        with patch.object(mod, "_get_connection", side_effect=[conn]) as get_conn:
+            with pytest.raises(http.client.RemoteDisconnected):
+                with mod._post("http://h/v1", b"{}", {}):
+                    pass
+        get_conn.assert_called_once()
+        conn.request.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Tests: empty file field fallback (review comment fix)
 # ---------------------------------------------------------------------------
@@ -1668,10 +2535,11 @@ class TestReviewFileChunkedBudget:
             '[{"file":"f.cpp","line":1,"message":"issue"}]',
             500,   # input tokens (small so PR budget is not hit)
             100,
+            "end_turn",
         )
         with patch("scripts.stage3_llm_reviewer.call_anthropic_api", return_value=api_resp):
             review_file(
-                "f.cpp", diff, "system prompt", set(), budget,
+                "f.cpp", diff, "system prompt", {}, budget,
                 model="test", api_key="k",
             )
         assert budget.files_reviewed == 1
@@ -1693,11 +2561,11 @@ class TestReviewFileChunkedBudget:
             nonlocal call_count
             call_count += 1
             # Return high actual_input to quickly hit per-file limit
-            return ('[]', 15000, 100)
+            return ('[]', 15000, 100, "end_turn")
 
         with patch("scripts.stage3_llm_reviewer.call_anthropic_api", side_effect=mock_api):
             review_file(
-                "big.cpp", diff, "sys", set(), budget,
+                "big.cpp", diff, "sys", {}, budget,
                 model="test", api_key="k",
             )
 
@@ -1758,7 +2626,7 @@ class TestLoadExcludeFindingsFileType:
         f = tmp_path / "exclude.json"
         f.write_text(json.dumps(data))
         result = load_exclude_findings([str(f)])
-        assert ("b.cpp", 20) in result
+        assert 20 in result["b.cpp"]
         assert len(result) == 1
 
     def test_file_as_dict_skipped(self, tmp_path):
@@ -1827,7 +2695,7 @@ class TestFileSkipCounting:
             # Use a very small BUDGET_PER_FILE to force skipping
             with patch("scripts.stage3_llm_reviewer.BUDGET_PER_FILE", 50):
                 review_file(
-                    "big.cpp", diff, "sys" * 100, set(), budget,
+                    "big.cpp", diff, "sys" * 100, {}, budget,
                     model="test", api_key="k",
                 )
         # Should count as at most 1 file skip, not one per chunk
@@ -1842,10 +2710,10 @@ class TestFileSkipCounting:
         budget = BudgetTracker(max_tokens=1_000_000, max_cost=100.0)
         diff = "@@ -1,3 +1,200 @@\n" + "\n".join(f"+line {i}" for i in range(200))
 
-        api_resp = ('[]', 500, 100)
+        api_resp = ('[]', 500, 100, "end_turn")
         with patch("scripts.stage3_llm_reviewer.call_anthropic_api", return_value=api_resp):
             review_file(
-                "f.cpp", diff, "system prompt", set(), budget,
+                "f.cpp", diff, "system prompt", {}, budget,
                 model="test", api_key="k",
             )
         assert budget.files_skipped_budget == 0
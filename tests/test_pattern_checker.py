@@ -10,6 +10,7 @@ Test cases from STEP3_STAGE1.md:
 from __future__ import annotations
 
 import os
+import re
 import sys
 import textwrap
 from pathlib import Path
@@ -25,6 +26,7 @@ from scripts.stage1_pattern_checker import (
     get_diff_from_git,
     load_tier1_patterns,
     _generate_suggestion,
+    _required_literal,
     _split_code_comment,
     _strip_comments,
 )
@@ -244,6 +246,64 @@ class TestDiffParser:
         assert 1 in actor_cpp.added_lines
         assert '#include "MyActor.h"' in actor_cpp.added_lines[1]
 
+    def test_hunk_end_lines(self):
+        """Hunk end is the last new-file line; deletion-only hunks end at start."""
+        diff = textwrap.dedent("""\
+            diff --git a/Source/Foo.cpp b/Source/Foo.cpp
+            --- a/Source/Foo.cpp
+            +++ b/Source/Foo.cpp
+            @@ -10,3 +10,4 @@
+             ctx
+            -old
+            +new1
+            +new2
+             ctx
+            @@ -40,2 +41,0 @@
+            -gone1
+            -gone2
+        """)
+        hunks = parse_diff(diff)["Source/Foo.cpp"].hunks
+        assert [(h["start"], h["end"]) for h in hunks] == [(10, 13), (41, 41)]
+
+    def test_form_feed_does_not_split_line(self):
+        """Only newlines end a diff line; a form feed stays in the content."""
+        diff = (
+            "diff --git a/Source/Foo.cpp b/Source/Foo.cpp\n"
+            "--- a/Source/Foo.cpp\n"
+            "+++ b/Source/Foo.cpp\n"
+            "@@ -1,0 +1,2 @@\n"
+            "+// page\x0cbreak\n"
+            "+int x;"
+        )
+        fd = parse_diff(diff)["Source/Foo.cpp"]
+        assert fd.added_lines == {1: "// page\x0cbreak", 2: "int x;"}
+
+    def test_crlf_line_endings_stripped(self):
+        diff = (
+            "diff --git a/Source/Foo.cpp b/Source/Foo.cpp\r\n"
+            "--- a/Source/Foo.cpp\r\n"
+            "+++ b/Source/Foo.cpp\r\n"
+            "@@ -1,1 +1,2 @@\r\n"
+            " ctx\r\n"
+            "+int x;\r\n"
+        )
+        fd = parse_diff(diff)["Source/Foo.cpp"]
+        assert fd.added_lines == {2: "int x;"}
+        assert fd.context_lines == {1: "ctx"}
+
+    def test_quoted_path_octal_escapes_decoded(self):
+        """Octal UTF-8 escapes mixed with plain text decode to one path."""
+        diff = (
+            'diff --git "a/Source/\\355\\225\\234x\\352\\270\\200.cpp" '
+            '"b/Source/\\355\\225\\234x\\352\\270\\200.cpp"\n'
+            '--- "a/Source/\\355\\225\\234x\\352\\270\\200.cpp"\n'
+            '+++ "b/Source/\\355\\225\\234x\\352\\270\\200.cpp"\n'
+            "@@ -1,0 +1,1 @@\n"
+            "+int x;\n"
+        )
+        result = parse_diff(diff)
+        assert list(result) == ["Source/\ud55cx\uae00.cpp"]
+
 
 # ============================================================================
 # Pattern loading tests
@@ -290,6 +350,77 @@ class TestPatternLoading:
 # ============================================================================
 
 
+class TestRequiredLiteral:
+    """Tests for the substring pre-filter extracted from each pattern."""
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            (r"\bLogTemp\b", "LogTemp"),
+            (r"#\s*pragma\s+optimize\s*\(", "optimize"),
+            (r"\bLog\.Temp\b", "Log.Temp"),
+            (r"ab?c", "a"),
+            (r"abc*?d", "ab"),
+            (r"foo+bar", "foo"),
+            (r"x{2}yz", "yz"),
+            (r"[abc]def", "def"),
+            (r"(UCLASS|USTRUCT)\s*\(", "("),
+        ],
+    )
+    def test_extracts_longest_required_run(self, pattern, expected):
+        assert _required_literal(re.compile(pattern)) == expected
+
+    @pytest.mark.parametrize(
+        "pattern, flags",
+        [
+            (r"foo|bar", 0),
+            (r"(?i)LogTemp", 0),
+            (r"LogTemp", re.IGNORECASE),
+            (r"\b(LoadObject|LoadClass)\s*[<(]", 0),
+        ],
+    )
+    def test_no_gate_when_literal_not_guaranteed(self, pattern, flags):
+        assert _required_literal(re.compile(pattern, flags)) is None
+
+    @pytest.mark.parametrize(
+        "pattern, text",
+        [
+            (r"\x41BC", "ABC"),
+            (r"\101BC", "ABC"),
+            (r"\0BC", "\0BC"),
+            (r"\u0041BC", "ABC"),
+            (r"\U00000041BC", "ABC"),
+            (r"\N{LATIN CAPITAL LETTER A}BC", "ABC"),
+            (r"(A)\1BC", "AABC"),
+        ],
+    )
+    def test_multi_char_escape_breaks_run(self, pattern, text):
+        """Escape digits/names must not leak into the required literal."""
+        compiled = re.compile(pattern)
+        assert compiled.search(text)
+        assert _required_literal(compiled) == "BC"
+
+    def test_required_literal_present_in_every_match(self, patterns):
+        """Gate must never hide a real match on the sample fixtures."""
+        for name in ("sample_bad.cpp", "sample_good.cpp", "sample_network.cpp"):
+            text = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+            for line in text.splitlines():
+                for pat in patterns:
+                    if pat["required"] and pat["compiled"].search(line):
+                        assert pat["required"] in line, (pat["id"], line)
+
+    def test_check_line_without_required_key(self):
+        """Hand-built pattern dicts lacking "required" still match."""
+        pat = {
+            "id": "custom",
+            "compiled": re.compile(r"\bFoo\b"),
+            "prev_compiled": None,
+            "severity": "warning",
+            "summary": "",
+        }
+        assert [f["rule_id"] for f in check_line("Foo();", [pat])] == ["custom"]
+
+
 class TestLogTemp:
     """Tests for logtemp pattern."""
 
@@ -1019,6 +1150,13 @@ class TestCommentHandling:
         assert "http://x.com" in result
         assert "// note" not in result
 
+    def test_strip_tab_indented_comment(self):
+        """Mixed tab/space indentation before // is still a comment line."""
+        assert _strip_comments("\t  \t// comment") == ""
+
+    def test_whitespace_only_line_not_matched(self, patterns):
+        assert check_line(" \t ", patterns) == []
+
 
 # ============================================================================
 # Suggestion generation tests
@@ -1142,6 +1280,13 @@ class TestSuggestionGeneration:
         suggestion = _generate_suggestion("logtemp", "UE_LOG(LogTemp, ...)")
         assert suggestion is None
 
+    def test_presplit_line_matches_default(self):
+        """A precomputed (code, comment) split gives the same suggestion."""
+        line = "\tcheck(IsValid(this)) // reason"
+        assert _generate_suggestion(
+            "macro_no_semicolon", line, _split_code_comment(line)
+        ) == _generate_suggestion("macro_no_semicolon", line)
+
 
 # ============================================================================
 # Edge case tests
@@ -1177,6 +1322,44 @@ class TestEdgeCases:
         findings = check_diff(diff_data, patterns)
         assert findings == []
 
+    def test_parallel_matches_serial_on_many_files(self, patterns):
+        """Process-pool path must produce identical, ordered findings."""
+        parts = []
+        for i in range(12):
+            parts.append(
+                f"diff --git a/Source/F{i:02d}.cpp b/Source/F{i:02d}.cpp\n"
+                "new file mode 100644\n"
+                "--- /dev/null\n"
+                f"+++ b/Source/F{i:02d}.cpp\n"
+                "@@ -0,0 +1,2 @@\n"
+                "+\tUE_LOG(LogTemp, Log, TEXT(\"x\"));\n"
+                "+\tGENERATED_BODY();\n"
+            )
+        diff_data = parse_diff("".join(parts))
+        serial = check_diff(diff_data, patterns, max_workers=1)
+        parallel = check_diff(diff_data, patterns, max_workers=2)
+        assert parallel == serial
+        assert [f["file"] for f in serial] == sorted(f["file"] for f in serial)
+        assert len({f["file"] for f in serial}) == 12
+
+    def test_serial_by_default(self, patterns, monkeypatch):
+        """Without max_workers, even many-file diffs never start a pool."""
+        import scripts.stage1_pattern_checker as mod
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(mod, "ProcessPoolExecutor", no_pool)
+        diff_data = parse_diff("".join(
+            f"diff --git a/Source/F{i:02d}.cpp b/Source/F{i:02d}.cpp\n"
+            f"--- a/Source/F{i:02d}.cpp\n"
+            f"+++ b/Source/F{i:02d}.cpp\n"
+            "@@ -1,0 +1,1 @@\n"
+            "+\tUE_LOG(LogTemp, Log, TEXT(\"x\"));\n"
+            for i in range(20)
+        ))
+        assert len(check_diff(diff_data, patterns)) == 20
+
     def test_multiple_violations_on_same_line(self, patterns):
         """A line with LogTemp AND missing semicolon should trigger both."""
         line = '\tUE_LOG(LogTemp, Log, TEXT("test"))'
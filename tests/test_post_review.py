@@ -1336,8 +1336,8 @@ class TestGitHubClient:
         client = GitHubClient(token="test-token")
         items = [{"id": i} for i in range(10)]
 
-        with patch.object(client, "_request") as mock_req:
-            mock_req.return_value = items
+        with patch.object(client, "_request_with_headers") as mock_req:
+            mock_req.return_value = (items, {})
             result = client._get_all_pages("/test/path", per_page=100)
             assert len(result) == 10
             mock_req.assert_called_once_with(
@@ -1350,8 +1350,8 @@ class TestGitHubClient:
         page1 = [{"id": i} for i in range(100)]
         page2 = [{"id": i} for i in range(100, 130)]
 
-        with patch.object(client, "_request") as mock_req:
-            mock_req.side_effect = [page1, page2]
+        with patch.object(client, "_request_with_headers") as mock_req:
+            mock_req.side_effect = [(page1, {}), (page2, {})]
             result = client._get_all_pages("/test/path", per_page=100)
             assert len(result) == 130
             assert mock_req.call_count == 2
@@ -1362,24 +1362,56 @@ class TestGitHubClient:
         """Empty first page returns empty list."""
         client = GitHubClient(token="test-token")
 
-        with patch.object(client, "_request") as mock_req:
-            mock_req.return_value = []
+        with patch.object(client, "_request_with_headers") as mock_req:
+            mock_req.return_value = ([], {})
             result = client._get_all_pages("/test/path")
             assert result == []
             mock_req.assert_called_once()
 
     def test_get_all_pages_exact_page_boundary(self):
-        """When a page has exactly per_page items, fetch one more to confirm end."""
+        """Without a Link header, a full page triggers one more fetch to confirm end."""
         client = GitHubClient(token="test-token")
         page1 = [{"id": i} for i in range(100)]
         page2: list = []
 
-        with patch.object(client, "_request") as mock_req:
-            mock_req.side_effect = [page1, page2]
+        with patch.object(client, "_request_with_headers") as mock_req:
+            mock_req.side_effect = [(page1, {}), (page2, {})]
             result = client._get_all_pages("/test/path", per_page=100)
             assert len(result) == 100
             assert mock_req.call_count == 2
 
+    def test_get_all_pages_follows_link_header(self):
+        """rel="next" links are followed; the last page needs no extra fetch."""
+        client = GitHubClient(
+            token="test-token", api_url="https://github.company.com/api/v3"
+        )
+        page1 = [{"id": i} for i in range(100)]
+        page2 = [{"id": i} for i in range(100, 200)]
+        next_link = (
+            '<https://github.company.com/api/v3/repositories/7/pulls/1/comments'
+            '?per_page=100&page=2>; rel="next", '
+            '<https://github.company.com/api/v3/repositories/7/pulls/1/comments'
+            '?per_page=100&page=2>; rel="last"'
+        )
+        last_link = (
+            '<https://github.company.com/api/v3/repositories/7/pulls/1/comments'
+            '?per_page=100&page=1>; rel="prev", '
+            '<https://github.company.com/api/v3/repositories/7/pulls/1/comments'
+            '?per_page=100&page=1>; rel="first"'
+        )
+
+        with patch.object(client, "_request_with_headers") as mock_req:
+            mock_req.side_effect = [
+                (page1, {"Link": next_link}),
+                (page2, {"Link": last_link}),
+            ]
+            result = client._get_all_pages("/test/path", per_page=100)
+            assert len(result) == 200
+            assert mock_req.call_count == 2
+            mock_req.assert_any_call(
+                "GET", "/repositories/7/pulls/1/comments?per_page=100&page=2"
+            )
+
     def test_get_pull_request_path(self):
         client = GitHubClient(token="test-token")
 
@@ -1392,6 +1424,164 @@ class TestGitHubClient:
             assert result["head"]["sha"] == "abc"
 
 
+@pytest.fixture
+def gh_server():
+    """Local HTTP/1.1 server standing in for the GitHub REST API.
+
+    Yields ``(api_url, state)``.  ``state["routes"]`` maps a request path
+    (including query) to ``(status, headers, body)``; unknown paths get a
+    404.  ``state["connections"]`` records each accepted connection,
+    ``state["requests"]`` each ``(method, path)`` and ``state["bodies"]``
+    each raw request body.
+    """
+    import http.server
+    import threading
+
+    state: Dict[str, Any] = {
+        "routes": {}, "connections": [], "requests": [], "bodies": [],
+    }
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            state["connections"].append(self.client_address)
+
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            state["bodies"].append(self.rfile.read(length) if length else b"")
+            state["requests"].append((self.command, self.path))
+            status, headers, body = state["routes"].get(
+                self.path, (404, {}, {"message": "Not Found"})
+            )
+            raw = json.dumps(body).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        do_GET = _respond
+        do_POST = _respond
+
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/api/v3", state
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestGitHubClientTransport:
+    """GitHubClient talks HTTP over one keep-alive connection."""
+
+    def test_requests_share_connection(self, gh_server):
+        url, state = gh_server
+        state["routes"]["/api/v3/repos/org/repo/pulls/1"] = (
+            200, {}, {"head": {"sha": "abc"}},
+        )
+        client = GitHubClient(token="test-token", api_url=url)
+        for _ in range(3):
+            assert client.get_pull_request("org", "repo", 1) == {
+                "head": {"sha": "abc"}
+            }
+        client.close()
+        assert len(state["connections"]) == 1
+        assert state["requests"] == [("GET", "/api/v3/repos/org/repo/pulls/1")] * 3
+
+    def test_client_error_raises_and_keeps_connection(self, gh_server):
+        url, state = gh_server
+        state["routes"]["/api/v3/repos/org/repo/pulls/2"] = (200, {}, {"number": 2})
+        client = GitHubClient(token="test-token", api_url=url)
+        with pytest.raises(RuntimeError, match="GitHub API error 404.*Not Found"):
+            client.get_pull_request("org", "repo", 1)
+        assert client.get_pull_request("org", "repo", 2) == {"number": 2}
+        client.close()
+        assert len(state["connections"]) == 1
+
+    def test_review_comments_paginate_over_link_header(self, gh_server):
+        url, state = gh_server
+        base = "/api/v3/repos/org/repo/pulls/3/comments"
+        state["routes"][f"{base}?per_page=100&page=1"] = (
+            200,
+            {"Link": f'<{url}/repos/org/repo/pulls/3/comments'
+                     f'?per_page=100&page=2>; rel="next"'},
+            [{"id": i} for i in range(100)],
+        )
+        state["routes"][f"{base}?per_page=100&page=2"] = (
+            200,
+            {"Link": f'<{url}/repos/org/repo/pulls/3/comments'
+                     f'?per_page=100&page=1>; rel="first"'},
+            [{"id": 100}],
+        )
+        client = GitHubClient(token="test-token", api_url=url)
+        comments = client.get_existing_review_comments("org", "repo", 3)
+        client.close()
+        assert [c["id"] for c in comments] == list(range(101))
+        assert len(state["requests"]) == 2
+
+    def test_post_body_is_utf8_json(self, gh_server):
+        url, state = gh_server
+        state["routes"]["/api/v3/repos/org/repo/pulls/4/reviews"] = (
+            200, {}, {"id": 99},
+        )
+        client = GitHubClient(token="test-token", api_url=url)
+        comments = [{"path": "A.cpp", "line": 1, "body": "한글 \"quoted\""}]
+        resp = client.create_review("org", "repo", 4, "sha", "요약", comments)
+        client.close()
+        assert resp == {"id": 99}
+        assert json.loads(state["bodies"][0].decode("utf-8")) == {
+            "commit_id": "sha",
+            "body": "요약",
+            "event": "COMMENT",
+            "comments": comments,
+        }
+
+    def test_reconnects_after_server_closes(self, gh_server):
+        url, state = gh_server
+        state["routes"]["/api/v3/repos/org/repo/pulls/1"] = (
+            200, {"Connection": "close"}, {"number": 1},
+        )
+        client = GitHubClient(token="test-token", api_url=url)
+        assert client.get_pull_request("org", "repo", 1) == {"number": 1}
+        assert client.get_pull_request("org", "repo", 1) == {"number": 1}
+        client.close()
+        assert len(state["connections"]) == 2
+
+    def test_stale_connection_resent_when_send_fails(self, gh_server):
+        url, state = gh_server
+        state["routes"]["/api/v3/repos/org/repo/pulls/1"] = (200, {}, {"number": 1})
+        client = GitHubClient(token="test-token", api_url=url)
+        client._conn = MagicMock(sock=object())
+        client._conn.request.side_effect = BrokenPipeError()
+        assert client.get_pull_request("org", "repo", 1) == {"number": 1}
+        client.close()
+        assert state["requests"] == [("GET", "/api/v3/repos/org/repo/pulls/1")]
+
+    def test_no_resend_after_request_was_sent(self, gh_server):
+        """A POST whose response never arrived must not be sent again."""
+        import http.client
+
+        url, state = gh_server
+        client = GitHubClient(token="test-token", api_url=url)
+        stale = MagicMock(sock=object())
+        stale.getresponse.side_effect = http.client.RemoteDisconnected()
+        client._conn = stale
+        with pytest.raises(http.client.RemoteDisconnected):
+            client._send("POST", "/repos/org/repo/pulls/1/reviews", b"{}", {})
+        stale.request.assert_called_once()
+        assert client._conn is None
+        assert state["requests"] == []
+
+
 # ---------------------------------------------------------------------------
 # CLI dry-run test
 # ---------------------------------------------------------------------------
@@ -25,8 +25,10 @@ from scripts.stage2_tidy_to_suggestions import (
     convert_diagnostics,
     deduplicate,
     parse_tidy_fixes,
+    _apply_replacements,
     _collect_source_contents,
     _extract_suggestion_span,
+    _newline_offsets,
     _offset_to_line,
     _read_source,
     _resolve_path,
@@ -481,6 +483,57 @@ class TestHelpers:
     def test_offset_to_line_third_line(self):
         assert _offset_to_line("line1\nline2\nline3\n", 12) == 3
 
+    def test_offset_to_line_with_newline_index(self):
+        """Binary search over cached newline offsets matches the scan."""
+        content = "a\n한글\n\nlast"
+        newlines = _newline_offsets(content.encode("utf-8"))
+        raw_len = len(content.encode("utf-8"))
+        for offset in range(raw_len + 3):
+            assert _offset_to_line(content, offset, newlines) == _offset_to_line(
+                content, offset
+            )
+
+    def test_apply_replacements_with_preencoded_bytes(self):
+        content = "// 한글\nvoid Foo();\n"
+        raw = content.encode("utf-8")
+        repl = [{
+            "FilePath": "/p/A.cpp",
+            "Offset": raw.index(b")") + 1,
+            "Length": 0,
+            "ReplacementText": " override",
+        }]
+        expected = _apply_replacements(content, repl, "/p/A.cpp")
+        assert expected == "// 한글\nvoid Foo() override;\n"
+        assert _apply_replacements(content, repl, "/p/A.cpp", raw) == expected
+
+    def test_json_io_matches_stdlib_format(self):
+        """Findings JSON must be byte-identical whichever backend is used."""
+        from scripts.utils import json_io
+
+        findings = [
+            {
+                "file": "Source/A.cpp",
+                "line": 3,
+                "rule_id": "override_keyword",
+                "severity": "warning",
+                "message": "한글 메시지 \"quoted\" \\ path",
+                "suggestion": None,
+                "end_line": 4,
+            }
+        ]
+        text = json_io.dumps_pretty(findings)
+        assert text == json.dumps(findings, ensure_ascii=False, indent=2)
+        assert json_io.loads(text.encode("utf-8")) == findings
+        assert json_io.loads(text) == findings
+
+    def test_json_io_falls_back_for_objects_orjson_rejects(self):
+        from scripts.utils import json_io
+
+        obj = {1: "int key", "big": 2**70}
+        assert json_io.dumps_pretty(obj) == json.dumps(
+            obj, ensure_ascii=False, indent=2
+        )
+
     def test_resolve_path_relative(self):
         # Already relative paths should be returned as-is or simplified
         result = _resolve_path("Source/MyActor.cpp")
@@ -1229,6 +1282,16 @@ class TestExtractSuggestionSpan:
         assert end is None
         assert suggestion == "NEW\nX"
 
+    def test_presplit_original_lines_match_default(self):
+        """Passing a cached original split yields the same span."""
+        original = "line1\nold_a\nold_b\nline4\n"
+        modified = "line1\nnew_single\nline4\n"
+        expected = _extract_suggestion_span(original, modified)
+        cached = _extract_suggestion_span(
+            original, modified, original.splitlines()
+        )
+        assert cached == expected == ("new_single", 2, 3)
+
 
 # ---------------------------------------------------------------------------
 # path_map integration tests